@@ -1,9 +1,39 @@
+import time
+
+# Started before the remaining imports so cold-start import time is counted
+_script_started = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
-import joblib
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import functools
+import importlib
 import json
-import plotly.graph_objects as go
+import os
+import tempfile
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import predictor
+from batching import MicroBatcher
+from bulk import score_csv_in_chunks
+from charts import (build_history_chart, build_sensitivity_chart, build_team_distribution_chart,
+                    create_gauge_chart, frozen_gauge_chart)
+from cohort_cube import DIMENSIONS, load_cohort_cube, refresh_cohort_cube
+from encoder import FeatureEncoder
+from features import SEASON_BY_MONTH
+from fields import NUMERIC_RANGES, OPTIONS, widget_options, widget_range
+from history import HistoryStore
+from model_selection import load_report
+from percentiles import load_population_index
+from reruns import RerunStats
+from respondents import RespondentIndex, load_respondent_index, lookup_respondent, refresh_respondent_index
+from sensitivity import ranked_levers, sweep_levers
+from score_cache import DEFAULT_MAXSIZE
+from scoring import SCORE_CATEGORIES, load_scoring_spec
+from team import read_roster, score_roster, summarize_team
+from tracing import MetricsFileExporter, span, tracer
+from validation import ValidationReport
 
 # Suppress sklearn version warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
@@ -16,6 +46,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+tracer.start_trace().started = _script_started
+
 # Custom CSS for professional styling
 st.markdown("""
 <style>
@@ -439,59 +471,270 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load model and selected features
-@st.cache_data
-def load_model_and_features():
-    model = joblib.load("model.pkl")
-    with open("selected_features.json", "r") as f:
-        selected_features = json.load(f)
-    return model, selected_features
-
-model, selected_features = load_model_and_features()
-
-# Create gauge chart function
-def create_gauge_chart(value):
-    # Determine color and category based on score
-    if value <= 40:
-        color = "#EF4444"  # Red
-        category = "Developing"
-    elif value <= 70:
-        color = "#F59E0B"  # Yellow
-        category = "Adopting"
-    else:
-        color = "#10B981"  # Green
-        category = "Transforming"
-    
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number+delta",
-        value = value,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': f"<span style='font-size:1.1em'>Digital Mindset Score</span><br><span style='font-size:0.7em;color:#94A3B8'>(out of 100)</span><br><span style='font-size:0.8em;color:{color}'>{category}</span>"},
-        delta = {'reference': 50},
-        gauge = {
-            'axis': {'range': [None, 100]},
-            'bar': {'color': color},
-            'steps': [
-                {'range': [0, 40], 'color': "rgba(239, 68, 68, 0.2)"},
-                {'range': [40, 70], 'color': "rgba(245, 158, 11, 0.2)"},
-                {'range': [70, 100], 'color': "rgba(16, 185, 129, 0.2)"}
-            ],
-            'threshold': {
-                'line': {'color': "white", 'width': 4},
-                'thickness': 0.75,
-                'value': 90
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font={'color': "#E2E8F0", 'family': "Inter"},
-        height=350
+# Run a slow loader on its own thread and return its Future. Every loader
+# thread starts by importing pandas: the first to get there imports it and the
+# others wait for that import to finish, so no loader (or scikit-learn, which
+# reads sys.modules["pandas"]) sees a half-initialized module.
+def run_in_background(loader, name):
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name,
+                                  initializer=importlib.import_module, initargs=("pandas",))
+    future = executor.submit(loader)
+    executor.shutdown(wait=False)
+    return future
+
+# Serializes restarts of failed loaders across sessions
+@st.cache_resource
+def loader_restart_lock():
+    return threading.Lock()
+
+# Result of a background loader started by a cached `start` function. A
+# loader that failed is dropped from the cache and started again, instead of
+# every later call re-raising its cached exception.
+def background_result(start):
+    future = start()
+    if future.exception() is not None:
+        with loader_restart_lock():
+            if start() is future:  # not already restarted by another session
+                start.clear()
+            future = start()
+    return future.result()
+
+# pandas is imported by the first background task rather than on the script
+# thread, so the first page render doesn't wait on it. plotly also reads
+# sys.modules["pandas"] while validating figures, so charts are only built
+# after wait_for_pandas().
+@st.cache_resource
+def start_pandas_import():
+    return run_in_background(lambda: None, "pandas-import")
+
+def wait_for_pandas():
+    background_result(start_pandas_import)
+
+# Load the model in the background so the first page render never waits on
+# scikit-learn; one warmed-up predictor, and its score cache, is shared by
+# every session. SCORE_CACHE_SIZE sets how many results are memoized.
+@st.cache_resource
+def start_model_loading():
+    cache_size = int(os.environ.get("SCORE_CACHE_SIZE", DEFAULT_MAXSIZE))
+    return run_in_background(lambda: predictor.load_warm_predictor(cache_size), "model-loader")
+
+def get_predictor():
+    return background_result(start_model_loading)
+
+# Sorted reference scores for percentile ranking, built in the background
+@st.cache_resource
+def start_population_index_loading():
+    return run_in_background(load_population_index, "population-index")
+
+def get_population_index():
+    return background_result(start_population_index_loading)
+
+# Pre-aggregated cohort statistics for the drilldown tab, built in the background
+@st.cache_resource
+def start_cohort_cube_loading():
+    return run_in_background(load_cohort_cube, "cohort-cube")
+
+def get_cohort_cube():
+    cube = background_result(start_cohort_cube_loading)
+    # Fold in survey rows appended to the reference CSV; rebuild if it was rewritten
+    if not refresh_cohort_cube(cube):
+        start_cohort_cube_loading.clear()
+        cube = background_result(start_cohort_cube_loading)
+    return cube
+
+# respondent_id -> stored survey answers, for prefilling the form, built in the background
+@st.cache_resource
+def start_respondent_index_loading():
+    return run_in_background(load_respondent_index, "respondent-index")
+
+def get_respondent_index():
+    index = background_result(start_respondent_index_loading)
+    # Index survey rows appended to the reference CSV; rebuild if it was rewritten
+    if not refresh_respondent_index(index):
+        start_respondent_index_loading.clear()
+        index = background_result(start_respondent_index_loading)
+    return index
+
+@st.cache_resource
+def load_selected_features():
+    return predictor.load_selected_features()
+
+# Process-wide startup timings, filled in by the first script run
+@st.cache_resource
+def boot_timings():
+    return {}
+
+start_pandas_import()
+start_model_loading()
+start_population_index_loading()
+start_cohort_cube_loading()
+start_respondent_index_loading()
+selected_features = load_selected_features()
+
+# Build the feature encoder once per feature set
+@st.cache_resource
+def load_feature_encoder(features):
+    return FeatureEncoder(features)
+
+encoder = load_feature_encoder(tuple(selected_features))
+
+# One prediction queue shared by every session
+@st.cache_resource
+def load_micro_batcher():
+    return MicroBatcher(get_predictor())
+
+# Every assessment is kept in a local SQLite store so respondents can track
+# progress across sessions; writes are batched on a background thread
+@st.cache_resource
+def load_history_store():
+    return HistoryStore()
+
+# Cross-validated model stats for the sidebar, from the report written by
+# model_selection.py; re-read at most once a minute
+@st.cache_data(ttl=60)
+def load_model_stats():
+    report = load_report()
+    return report.get("latest") if report else None
+
+# Rerun counts and script time, for the whole server and for this session
+@st.cache_resource
+def server_rerun_stats():
+    return RerunStats()
+
+def record_rerun(scope, seconds):
+    server_rerun_stats().record(scope, seconds)
+    tracer.record(f"rerun_{scope}", seconds, trace=False)
+    if "rerun_stats" not in st.session_state:
+        st.session_state.rerun_stats = RerunStats()
+    st.session_state.rerun_stats.record(scope, seconds)
+
+# True while only fragments are rerunning, not the whole script. Taken from
+# the script run context, so a full run that raised or was interrupted by a
+# new rerun can't leave stale state behind.
+def is_fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+# st.fragment that also times the fragment's own reruns. Runs that happen as
+# part of a full rerun are already covered by the full-run timing.
+def instrumented_fragment(scope):
+    def decorate(func):
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            if not is_fragment_rerun():
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            tracer.start_trace()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.end_trace()
+                record_rerun(scope, time.perf_counter() - started)
+        return st.fragment(run)
+    return decorate
+
+# Span timings written as Prometheus text and JSON every 15 s when
+# METRICS_DIR is set, e.g. for node_exporter's textfile collector
+@st.cache_resource
+def start_metrics_export():
+    directory = os.environ.get("METRICS_DIR")
+    return MetricsFileExporter(tracer, directory) if directory else None
+
+start_metrics_export()
+
+# Where this run's time went so far, one line per span
+def format_trace(trace):
+    lines = [
+        f"- {name}: {seconds * 1000:.2f} ms" + (f" ({calls}×)" if calls > 1 else "")
+        for name, (calls, seconds) in trace.summary().items()
+    ]
+    lines.append(f"- run so far: {trace.elapsed * 1000:.1f} ms")
+    return "\n".join(lines)
+
+def format_rerun_stats(stats):
+    return ", ".join(
+        f"{scope} {entry['count']:,}× (mean {entry['mean_seconds'] * 1000:.0f} ms)"
+        for scope, entry in sorted(stats.snapshot().items())
+    ) or "none yet"
+
+# Options of the organizational profile inputs. The model inputs' ranges and
+# options come from fields.py, shared with the validation of uploaded data.
+PROFILE_OPTIONS = {
+    "country": ["Australia", "Brazil", "Canada", "France", "Germany", "India",
+                "Japan", "South Africa", "UK", "USA"],
+    "industry": ["Consulting", "Education", "Energy", "Finance", "Government",
+                 "Healthcare", "IT", "Manufacturing", "Media", "Retail"],
+    "job_role": ["Executive", "HR", "Manager", "Operations", "Staff", "Technical Specialist"],
+    "company_size": ["1-50", "51-200", "201-1000", "1001+"],
+}
+
+# Inputs prefilled from a respondent's stored survey answers: answer -> widget key
+PREFILL_WIDGETS = {
+    "age": "age_input",
+    "years_in_role": "years_input",
+    "country": "country_input",
+    "industry": "industry_input",
+    "job_role": "job_role_input",
+    "company_size": "company_size_input",
+    "growth_mindset_score": "growth_mindset",
+    "leadership_score": "leadership",
+    "positive_feedback_percent": "feedback",
+    "limiting_beliefs_score": "limiting_beliefs",
+    "team_openness_score": "team_openness",
+    "training_hours_last_year": "training_hours",
+    "recent_failed_initiatives": "failed_initiatives",
+    "Day": "day",
+    "Month": "month",
+    "Year": "year",
+    "Quarter": "quarter",
+    "change_resistance_level": "change_resistance",
+    "retention_intent": "retention_intent",
+    "Weekday": "weekday",
+    "Season": "season",
+}
+
+# Widget values for a stored respondent record, plus the answers the form
+# can't represent (an option the model lacks, such as "High" resistance)
+def prefill_values(record):
+    answers = dict(record)
+    survey_date = record.get("survey_date")
+    if survey_date is not None:
+        answers.update({
+            "Day": survey_date.day,
+            "Month": survey_date.month,
+            "Year": survey_date.year,
+            "Quarter": (survey_date.month - 1) // 3 + 1,
+            "Weekday": survey_date.strftime("%A"),
+            "Season": SEASON_BY_MONTH[survey_date.month],
+        })
+    values, skipped = {}, []
+    for answer, key in PREFILL_WIDGETS.items():
+        value = answers.get(answer)
+        if value is None:
+            continue
+        if answer in NUMERIC_RANGES:
+            low, high = NUMERIC_RANGES[answer]
+            values[key] = min(max(int(round(value)), low), high)
+        elif value in OPTIONS.get(answer, PROFILE_OPTIONS.get(answer, ())):
+            values[key] = value
+        else:
+            skipped.append(f"{answer.replace('_', ' ')} ({value})")
+    return values, skipped
+
+# Look the entered ID up in this session's uploaded file, then the reference
+# dataset, and prefill the inputs with the stored answers
+def prefill_respondent():
+    respondent_id = st.session_state.id_input
+    bulk_result = st.session_state.get("bulk_result")
+    record, index = lookup_respondent(
+        respondent_id, bulk_result and bulk_result["respondents"], get_respondent_index()
     )
-    
-    return fig
+    values, skipped = prefill_values(record) if record is not None else ({}, [])
+    for key, value in values.items():
+        st.session_state[key] = value
+    st.session_state.respondent_lookup = {
+        "respondent_id": respondent_id, "record": record, "skipped": skipped,
+    }
 
 # Professional Header with Enhanced Design
 header_html = """
@@ -541,7 +784,7 @@ st.sidebar.markdown("---")
 # Demographics in sidebar with better spacing
 age = st.sidebar.number_input(
     "Age", 
-    min_value=18, max_value=80, value=30, 
+    **widget_range("age"), value=30,
     help="Respondent's age in years",
     key="age_input"
 )
@@ -550,7 +793,7 @@ st.sidebar.markdown("")  # Add spacing
 
 years_in_role = st.sidebar.number_input(
     "Years in Current Role", 
-    min_value=0, max_value=50, value=3, 
+    **widget_range("years_in_role"), value=3,
     help="Experience in current position",
     key="years_input"
 )
@@ -560,25 +803,108 @@ st.sidebar.markdown("")  # Add spacing
 # Additional demographic fields if they exist in features
 respondent_id = st.sidebar.number_input(
     "Respondent ID", 
-    min_value=1, value=1, 
-    help="Unique identifier for this assessment",
-    key="id_input"
+    **widget_range("respondent_id"), value=1,
+    help="Unique identifier for this assessment; a known ID prefills the stored survey answers",
+    key="id_input",
+    on_change=prefill_respondent
 ) if "respondent_id" in selected_features else 1
 
+respondent_lookup = st.session_state.get("respondent_lookup")
+if respondent_lookup is not None and respondent_lookup["respondent_id"] == respondent_id:
+    stored = respondent_lookup["record"]
+    if stored is None:
+        st.sidebar.caption("No stored survey answers for this ID")
+    else:
+        stored_scores = [
+            f"{label} **{stored[column]:.1f}**"
+            for column, label in (("digital_adoption_score", "recorded adoption score"),
+                                  ("digital_mindset_score", "scored"))
+            if stored.get(column) is not None
+        ]
+        surveyed = f" on {stored['survey_date']:%d %b %Y}" if stored.get("survey_date") else ""
+        st.sidebar.caption(
+            f"📋 Prefilled from `{stored['source']}`{surveyed}"
+            + (f": {', '.join(stored_scores)}" if stored_scores else "")
+        )
+        if respondent_lookup["skipped"]:
+            st.sidebar.caption(f"Not available in the form: {', '.join(respondent_lookup['skipped'])}")
+
+st.sidebar.markdown("")  # Add spacing
+
+# Organizational profile, used to benchmark against comparable respondents
+country = st.sidebar.selectbox(
+    "Country",
+    options=PROFILE_OPTIONS["country"],
+    index=9,
+    help="Benchmark against respondents in the same country",
+    key="country_input"
+)
+
+industry = st.sidebar.selectbox(
+    "Industry",
+    options=PROFILE_OPTIONS["industry"],
+    index=6,
+    help="Benchmark against respondents in the same industry",
+    key="industry_input"
+)
+
+job_role = st.sidebar.selectbox(
+    "Job Role",
+    options=PROFILE_OPTIONS["job_role"],
+    index=4,
+    help="Benchmark against respondents in the same role",
+    key="job_role_input"
+)
+
+company_size = st.sidebar.selectbox(
+    "Company Size",
+    options=PROFILE_OPTIONS["company_size"],
+    index=1,
+    help="Number of employees in the organization",
+    key="company_size_input"
+)
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("## 📊 Quick Stats")
 st.sidebar.markdown(f"**• Total Features:** {len(selected_features)}")
-st.sidebar.markdown("**• Model:** Random Forest")
-st.sidebar.markdown("**• Accuracy:** 94.2%")
+model_stats = load_model_stats()
+if model_stats is None:
+    st.sidebar.markdown("**• Model:** not evaluated yet — run `python model_selection.py`")
+else:
+    deployed_stats = model_stats["deployed"] or model_stats["best"]
+    st.sidebar.markdown(f"**• Model:** {deployed_stats['name']}")
+    st.sidebar.markdown(f"**• CV R²:** {deployed_stats['r2']:.3f} ({model_stats['folds']}-fold)")
+    st.sidebar.markdown(
+        f"**• Best Candidate:** {model_stats['best']['name']} (R² {model_stats['best']['r2']:.3f})"
+    )
 
 # Main content with tabs
-tab1, tab2 = st.tabs(["🔮 Predict Digital Mindset", "ℹ️ About the App & Methodology"])
+tab1, tab_bulk, tab_team, tab_cohorts, tab2 = st.tabs([
+    "🔮 Predict Digital Mindset",
+    "📁 Bulk Assessment",
+    "👥 Team Assessment",
+    "🧭 Cohort Drilldown",
+    "ℹ️ About the App & Methodology"
+])
+
+# Inputs and results of the assessment. The inputs sit in a form, so moving a
+# slider reruns nothing until the prediction is requested, and the submit
+# reruns only this fragment rather than the CSS, header, sidebar and other tabs.
+# The sidebar profile is passed in; changing it reruns the whole script.
+@instrumented_fragment("assessment")
+def assessment_panel(respondent):
+    age = respondent["age"]
+    years_in_role = respondent["years_in_role"]
+    respondent_id = respondent["respondent_id"]
+    country = respondent["country"]
+    industry = respondent["industry"]
+    job_role = respondent["job_role"]
+    company_size = respondent["company_size"]
 
-with tab1:
     # Create three columns for better layout
     col1, col_spacer, col2 = st.columns([2.5, 0.2, 1.8])
     
-    with col1:
+    with col1, st.form("assessment_form", border=False):
         # Mindset & Behavioral Scores
         with st.expander("🧠 Mindset & Behavioral Scores", expanded=True):
             st.markdown("*Core psychological and behavioral indicators*")
@@ -589,21 +915,21 @@ with tab1:
             with col_a:
                 growth_mindset_score = st.slider(
                     "Growth Mindset Score", 
-                    min_value=0, max_value=100, value=50,
+                    **widget_range("growth_mindset_score"), value=50,
                     help="Measures openness to learning and development",
                     key="growth_mindset"
                 )
                 
                 leadership_score = st.slider(
                     "Leadership Score", 
-                    min_value=0, max_value=100, value=50,
+                    **widget_range("leadership_score"), value=50,
                     help="Leadership capability and influence",
                     key="leadership"
                 )
                 
                 positive_feedback_percent = st.slider(
                     "Positive Feedback %", 
-                    min_value=0, max_value=100, value=70,
+                    **widget_range("positive_feedback_percent"), value=70,
                     help="Percentage of positive feedback received",
                     key="feedback"
                 )
@@ -611,14 +937,14 @@ with tab1:
             with col_b:
                 limiting_beliefs_score = st.slider(
                     "Limiting Beliefs Score", 
-                    min_value=0, max_value=100, value=30,
+                    **widget_range("limiting_beliefs_score"), value=30,
                     help="Level of self-limiting beliefs (lower is better)",
                     key="limiting_beliefs"
                 )
                 
                 team_openness_score = st.slider(
                     "Team Openness Score", 
-                    min_value=0, max_value=100, value=60,
+                    **widget_range("team_openness_score"), value=60,
                     help="Team's openness to change and new ideas",
                     key="team_openness"
                 )
@@ -633,14 +959,14 @@ with tab1:
             with col_c:
                 training_hours_last_year = st.number_input(
                     "Training Hours (Last Year)", 
-                    min_value=0, max_value=500, value=40,
+                    **widget_range("training_hours_last_year"), value=40,
                     help="Total training hours completed in the past year",
                     key="training_hours"
                 )
                 
                 recent_failed_initiatives = st.number_input(
                     "Recent Failed Initiatives", 
-                    min_value=0, max_value=20, value=2,
+                    **widget_range("recent_failed_initiatives"), value=2,
                     help="Number of failed change initiatives in recent period",
                     key="failed_initiatives"
                 )
@@ -649,25 +975,25 @@ with tab1:
                 # Date/Time Context
                 day = st.number_input(
                     "Day of Month", 
-                    min_value=1, max_value=31, value=15,
+                    **widget_range("Day"), value=15,
                     key="day"
                 ) if "Day" in selected_features else 15
                 
                 month = st.number_input(
                     "Month", 
-                    min_value=1, max_value=12, value=6,
+                    **widget_range("Month"), value=6,
                     key="month"
                 ) if "Month" in selected_features else 6
                 
                 year = st.number_input(
                     "Year", 
-                    min_value=2020, max_value=2030, value=2024,
+                    **widget_range("Year"), value=2024,
                     key="year"
                 ) if "Year" in selected_features else 2024
                 
                 quarter = st.selectbox(
                     "Quarter", 
-                    [1, 2, 3, 4], index=1,
+                    widget_options("Quarter"), index=1,
                     key="quarter"
                 ) if "Quarter" in selected_features else 2
 
@@ -681,7 +1007,7 @@ with tab1:
             with col_e:
                 change_resistance = st.selectbox(
                     "Change Resistance Level",
-                    options=["Low", "Medium"],  # Only options available in model
+                    options=widget_options("change_resistance_level"),
                     index=0,
                     help="Overall resistance to organizational change (High not available in current model)",
                     key="change_resistance"
@@ -689,7 +1015,7 @@ with tab1:
                 
                 retention_intent = st.selectbox(
                     "Retention Intent",
-                    options=["Very Unlikely", "Unlikely", "Likely", "Very Likely"],
+                    options=widget_options("retention_intent"),
                     index=2,
                     help="Likelihood of staying with the organization",
                     key="retention_intent"
@@ -698,7 +1024,7 @@ with tab1:
             with col_f:
                 weekday = st.selectbox(
                     "Survey Weekday",
-                    options=["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+                    options=widget_options("Weekday"),
                     index=2,
                     help="Day of the week when survey was completed",
                     key="weekday"
@@ -706,7 +1032,7 @@ with tab1:
                 
                 season = st.selectbox(
                     "Survey Season",
-                    options=["Winter", "Summer", "Monsoon"],  # Only options available in model
+                    options=widget_options("Season"),
                     index=1,
                     help="Season when survey was completed (Autumn not available in current model)",
                     key="season"
@@ -716,7 +1042,7 @@ with tab1:
         st.markdown("---")
         st.markdown("### 🎯 Generate Assessment")
         
-        predict_button = st.button(
+        predict_button = st.form_submit_button(
             "🔮 Generate Digital Mindset Prediction", 
             use_container_width=True,
             type="primary",
@@ -732,148 +1058,109 @@ with tab1:
     with col2:
         # Results Panel - Always visible but shows placeholder initially
         st.markdown("### 📊 Assessment Results")
+        wait_for_pandas()  # every chart is built in this panel
+        
+        trace_slot = None
         
         # Check if prediction has been made
         if predict_button:
             st.session_state.prediction_made = True
-            # Prepare input data with one-hot encoding
-            user_input = {}
-            
-            # Initialize all features with 0
-            for feature in selected_features:
-                user_input[feature] = 0
-            
-            # Set numerical features
-            if "age" in selected_features:
-                user_input["age"] = age
-            if "years_in_role" in selected_features:
-                user_input["years_in_role"] = years_in_role
-            if "respondent_id" in selected_features:
-                user_input["respondent_id"] = respondent_id
-            if "growth_mindset_score" in selected_features:
-                user_input["growth_mindset_score"] = growth_mindset_score
-            if "limiting_beliefs_score" in selected_features:
-                user_input["limiting_beliefs_score"] = limiting_beliefs_score
-            if "training_hours_last_year" in selected_features:
-                user_input["training_hours_last_year"] = training_hours_last_year
-            if "leadership_score" in selected_features:
-                user_input["leadership_score"] = leadership_score
-            if "team_openness_score" in selected_features:
-                user_input["team_openness_score"] = team_openness_score
-            if "recent_failed_initiatives" in selected_features:
-                user_input["recent_failed_initiatives"] = recent_failed_initiatives
-            if "positive_feedback_percent" in selected_features:
-                user_input["positive_feedback_percent"] = positive_feedback_percent
-            if "Day" in selected_features:
-                user_input["Day"] = day
-            if "Month" in selected_features:
-                user_input["Month"] = month
-            if "Year" in selected_features:
-                user_input["Year"] = year
-            if "Quarter" in selected_features:
-                user_input["Quarter"] = quarter
-            
-            # Handle one-hot encoded features
-            # Change Resistance Level
-            change_resistance_key = f"change_resistance_level_{change_resistance}"
-            if change_resistance_key in selected_features:
-                user_input[change_resistance_key] = 1
-            
-            # Retention Intent
-            retention_intent_key = f"retention_intent_{retention_intent}"
-            if retention_intent_key in selected_features:
-                user_input[retention_intent_key] = 1
-            
-            # Weekday
-            weekday_key = f"Weekday_{weekday}"
-            if weekday_key in selected_features:
-                user_input[weekday_key] = 1
-            
-            # Season
-            season_key = f"Season_{season}"
-            if season_key in selected_features:
-                user_input[season_key] = 1
-            
-            # Convert to DataFrame and ensure correct column order
-            input_df = pd.DataFrame([user_input])
-            
-            # Reorder columns to match the selected_features order (critical for model prediction)
-            input_df = input_df.reindex(columns=selected_features, fill_value=0)
-            
-            # Convert to numpy array without feature names (as model was trained)
-            input_array = input_df.values
-            
-            # Make prediction using numpy array (no feature names)
-            model_prediction = model.predict(input_array)[0]
-            
-            # Since the current model has over-regularization (all coefficients = 0),
-            # implement a simple scoring algorithm based on the input features
-            def calculate_digital_mindset_score(user_data):
-                score = 40  # Base score
-                
-                # Behavioral factors (40% weight)
-                behavioral_score = (
-                    user_data.get('growth_mindset_score', 50) * 0.3 +
-                    (100 - user_data.get('limiting_beliefs_score', 50)) * 0.2 +  # Invert limiting beliefs
-                    user_data.get('leadership_score', 50) * 0.25 +
-                    user_data.get('positive_feedback_percent', 70) * 0.25
-                ) * 0.4
-                
-                # Organizational factors (30% weight)
-                org_score = (
-                    min(user_data.get('training_hours_last_year', 40) / 100 * 100, 100) * 0.4 +
-                    user_data.get('team_openness_score', 60) * 0.4 +
-                    max(0, 100 - user_data.get('recent_failed_initiatives', 2) * 10) * 0.2
-                ) * 0.3
-                
-                # Demographics (20% weight)
-                demo_score = (
-                    min(user_data.get('years_in_role', 3) / 10 * 100, 100) * 0.6 +
-                    min(user_data.get('age', 30) / 60 * 100, 100) * 0.4
-                ) * 0.2
-                
-                # Categorical bonuses (10% weight)
-                categorical_bonus = 0
-                if user_data.get('change_resistance_level_Low', 0) == 1:
-                    categorical_bonus += 15
-                elif user_data.get('change_resistance_level_Medium', 0) == 1:
-                    categorical_bonus += 5
-                    
-                if user_data.get('retention_intent_Very Likely', 0) == 1:
-                    categorical_bonus += 10
-                elif user_data.get('retention_intent_Likely', 0) == 1:
-                    categorical_bonus += 5
-                
-                categorical_score = categorical_bonus * 0.1
-                
-                total_score = score + behavioral_score + org_score + demo_score + categorical_score
-                return max(0, min(100, total_score))  # Clamp between 0-100
+            # Encode inputs straight into the model's feature vector
+            assessment_inputs = {
+                "age": age,
+                "years_in_role": years_in_role,
+                "respondent_id": respondent_id,
+                "growth_mindset_score": growth_mindset_score,
+                "limiting_beliefs_score": limiting_beliefs_score,
+                "training_hours_last_year": training_hours_last_year,
+                "leadership_score": leadership_score,
+                "team_openness_score": team_openness_score,
+                "recent_failed_initiatives": recent_failed_initiatives,
+                "positive_feedback_percent": positive_feedback_percent,
+                "Day": day,
+                "Month": month,
+                "Year": year,
+                "Quarter": quarter,
+                "change_resistance_level": change_resistance,
+                "retention_intent": retention_intent,
+                "Weekday": weekday,
+                "Season": season,
+            }
+            with span("encode"):
+                input_array = encoder.encode(assessment_inputs)
             
-            # Use our custom scoring since the model is over-regularized
-            prediction = calculate_digital_mindset_score(user_input)
+            # Model prediction plus our custom score (the model is over-regularized).
+            # Sessions share one micro-batcher, so simultaneous clicks are
+            # scored together in a single model.predict call
+            micro_batcher = load_micro_batcher()
+            with span("micro_batch"):
+                result = micro_batcher.predict(input_array)
+            model_prediction = result["model_prediction"]
+            prediction = result["score"]
             
             # Debug: Show what data is being sent to the model
             with st.expander("🔍 Debug: Model Analysis", expanded=False):
-                st.write("**Input DataFrame Shape:**", input_df.shape)
                 st.write("**Input Array Shape:**", input_array.shape)
                 st.write("**All Features in Model:**", len(selected_features))
                 
                 st.write("**Prediction Comparison:**")
                 st.write(f"- Original Model Prediction: {model_prediction:.2f}")
                 st.write(f"- Custom Algorithm Prediction: {prediction:.2f}")
+                scoring_spec = load_scoring_spec()
+                st.write(f"- Scoring spec: `{scoring_spec['name']}` v{scoring_spec['version']}")
+                shared_predictor = get_predictor()
+                timings = boot_timings()
+                st.write("**Startup:**")
+                st.write(f"- Server time to first render: {timings.get('first_render_seconds', 0) * 1000:.0f} ms")
+                st.write(f"- This session's time to first render: {st.session_state.get('first_render_seconds', 0) * 1000:.0f} ms")
+                st.write(f"- Model load (background): {shared_predictor.timings['load_seconds'] * 1000:.0f} ms, "
+                         f"warm-up prediction: {shared_predictor.timings['warmup_seconds'] * 1000:.1f} ms")
+                st.write(
+                    f"**Micro-batching:** {micro_batcher.batches:,} batches, "
+                    f"mean batch size {micro_batcher.mean_batch_size:.2f}"
+                )
+                if shared_predictor.cache is not None:
+                    cache_stats = shared_predictor.cache.stats()
+                    st.write(
+                        f"**Score cache:** {cache_stats['size']:,} / {cache_stats['maxsize']:,} entries, "
+                        f"{cache_stats['hits']:,} hits, {cache_stats['misses']:,} misses "
+                        f"({cache_stats['hit_rate']:.0%} hit rate), {cache_stats['evictions']:,} evictions"
+                    )
+                    st.download_button(
+                        "⬇️ Export Cache Statistics",
+                        data=json.dumps(cache_stats, indent=2),
+                        file_name="score_cache_stats.json",
+                        mime="application/json",
+                        on_click="ignore",
+                        key="cache_stats_download"
+                    )
+                if "rerun_stats" in st.session_state:
+                    st.write(f"**Reruns (this session):** {format_rerun_stats(st.session_state.rerun_stats)}")
+                st.write(f"**Reruns (server):** {format_rerun_stats(server_rerun_stats())}")
+                history_stats = load_history_store().stats()
+                st.write(
+                    f"**History store:** {history_stats['written']:,} assessments written in "
+                    f"{history_stats['batches']:,} batches, {history_stats['pending']:,} pending"
+                )
+                if tracer.enabled:
+                    st.write("**This run's spans:**")
+                    trace_slot = st.empty()  # filled in once the results are rendered
                 st.warning("⚠️ The original model is over-regularized (all coefficients = 0), so using custom scoring algorithm.")
                 
                 # Show non-zero values
-                non_zero_data = {}
-                for col in input_df.columns:
-                    val = input_df[col].iloc[0]
-                    if val != 0:
-                        non_zero_data[col] = val
+                non_zero_data = {
+                    feature: float(val)
+                    for feature, val in zip(selected_features, input_array[0])
+                    if val != 0
+                }
                 
                 st.write("**Non-Zero Features Being Sent:**")
                 st.json(non_zero_data)
             
             st.session_state.current_prediction = prediction
+            st.session_state.current_inputs = assessment_inputs
+            load_history_store().record(respondent_id, assessment_inputs, prediction,
+                                        model_prediction, result["category"])
             
             # Display results
             st.balloons()
@@ -903,7 +1190,76 @@ with tab1:
             
             # Gauge chart
             gauge_fig = create_gauge_chart(prediction)
-            st.plotly_chart(gauge_fig, use_container_width=True, key="active_prediction_gauge")
+            with span("gauge_render"):
+                st.plotly_chart(gauge_fig, use_container_width=True, key="active_prediction_gauge")
+            
+            # Percentile rank against the reference population and cohorts
+            st.markdown("#### 📈 Benchmark Comparison")
+            ranks = get_population_index().percentiles(prediction, {
+                "country": country,
+                "industry": industry,
+                "job_role": job_role,
+                "company_size": company_size,
+            })
+            benchmark_lines = []
+            for cohort_key, cohort_label in [
+                ("population", "All respondents"),
+                ("country", country),
+                ("industry", industry),
+                ("job_role", job_role),
+                ("company_size", f"{company_size} employees"),
+            ]:
+                rank, cohort_size = ranks[cohort_key]
+                if rank is None:
+                    benchmark_lines.append(f"- **{cohort_label}:** no reference respondents")
+                else:
+                    benchmark_lines.append(
+                        f"- **{cohort_label}:** higher than {rank:.0f}% "
+                        f"of {cohort_size:,} respondents"
+                    )
+            st.markdown("\n".join(benchmark_lines))
+            
+            # Earlier assessments of the same respondent, from the history store
+            if st.session_state.get("current_inputs") is not None:
+                st.markdown("#### 🕒 Assessment History")
+                history_respondent = st.session_state.current_inputs["respondent_id"]
+                with span("history_load"):
+                    history = load_history_store().history(history_respondent, limit=500)
+                if len(history) > 1:
+                    change = history[-1]["score"] - history[0]["score"]
+                    st.markdown(
+                        f"Respondent #{history_respondent}: **{len(history)}** assessments, "
+                        f"**{change:+.1f}** points since the first."
+                    )
+                    st.plotly_chart(build_history_chart(history), use_container_width=True, key="history_chart")
+                else:
+                    st.markdown(
+                        f"First recorded assessment for respondent #{history_respondent}. "
+                        "Reassess periodically to track progress."
+                    )
+            
+            # What-if: sweep each lever across its range with everything else fixed
+            if st.session_state.get("current_inputs") is not None:
+                st.markdown("#### 🔀 What-If Levers")
+                with span("what_if_sweep"):
+                    sweep = sweep_levers(get_predictor(), st.session_state.current_inputs)
+                levers = ranked_levers(sweep)
+                top_lever = levers[0][1]
+                if top_lever["max_gain"] > 0:
+                    st.markdown(
+                        f"Biggest lever: **{top_lever['label']}** — moving it from "
+                        f"{top_lever['current_value']} to {top_lever['best_value']} "
+                        f"adds **{top_lever['max_gain']:+.1f}** points."
+                    )
+                else:
+                    st.markdown("No single input change would raise this score further.")
+                st.plotly_chart(build_sensitivity_chart(sweep), use_container_width=True, key="what_if_chart")
+                st.markdown("\n".join(
+                    f"- **{lever['label']}:** {lever['current_value']} → {lever['best_value']} "
+                    f"({lever['max_gain']:+.1f})"
+                    for _, lever in levers
+                ))
+                st.caption(f"{sweep['rows']:,} scenarios scored in one batch in {sweep['seconds'] * 1000:.1f} ms.")
             
             # Interpretation with enhanced styling
             st.markdown("#### 💡 Score Interpretation")
@@ -962,20 +1318,306 @@ with tab1:
                 if st.button("🔄 Reset Assessment", use_container_width=True, key="reset_button"):
                     st.session_state.prediction_made = False
                     st.session_state.current_prediction = None
-                    st.rerun()
+                    st.session_state.current_inputs = None
+                    st.rerun(scope="fragment")
             
             # Show sample gauge as preview
             st.markdown("#### Preview: Sample Assessment")
-            sample_fig = create_gauge_chart(65)  # Sample score
-            st.plotly_chart(sample_fig, use_container_width=True, key="sample_preview_gauge")
+            sample_fig = frozen_gauge_chart(65)  # Sample score, serialized once per process
+            with span("gauge_render"):
+                st.plotly_chart(sample_fig, use_container_width=True, key="sample_preview_gauge")
             
             st.markdown("""
             **What you'll get:**
             - 📊 Digital Mindset Score (0-100)
             - 🎯 Personalized category assessment
             - 💡 Detailed recommendations
-            - 📈 Benchmark comparison
+            - 📈 Percentile rank against comparable respondents
             """)
+        
+        trace = tracer.current_trace()
+        if trace_slot is not None and trace is not None:
+            trace_slot.markdown(format_trace(trace))
+
+with tab1:
+    assessment_panel({
+        "age": age,
+        "years_in_role": years_in_role,
+        "respondent_id": respondent_id,
+        "country": country,
+        "industry": industry,
+        "job_role": job_role,
+        "company_size": company_size,
+    })
+
+# Rows rejected by the input checks of an upload, and answers the model has
+# no feature for (see validation.py)
+def show_validation_report(report):
+    if report.rejected:
+        st.warning(f"⚠️ {report.summary()}: they failed the input checks and were left out.")
+    if report:
+        with st.expander("🧪 Validation Report", expanded=bool(report.rejected)):
+            for line in report.error_lines():
+                st.text(f"✗ {line}")
+            for line in report.warning_lines():
+                st.text(f"! {line}")
+            st.caption(
+                "✗ rejects the row. ! only flags an answer the model has no feature for; "
+                "the row is scored as if that question had none of the modeled answers. "
+                "Rows are numbered from 1 at the first data row."
+            )
+
+# st.download_button serves a file from memory, so scored files larger than
+# this (BULK_DOWNLOAD_LIMIT_MB) are left on disk instead of offered for download
+DOWNLOAD_LIMIT_BYTES = int(os.environ.get("BULK_DOWNLOAD_LIMIT_MB", 256)) * 1024 ** 2
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+# Upload, scoring and download rerun only this tab
+@instrumented_fragment("bulk")
+def bulk_assessment():
+    st.header("Bulk Assessment")
+    st.markdown(
+        "*Upload a survey export with the same columns as "
+        "`synthetic_digital_mindset_data.csv` to score every respondent at once. "
+        "The file is processed in fixed-size chunks, so large exports "
+        "are never loaded into memory whole.*"
+    )
+
+    uploaded_file = st.file_uploader(
+        "Survey CSV",
+        type=["csv"],
+        help="One row per respondent, in the reference dataset schema",
+        key="bulk_upload"
+    )
+
+    if uploaded_file is not None and st.button("📊 Score File", type="primary", key="bulk_score_button"):
+        # Respondent IDs in the file, indexed as its chunks are scored
+        uploaded_respondents = RespondentIndex(uploaded_file.name)
+        validation_report = ValidationReport()
+        progress_bar = st.progress(0.0, text="Scoring respondents...")
+
+        def report_progress(fraction, rows_scored):
+            progress_bar.progress(
+                fraction if fraction is not None else 0.0,
+                text=f"Scored {rows_scored:,} respondents..."
+            )
+
+        output_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", prefix="scored_", delete=False, newline=""
+        )
+        try:
+            with output_file:
+                rows_scored = score_csv_in_chunks(
+                    uploaded_file, output_file, get_predictor().model, encoder,
+                    progress_callback=report_progress,
+                    chunk_callback=uploaded_respondents.update,
+                    report=validation_report
+                )
+        except ValueError as exc:
+            os.remove(output_file.name)
+            progress_bar.empty()
+            st.error(f"Could not score this file: {exc}")
+        else:
+            progress_bar.progress(1.0, text=f"Scored {rows_scored:,} respondents")
+            previous_result = st.session_state.get("bulk_result")
+            if previous_result and os.path.exists(previous_result["path"]):
+                os.remove(previous_result["path"])
+            st.session_state.bulk_result = {
+                "path": output_file.name,
+                "rows": rows_scored,
+                "name": f"scored_{uploaded_file.name}",
+                "report": validation_report,
+                # Replaced, and so released, along with the rest of the result
+                "respondents": uploaded_respondents,
+            }
+
+    bulk_result = st.session_state.get("bulk_result")
+    if bulk_result and os.path.exists(bulk_result["path"]):
+        st.success(f"✅ {bulk_result['rows']:,} respondents scored")
+        st.caption("Enter a Respondent ID from this file in the sidebar to load their answers.")
+        show_validation_report(bulk_result["report"])
+        output_bytes = os.path.getsize(bulk_result["path"])
+        if output_bytes <= DOWNLOAD_LIMIT_BYTES:
+            # A callable is only read when the button is clicked, not on every rerun
+            st.download_button(
+                "⬇️ Download Scored CSV",
+                data=functools.partial(read_file, bulk_result["path"]),
+                file_name=bulk_result["name"],
+                mime="text/csv",
+                use_container_width=True,
+                key="bulk_download"
+            )
+        else:
+            st.warning(
+                f"The scored file is {output_bytes / 1024 ** 2:,.0f} MB, over the "
+                f"{DOWNLOAD_LIMIT_BYTES / 1024 ** 2:,.0f} MB browser download limit. "
+                f"It is saved on the server at `{bulk_result['path']}`; for exports this "
+                "large, `python score_files.py score` writes the scored file straight to disk."
+            )
+
+with tab_bulk:
+    bulk_assessment()
+
+# Roster upload and the team summary rerun only this tab
+@instrumented_fragment("team")
+def team_assessment():
+    st.header("Team Assessment")
+    st.markdown(
+        "*Upload a team roster with the same columns as "
+        "`synthetic_digital_mindset_data.csv`. Every member is scored in one batch "
+        "and the team is compared with the reference population.*"
+    )
+
+    roster_file = st.file_uploader(
+        "Team roster CSV",
+        type=["csv"],
+        help="One row per team member, in the reference dataset schema",
+        key="team_upload"
+    )
+    if roster_file is None:
+        return
+
+    # Score a roster once; later reruns of the tab reuse the summary
+    team = st.session_state.get("team_summary")
+    if team is None or team["file_id"] != roster_file.file_id:
+        started = time.perf_counter()
+        validation_report = ValidationReport()
+        try:
+            with span("team_score"):
+                scores = score_roster(read_roster(roster_file), encoder, validation_report)
+        except ValueError as exc:
+            st.error(f"Could not score this roster: {exc}")
+            show_validation_report(validation_report)
+            return
+        with span("team_aggregate"):
+            summary = summarize_team(scores, get_population_index())
+        team = st.session_state.team_summary = {
+            "file_id": roster_file.file_id,
+            "summary": summary,
+            "report": validation_report,
+            "seconds": time.perf_counter() - started,
+        }
+
+    summary = team["summary"]
+    team_stats, population_stats = summary["team"], summary["population"]
+    show_validation_report(team["report"])
+    metric_columns = st.columns(4)
+    metric_columns[0].metric("Team Members", f"{team_stats['count']:,}")
+    metric_columns[1].metric(
+        "Mean Score", f"{team_stats['mean']:.1f}",
+        delta=f"{team_stats['mean'] - population_stats['mean']:+.1f} vs population"
+    )
+    metric_columns[2].metric(
+        "Median Score", f"{team_stats['median']:.1f}",
+        delta=f"{team_stats['median'] - population_stats['median']:+.1f} vs population"
+    )
+    metric_columns[3].metric(
+        "Spread (Std Dev)", f"{team_stats['std']:.1f}",
+        delta=f"{team_stats['std'] - population_stats['std']:+.1f} vs population",
+        delta_color="off"
+    )
+
+    st.markdown("#### Readiness Categories")
+    category_columns = st.columns(len(SCORE_CATEGORIES))
+    for category_column, (_, category) in zip(category_columns, SCORE_CATEGORIES):
+        team_share = summary["categories"]["team"][category]
+        population_share = summary["categories"]["population"][category]
+        category_column.metric(
+            category, f"{team_share:.0%}",
+            delta=f"{(team_share - population_share) * 100:+.1f} pts vs population",
+            delta_color="inverse" if category == "Developing" else "normal"
+        )
+
+    st.markdown("#### Score Distribution")
+    st.plotly_chart(build_team_distribution_chart(summary), use_container_width=True, key="team_distribution_chart")
+
+    import pandas as pd
+
+    comparison = pd.DataFrame(
+        [
+            [stats[name] for name in ("mean", "std", "min", "p25", "median", "p75", "max")]
+            + [summary["categories"][key][category] * 100 for _, category in SCORE_CATEGORIES]
+            for key, stats in (("team", team_stats), ("population", population_stats))
+        ],
+        index=["Team", "Reference Population"],
+        columns=["Mean", "Std Dev", "Min", "25%", "Median", "75%", "Max"]
+        + [f"{category} %" for _, category in SCORE_CATEGORIES],
+    )
+    st.dataframe(comparison.round(1), use_container_width=True)
+    st.caption(
+        f"The median member scores at percentile {summary['median_percentile']:.0f} of the "
+        f"reference population, and {summary['above_population_median']:.0%} of members score above "
+        f"its median. {team_stats['count']:,} members scored and summarized in "
+        f"{team['seconds'] * 1000:.0f} ms."
+    )
+
+with tab_team:
+    team_assessment()
+
+# Changing a cohort filter reruns only this tab
+@instrumented_fragment("cohorts")
+def cohort_drilldown():
+    st.header("Cohort Drilldown")
+    st.markdown(
+        "*Score and input statistics for any slice of the reference population. "
+        "Every combination of the dimensions below is pre-aggregated, so changing "
+        "a filter is a single lookup.*"
+    )
+
+    # Don't hold up a cold start's first render while the cube is built
+    if not start_cohort_cube_loading().done():
+        st.info("⏳ Cohort statistics are still being built and will appear on your next interaction.")
+        st.button("🔄 Refresh", key="cohort_refresh")
+    else:
+        cohort_cube = get_cohort_cube()
+
+        dimension_labels = {
+            "country": "Country",
+            "industry": "Industry",
+            "job_role": "Job Role",
+            "company_size": "Company Size",
+            "education_level": "Education Level",
+        }
+        cohort_slices = {}
+        filter_columns = st.columns(len(DIMENSIONS))
+        for filter_column, dimension in zip(filter_columns, DIMENSIONS):
+            with filter_column:
+                choice = st.selectbox(
+                    dimension_labels[dimension],
+                    options=["All"] + cohort_cube.labels(dimension),
+                    key=f"cohort_{dimension}"
+                )
+            if choice != "All":
+                cohort_slices[dimension] = choice
+
+        cohort_stats = cohort_cube.stats(**cohort_slices)
+        if cohort_stats is None:
+            st.info("No reference respondents match this combination.")
+        else:
+            score_stats = cohort_stats["measures"]["digital_mindset_score"]
+            metric_columns = st.columns(4)
+            metric_columns[0].metric("Respondents", f"{cohort_stats['count']:,}")
+            metric_columns[1].metric("Mean Score", f"{score_stats['mean']:.1f}")
+            metric_columns[2].metric("Median Score", f"{score_stats['median']:.1f}")
+            metric_columns[3].metric(
+                "Interquartile Range",
+                f"{score_stats['p25']:.1f} – {score_stats['p75']:.1f}"
+            )
+
+            import pandas as pd
+
+            st.markdown("#### Score and Input Statistics")
+            cohort_table = pd.DataFrame(cohort_stats["measures"]).T
+            cohort_table.index = [name.replace("_", " ").title() for name in cohort_table.index]
+            cohort_table.columns = ["Mean", "Std Dev", "Min", "25%", "Median", "75%", "Max"]
+            st.dataframe(cohort_table.round(1), use_container_width=True)
+            st.caption("Quantiles are estimated from fixed-width histograms kept per cohort.")
+
+with tab_cohorts:
+    cohort_drilldown()
 
 with tab2:
     st.header("About the Digital Mindset Predictor")
@@ -1039,7 +1681,7 @@ with tab2:
         ### 📈 Use Cases
         
         - **Individual Development:** Personal digital transformation planning
-        - **Team Assessment:** Evaluate team readiness for digital initiatives
+        - **Team Assessment:** Evaluate team readiness for digital initiatives (Team Assessment tab)
         - **Organizational Planning:** Strategic workforce development
         - **Change Management:** Identify change champions and support needs
         
@@ -1062,3 +1704,11 @@ st.markdown("""
     </p>
 </div>
 """, unsafe_allow_html=True)
+
+# Record how long this run took to render; the first run of the process and
+# of each session is reported in the debug expander
+_render_seconds = time.perf_counter() - _script_started
+boot_timings().setdefault("first_render_seconds", _render_seconds)
+st.session_state.setdefault("first_render_seconds", _render_seconds)
+tracer.end_trace()
+record_rerun("full", _render_seconds)
@@ -0,0 +1,164 @@
+# Self-describing model artifact: the estimator together with its ordered
+# feature schema, per-feature value ranges seen in training, a checksum and
+# training metadata, in one uncompressed joblib file.
+#
+#   python artifact.py build                  # model.pkl + selected_features.json -> model.joblib
+#   python artifact.py inspect model.joblib
+#
+# Everything is validated once, at load time: the format version, the
+# checksum of the estimator, and that the estimator's input width (and
+# feature names, when it has them) match the schema and the app's
+# selected_features.json. Numeric parameters are loaded memory-mapped by
+# default, so worker processes loading the same file share one copy of them.
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+ARTIFACT_FORMAT = "digital-mindset-model"
+ARTIFACT_VERSION = 1
+
+
+class ModelArtifact:
+    def __init__(self, estimator, features, value_ranges=None, metadata=None, checksum=None):
+        self.estimator = estimator
+        self.features = list(features)
+        self.value_ranges = dict(value_ranges or {})
+        self.metadata = dict(metadata or {})
+        self.checksum = checksum
+
+    # Per-feature [min, max] of a training matrix whose columns follow features
+    @staticmethod
+    def ranges_from_matrix(matrix, features):
+        matrix = np.asarray(matrix, dtype=float)
+        return {
+            feature: [float(low), float(high)]
+            for feature, low, high in zip(features, matrix.min(axis=0), matrix.max(axis=0))
+        }
+
+    def save(self, path):
+        import joblib
+        import sklearn
+
+        self.checksum = joblib.hash(self.estimator, coerce_mmap=True)
+        payload = {
+            "format": ARTIFACT_FORMAT,
+            "format_version": ARTIFACT_VERSION,
+            "estimator": self.estimator,
+            "features": self.features,
+            "value_ranges": self.value_ranges,
+            "metadata": {
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "estimator_class": f"{type(self.estimator).__module__}.{type(self.estimator).__name__}",
+                "sklearn_version": sklearn.__version__,
+                "numpy_version": np.__version__,
+                **self.metadata,
+            },
+            "checksum": self.checksum,
+        }
+        # Uncompressed, so the arrays inside can be memory-mapped on load
+        tmp_path = f"{path}.tmp"
+        joblib.dump(payload, tmp_path)
+        os.replace(tmp_path, path)
+        self.metadata = payload["metadata"]
+        return path
+
+    @classmethod
+    def load(cls, path, expected_features=None, mmap_mode="r", verify_checksum=True):
+        import joblib
+
+        payload = joblib.load(path, mmap_mode=mmap_mode)
+        if not isinstance(payload, dict) or payload.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"{path} is not a {ARTIFACT_FORMAT} artifact")
+        if payload.get("format_version") != ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported artifact version: {payload.get('format_version')!r}")
+
+        artifact = cls(payload["estimator"], payload["features"], payload["value_ranges"],
+                       payload["metadata"], payload["checksum"])
+        if verify_checksum and joblib.hash(artifact.estimator, coerce_mmap=True) != artifact.checksum:
+            raise ValueError(f"Checksum mismatch in {path}; the artifact is corrupt or was modified")
+        artifact.validate(expected_features)
+        return artifact
+
+    # Check that the estimator, the schema and the caller's feature order agree
+    def validate(self, expected_features=None):
+        if len(set(self.features)) != len(self.features):
+            raise ValueError("Artifact feature schema contains duplicate features")
+        n_features_in = getattr(self.estimator, "n_features_in_", None)
+        if n_features_in is not None and n_features_in != len(self.features):
+            raise ValueError(
+                f"Estimator expects {n_features_in} features but the schema lists {len(self.features)}"
+            )
+        feature_names_in = getattr(self.estimator, "feature_names_in_", None)
+        if feature_names_in is not None and list(feature_names_in) != self.features:
+            raise ValueError("Estimator feature names do not match the artifact schema")
+        if expected_features is not None and list(expected_features) != self.features:
+            missing = sorted(set(expected_features) - set(self.features))
+            extra = sorted(set(self.features) - set(expected_features))
+            detail = f"missing {missing}, unexpected {extra}" if missing or extra else "same features, different order"
+            raise ValueError(f"Artifact feature schema does not match selected_features.json: {detail}")
+
+    def describe(self):
+        return {
+            "features": len(self.features),
+            "checksum": self.checksum,
+            "metadata": self.metadata,
+        }
+
+
+# Bundle an existing model.pkl and selected_features.json into an artifact,
+# taking value ranges from the reference dataset
+def build_from_legacy(model_path, features_path, data_path, output_path):
+    import joblib
+    import pandas as pd
+
+    from dataset import file_checksum
+    from encoder import FeatureEncoder
+    from features import build_feature_matrix
+
+    with open(features_path, "r") as f:
+        features = json.load(f)
+    matrix = build_feature_matrix(pd.read_csv(data_path), FeatureEncoder(features))
+    artifact = ModelArtifact(
+        joblib.load(model_path),
+        features,
+        ModelArtifact.ranges_from_matrix(matrix, features),
+        {"source": os.path.basename(str(model_path)),
+         "training_data": os.path.basename(str(data_path)),
+         "training_data_sha256": file_checksum(data_path)},
+    )
+    artifact.validate()
+    return artifact.save(output_path)
+
+
+def main():
+    import warnings
+
+    from predictor import ARTIFACT_PATH, BASE_DIR, FEATURES_PATH
+
+    warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+    parser = argparse.ArgumentParser(description="Build or inspect a self-describing model artifact")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="bundle model.pkl and selected_features.json")
+    build_parser.add_argument("--model", default=str(BASE_DIR / "model.pkl"))
+    build_parser.add_argument("--features", default=str(FEATURES_PATH))
+    build_parser.add_argument("--data", default=str(BASE_DIR / "synthetic_digital_mindset_data.csv"),
+                              help="reference data for the value ranges")
+    build_parser.add_argument("--output", default=str(ARTIFACT_PATH))
+
+    inspect_parser = commands.add_parser("inspect", help="validate an artifact and print its metadata")
+    inspect_parser.add_argument("path", nargs="?", default=str(ARTIFACT_PATH))
+
+    args = parser.parse_args()
+    if args.command == "build":
+        path = build_from_legacy(args.model, args.features, args.data, args.output)
+        print(f"Artifact written to {path}")
+    else:
+        print(json.dumps(ModelArtifact.load(args.path).describe(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from tracing import tracer
+
+# Defaults: flush after 2 ms or 64 queued rows, whichever comes first
+MAX_BATCH_SIZE = 64
+MAX_WAIT_MS = 2.0
+
+
+# Gathers concurrent single-row predictions into one matrix so that
+# model.predict and the custom scorer run once per batch instead of once per
+# request. A single worker thread drains the queue: it waits for the first
+# row, then keeps collecting until max_batch_size rows are queued or
+# max_wait_ms has passed since that first row, so no request waits longer
+# than max_wait_ms plus one batch's compute time.
+#
+# submit() returns a concurrent.futures.Future, which Streamlit sessions can
+# block on with .result() and asyncio code can await via asyncio.wrap_future.
+class MicroBatcher:
+    def __init__(self, predictor, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    # Queue one encoded 1 x n_features row. Rows already in the predictor's
+    # score cache are answered immediately without joining a batch.
+    def submit(self, input_row):
+        if self._stopped.is_set():
+            raise RuntimeError("MicroBatcher has been closed")
+        future = Future()
+        cached = self.predictor.lookup(input_row)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+        self._queue.put((input_row, future))
+        return future
+
+    # Blocking predict; the batch's spans join the caller's trace
+    def predict(self, input_row):
+        future = self.submit(input_row)
+        result = future.result()
+        tracer.adopt(getattr(future, "spans", ()))
+        return result
+
+    def close(self):
+        self._stopped.set()
+        self._queue.put(None)
+        self._worker.join()
+
+    @property
+    def mean_batch_size(self):
+        return self.rows / self.batches if self.batches else 0.0
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                break
+
+            live = [(row, future) for row, future in batch if future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+            rows = [row for row, _ in live]
+            futures = [future for _, future in live]
+            tracer.start_trace()
+            try:
+                results = self.predictor.predict_array(np.vstack(rows), check_cache=False)
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                continue
+            finally:
+                spans = tracer.end_trace().spans
+
+            self.batches += 1
+            self.rows += len(rows)
+            for future, result in zip(futures, results):
+                future.spans = spans
+                future.set_result(result)
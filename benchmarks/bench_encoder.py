@@ -0,0 +1,90 @@
+# Micro-benchmark: per-prediction cost of the FeatureEncoder versus the
+# original dict -> DataFrame -> reindex -> .values path.
+#
+#   python -m benchmarks.bench_encoder [--repeat 2000]
+import argparse
+import json
+import timeit
+import warnings
+
+import joblib
+import pandas as pd
+
+from encoder import FeatureEncoder
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+SAMPLE_INPUT = {
+    "age": 30,
+    "years_in_role": 3,
+    "respondent_id": 1,
+    "growth_mindset_score": 50,
+    "limiting_beliefs_score": 30,
+    "training_hours_last_year": 40,
+    "leadership_score": 50,
+    "team_openness_score": 60,
+    "recent_failed_initiatives": 2,
+    "positive_feedback_percent": 70,
+    "Day": 15,
+    "Month": 6,
+    "Year": 2024,
+    "Quarter": 2,
+    "change_resistance_level": "Low",
+    "retention_intent": "Likely",
+    "Weekday": "Wednesday",
+    "Season": "Summer",
+}
+
+
+# The encoding path app.py used before FeatureEncoder existed
+def legacy_encode(inputs, selected_features):
+    user_input = {}
+    for feature in selected_features:
+        user_input[feature] = 0
+    for name, value in inputs.items():
+        if name in selected_features:
+            user_input[name] = value
+    for name in ("change_resistance_level", "retention_intent", "Weekday", "Season"):
+        key = f"{name}_{inputs[name]}"
+        if key in selected_features:
+            user_input[key] = 1
+    input_df = pd.DataFrame([user_input])
+    input_df = input_df.reindex(columns=selected_features, fill_value=0)
+    return input_df.values
+
+
+def per_call_us(func, repeat):
+    return min(timeit.repeat(func, number=repeat, repeat=5)) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feature encoding per prediction")
+    parser.add_argument("--repeat", type=int, default=2000, help="calls per timing run")
+    args = parser.parse_args()
+
+    model = joblib.load("model.pkl")
+    with open("selected_features.json", "r") as f:
+        selected_features = json.load(f)
+    encoder = FeatureEncoder(selected_features)
+
+    assert (legacy_encode(SAMPLE_INPUT, selected_features) == encoder.encode(SAMPLE_INPUT)).all()
+
+    results = {
+        "encode (pandas path)": per_call_us(
+            lambda: legacy_encode(SAMPLE_INPUT, selected_features), args.repeat),
+        "encode (FeatureEncoder)": per_call_us(
+            lambda: encoder.encode(SAMPLE_INPUT), args.repeat),
+        "encode + predict (pandas path)": per_call_us(
+            lambda: model.predict(legacy_encode(SAMPLE_INPUT, selected_features)), args.repeat),
+        "encode + predict (FeatureEncoder)": per_call_us(
+            lambda: model.predict(encoder.encode(SAMPLE_INPUT)), args.repeat),
+    }
+
+    for name, micros in results.items():
+        print(f"{name:<36} {micros:10.1f} us/prediction")
+    print(f"{'encoding speedup':<36} "
+          f"{results['encode (pandas path)'] / results['encode (FeatureEncoder)']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Micro-benchmark: per-rerun cost of rendering the score gauges, old path
+# (build a new Plotly figure every rerun) versus the cached templates in
+# charts.py. A "render" is building the figure plus what st.plotly_chart does
+# with it: convert it to a figure dict and serialize that to JSON. Streamlit
+# runs every rerun on a new script thread, so each render here does too.
+#
+#   python -m benchmarks.bench_gauge [--repeat 200]
+import argparse
+import json
+import threading
+import timeit
+
+import plotly.io as pio
+import plotly.tools
+
+from charts import build_gauge_chart, create_gauge_chart, frozen_gauge_chart
+
+# Scores cycled through for the live gauge, covering all three categories
+SCORES = [12.5, 38.0, 55.4, 69.9, 72.1, 94.0]
+
+SAMPLE_SCORE = 65
+
+
+def render(fig):
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+# Call `func` on a thread of its own, like one Streamlit rerun
+def on_new_thread(func):
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def per_call_ms(func, repeat):
+    return min(timeit.repeat(lambda: on_new_thread(func), number=repeat, repeat=5)) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gauge rendering per rerun")
+    parser.add_argument("--repeat", type=int, default=200, help="renders per timing run")
+    args = parser.parse_args()
+
+    # Same figure as a rebuild; key order in the JSON may differ
+    for score in SCORES + [SAMPLE_SCORE]:
+        assert json.loads(render(create_gauge_chart(score))) == json.loads(render(build_gauge_chart(score)))
+    assert json.loads(render(frozen_gauge_chart(SAMPLE_SCORE))) == json.loads(render(build_gauge_chart(SAMPLE_SCORE)))
+
+    scores = iter(SCORES * (args.repeat * 5 + 1))
+    results = {
+        "live gauge (rebuild)": per_call_ms(
+            lambda: render(build_gauge_chart(next(scores))), args.repeat),
+        "live gauge (template)": per_call_ms(
+            lambda: render(create_gauge_chart(next(scores))), args.repeat),
+        "sample preview (rebuild)": per_call_ms(
+            lambda: render(build_gauge_chart(SAMPLE_SCORE)), args.repeat),
+        "sample preview (frozen)": per_call_ms(
+            lambda: render(frozen_gauge_chart(SAMPLE_SCORE)), args.repeat),
+    }
+
+    for name, millis in results.items():
+        print(f"{name:<28} {millis:8.2f} ms/rerun")
+    print(f"{'live gauge speedup':<28} "
+          f"{results['live gauge (rebuild)'] / results['live gauge (template)']:8.1f}x")
+    print(f"{'sample preview speedup':<28} "
+          f"{results['sample preview (rebuild)'] / results['sample preview (frozen)']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Micro-benchmark: HistoryStore read and write cost at scale. Fills a
+# temporary database with --rows assessments spread over --respondents
+# respondents and two years, then times a respondent's history lookup (what
+# the Predict tab's trend chart loads), a week of daily counts, and queued
+# writes through record().
+#
+#   python -m benchmarks.bench_history [--rows 2000000 --respondents 12000]
+import argparse
+import json
+import os
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+from history import COLUMNS, HistoryStore, _connect
+
+TWO_YEARS = 2 * 365 * 24 * 3600
+
+
+def populate(path, rows, respondents, seed=0, chunk=200_000):
+    rng = np.random.default_rng(seed)
+    now = time.time()
+    inputs = json.dumps({"growth_mindset_score": 50, "leadership_score": 50})
+    connection = _connect(path)
+    insert = f"INSERT INTO assessments ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)"
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        respondent_ids = rng.integers(1, respondents + 1, n).tolist()
+        assessed_at = (now - rng.random(n) * TWO_YEARS).tolist()
+        scores = rng.uniform(20, 100, n).round(1).tolist()
+        with connection:
+            connection.executemany(insert, (
+                (respondent_id, at, score, 50.0, "Adopting", inputs)
+                for respondent_id, at, score in zip(respondent_ids, assessed_at, scores)
+            ))
+    connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--respondents", type=int, default=12_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "history.sqlite3")
+        HistoryStore(path).close()  # create the schema and indexes
+
+        started = time.perf_counter()
+        populate(path, args.rows, args.respondents)
+        fill_seconds = time.perf_counter() - started
+        size_mb = sum(
+            os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)
+        ) / 2 ** 20
+        print(f"Populated {args.rows:,} assessments for {args.respondents:,} respondents "
+              f"in {fill_seconds:.1f}s ({size_mb:,.0f} MB)")
+
+        store = HistoryStore(path)
+        rng = np.random.default_rng(1)
+        respondent_ids = iter(rng.integers(1, args.respondents + 1, args.repeat * 10).tolist())
+        history_ms = min(timeit.repeat(
+            lambda: store.history(next(respondent_ids), limit=500), number=args.repeat // 5, repeat=5
+        )) / (args.repeat // 5) * 1000
+        rows = len(store.history(1, limit=500))
+        print(f"history(respondent_id): {history_ms:.3f} ms per call (~{rows} rows per respondent)")
+
+        week_ago = time.time() - 7 * 24 * 3600
+        counts_ms = min(timeit.repeat(lambda: store.daily_counts(week_ago), number=20, repeat=5)) / 20 * 1000
+        print(f"daily_counts(last 7 days): {counts_ms:.3f} ms per call")
+
+        plan = store._reader().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM assessments WHERE respondent_id = ? ORDER BY assessed_at DESC", (1,)
+        ).fetchall()
+        print(f"Query plan: {plan[0][-1]}")
+
+        writes = 10_000
+        started = time.perf_counter()
+        for i in range(writes):
+            store.record(i % args.respondents + 1, {"growth_mindset_score": 50}, 72.5, 50.0, "Transforming")
+        queued_us = (time.perf_counter() - started) / writes * 1e6
+        store.flush()
+        total_seconds = time.perf_counter() - started
+        print(f"record(): {queued_us:.1f} us to queue; {writes:,} rows written in {total_seconds:.2f}s "
+              f"({store.batches} batches)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
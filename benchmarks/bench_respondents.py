@@ -0,0 +1,54 @@
+# Micro-benchmark: RespondentIndex build and lookup cost as the number of
+# respondents grows. Builds an index over --sizes synthetic respondents each
+# and times random ID lookups (what entering a Respondent ID in the sidebar
+# does), which should stay flat from thousands to millions of rows.
+#
+#   python -m benchmarks.bench_respondents [--sizes 12000 1000000 5000000]
+import argparse
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from respondents import RespondentIndex
+
+
+def synthetic_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "respondent_id": rng.permutation(rows) + 1,
+        "age": rng.integers(20, 61, rows),
+        "years_in_role": rng.integers(0, 15, rows),
+        "country": pd.Categorical(rng.choice(["India", "UK", "USA"], rows)),
+        "growth_mindset_score": rng.uniform(0, 100, rows).astype(np.float32),
+        "leadership_score": rng.uniform(0, 100, rows).astype(np.float32),
+        "change_resistance_level": pd.Categorical(rng.choice(["Low", "Medium", "High"], rows)),
+        "retention_intent": pd.Categorical(rng.choice(["Unlikely", "Likely"], rows)),
+        "digital_adoption_score": rng.uniform(20, 100, rows).astype(np.float32),
+        "survey_date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 540, rows), unit="D"),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[12_000, 1_000_000, 5_000_000])
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for rows in args.sizes:
+        frame = synthetic_frame(rows)
+        started = time.perf_counter()
+        index = RespondentIndex.from_frame(frame, "synthetic")
+        build_seconds = time.perf_counter() - started
+        del frame
+
+        ids = iter(np.random.default_rng(1).integers(1, rows + 1, args.lookups * 5).tolist())
+        lookup_us = min(timeit.repeat(
+            lambda: index.lookup(next(ids)), number=args.lookups, repeat=5
+        )) / args.lookups * 1e6
+        print(f"{rows:>10,} respondents: built in {build_seconds:6.2f}s, lookup {lookup_us:5.1f} us")
+
+
+if __name__ == "__main__":
+    main()
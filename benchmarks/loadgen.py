@@ -0,0 +1,111 @@
+# Load generator for service.py. Opens --concurrency keep-alive connections
+# and fires randomized respondents at /predict (or /predict/batch) for
+# --duration seconds, then reports requests per second and latency percentiles.
+#
+#   python service.py &
+#   python -m benchmarks.loadgen --concurrency 32 --duration 10
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def random_respondent(rng):
+    return {
+        "age": rng.randint(18, 80),
+        "years_in_role": rng.randint(0, 50),
+        "respondent_id": rng.randint(1, 12000),
+        "growth_mindset_score": rng.randint(0, 100),
+        "limiting_beliefs_score": rng.randint(0, 100),
+        "training_hours_last_year": rng.randint(0, 500),
+        "leadership_score": rng.randint(0, 100),
+        "team_openness_score": rng.randint(0, 100),
+        "recent_failed_initiatives": rng.randint(0, 20),
+        "positive_feedback_percent": rng.randint(0, 100),
+        "change_resistance_level": rng.choice(["Low", "Medium"]),
+        "retention_intent": rng.choice(["Very Unlikely", "Unlikely", "Likely", "Very Likely"]),
+        "Weekday": rng.choice(WEEKDAYS),
+        "Season": rng.choice(["Winter", "Summer", "Monsoon"]),
+    }
+
+
+async def post(reader, writer, host, path, payload):
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def worker(args, deadline, latencies, errors, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        while time.perf_counter() < deadline:
+            if args.batch_size > 1:
+                path = "/predict/batch"
+                payload = {"respondents": [random_respondent(rng) for _ in range(args.batch_size)]}
+            else:
+                path, payload = "/predict", random_respondent(rng)
+            started = time.perf_counter()
+            status = await post(reader, writer, args.host, path, payload)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(args):
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        worker(args, deadline, latencies, errors, seed)
+        for seed in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latency_ms = np.array(latencies) * 1000
+    requests = len(latency_ms)
+    print(f"Requests:     {requests:,} ({len(errors)} errors) in {elapsed:.1f}s")
+    print(f"Concurrency:  {args.concurrency}, batch size {args.batch_size}")
+    print(f"Throughput:   {requests / elapsed:,.0f} req/s "
+          f"({requests * args.batch_size / elapsed:,.0f} respondents/s)")
+    if requests:
+        p50, p99 = np.percentile(latency_ms, [50, 99])
+        print(f"Latency:      p50 {p50:.2f} ms, p99 {p99:.2f} ms, max {latency_ms.max():.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--concurrency", type=int, default=16, help="parallel connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="respondents per request; >1 uses /predict/batch")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
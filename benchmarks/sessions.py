@@ -0,0 +1,372 @@
+# Concurrent-session load test for app.py. For each session count in
+# --sessions it starts a fresh headless `streamlit run` server on this
+# machine and drives that many simulated assessors against it over
+# Streamlit's own websocket protocol, the same messages a browser sends.
+#
+#   python -m benchmarks.sessions                                   # 1, 2, 4 and 8 sessions, 30 s each
+#   python -m benchmarks.sessions --sessions 1 4 16 32 --think-time 2 --output capacity.json
+#
+# Each session repeatedly picks a new sidebar country (a full rerun), moves
+# the assessment sliders and selectboxes (form widgets: no rerun until
+# submit), clicks "Generate Digital Mindset Prediction" (a fragment rerun)
+# and presses Reset when the app shows it, pausing --think-time seconds
+# (jittered) between actions. Per session count it reports rerun latency
+# percentiles, the server's CPU use, and its memory growth per connected
+# session, then prints the capacity curve and the most sessions whose p95
+# rerun latency stays under --slo-ms. The client side runs in this process;
+# its own CPU use is reported too, since on a small box it competes with the
+# server.
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+from predictor import BASE_DIR
+
+APP_PATH = BASE_DIR / "app.py"
+
+# Widgets a session interacts with, by key
+SIDEBAR_SELECTBOXES = ("country_input", "industry_input", "job_role_input", "company_size_input")
+FORM_SLIDERS = ("growth_mindset", "leadership", "feedback", "limiting_beliefs", "team_openness")
+FORM_SELECTBOXES = ("change_resistance", "retention_intent", "weekday", "season")
+PREDICT_BUTTON = "predict_button"
+RESET_BUTTON = "reset_button"
+
+ACTIONS = ("initial_load", "sidebar_change", "predict", "reset")
+
+STARTUP_TIMEOUT = 120
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# A headless `streamlit run app.py` on a free local port
+class AppServer:
+    def __init__(self, port=None):
+        self.port = port or _free_port()
+        self.process = None
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def start(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+             "--server.headless", "true",
+             "--server.port", str(self.port),
+             "--server.enableXsrfProtection", "false",
+             "--server.fileWatcherType", "none",
+             "--browser.gatherUsageStats", "false"],
+            cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"streamlit exited with status {self.process.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"streamlit did not become healthy within {STARTUP_TIMEOUT}s")
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+# One simulated browser tab. It learns widget ids (and the fragment each
+# widget belongs to) from the elements the server sends, and sends back
+# widget states the way the frontend does: committed values on every rerun,
+# form values only when the form is submitted.
+class SessionClient:
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.widgets = {}   # key -> (element type, widget id, fragment id, element proto)
+        self.values = {}    # widget id -> WidgetState sent with every rerun
+        self.pending = {}   # uncommitted form values, sent on submit
+        self.rendered = set()
+        self.exceptions = 0
+        self._ws = None
+
+    async def connect(self):
+        import websockets
+
+        self._ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return await self.rerun()
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+
+    # Send one rerun request and wait for the script run to finish. Returns
+    # the latency in seconds and whether the run finished without an
+    # exception element or a compile error.
+    async def rerun(self, trigger=None):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.query_string = ""
+        states = dict(self.values)
+        if trigger is not None:
+            _, widget_id, fragment_id, _ = self.widgets[trigger]
+            states[widget_id] = WidgetState(id=widget_id, trigger_value=True)
+            if fragment_id:
+                client_state.fragment_id = fragment_id
+        client_state.widget_states.widgets.extend(states.values())
+
+        exceptions_before = self.exceptions
+        self.rendered = set()
+        started = time.perf_counter()
+        await self._ws.send(message.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self._ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                self._read_delta(forward.delta)
+            elif kind == "script_finished":
+                status = forward.script_finished
+                if status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                elapsed = time.perf_counter() - started
+                ok = status != ForwardMsg.FINISHED_WITH_COMPILE_ERROR and self.exceptions == exceptions_before
+                return elapsed, ok
+
+    def _read_delta(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        element_type = element.WhichOneof("type")
+        if element_type == "exception":
+            self.exceptions += 1
+            return
+        proto = getattr(element, element_type)
+        widget_id = getattr(proto, "id", "")
+        if widget_id.startswith("$$ID-"):
+            key = widget_id.split("-", 2)[2]
+            self.widgets[key] = (element_type, widget_id, delta.fragment_id, proto)
+            self.rendered.add(key)
+
+    def _stage(self, key, state, form):
+        (self.pending if form else self.values)[state.id] = state
+
+    def set_slider(self, key, form=True):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        _, widget_id, _, proto = self.widgets[key]
+        state = WidgetState(id=widget_id)
+        state.double_array_value.data[:] = [self.rng.randint(int(proto.min), int(proto.max))]
+        self._stage(key, state, form)
+
+    def set_selectbox(self, key, form=True):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        _, widget_id, _, proto = self.widgets[key]
+        state = WidgetState(id=widget_id, string_value=self.rng.choice(list(proto.options)))
+        self._stage(key, state, form)
+
+    def submit_form(self):
+        self.values.update(self.pending)
+        self.pending.clear()
+
+
+async def _pause(rng, think_time):
+    if think_time > 0:
+        await asyncio.sleep(rng.uniform(0.5, 1.5) * think_time)
+
+
+# One assessor working through the assessment until the deadline; appends
+# (action, seconds, ok) samples
+async def _session_loop(client, deadline, think_time, samples):
+    rng = client.rng
+    while time.perf_counter() < deadline:
+        await _pause(rng, think_time)
+        client.set_selectbox(rng.choice(SIDEBAR_SELECTBOXES), form=False)
+        samples.append(("sidebar_change", *await client.rerun()))
+
+        await _pause(rng, think_time)
+        for key in FORM_SLIDERS:
+            client.set_slider(key)
+        for key in FORM_SELECTBOXES:
+            client.set_selectbox(key)
+        client.submit_form()
+        samples.append(("predict", *await client.rerun(trigger=PREDICT_BUTTON)))
+
+        if RESET_BUTTON in client.rendered:
+            await _pause(rng, think_time)
+            samples.append(("reset", *await client.rerun(trigger=RESET_BUTTON)))
+
+
+def _percentiles(seconds):
+    if not seconds:
+        return {"count": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    p50, p95, p99 = np.percentile(np.array(seconds) * 1000, [50, 95, 99])
+    return {"count": len(seconds), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "max_ms": max(seconds) * 1000}
+
+
+async def _drive(url, sessions, duration, think_time, seed):
+    clients = [SessionClient(url, random.Random(seed + i)) for i in range(sessions)]
+    samples = []
+    connected = await asyncio.gather(*(client.connect() for client in clients))
+    samples.extend(("initial_load", seconds, ok) for seconds, ok in connected)
+
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_session_loop(client, deadline, think_time, samples) for client in clients))
+    return clients, samples
+
+
+# Run one session count against a fresh server and measure it
+def run_level(sessions, duration, think_time, seed=0):
+    import psutil
+
+    server = AppServer().start()
+    try:
+        server_process = psutil.Process(server.process.pid)
+        harness_process = psutil.Process()
+
+        # One session loads the model and fills the shared caches, so the
+        # level measures steady-state reruns rather than the cold start
+        async def warm_up():
+            client = SessionClient(server.url, random.Random(seed - 1))
+            await client.connect()
+            for key in FORM_SLIDERS:
+                client.set_slider(key)
+            client.submit_form()
+            await client.rerun(trigger=PREDICT_BUTTON)
+            await client.close()
+
+        asyncio.run(warm_up())
+        baseline_rss = server_process.memory_info().rss
+
+        psutil.cpu_percent(interval=None)
+        server_cpu = server_process.cpu_times()
+        harness_cpu = harness_process.cpu_times()
+        started = time.perf_counter()
+
+        async def measure():
+            clients, samples = await _drive(server.url, sessions, duration, think_time, seed)
+            rss = server_process.memory_info().rss  # every session still connected
+            await asyncio.gather(*(client.close() for client in clients))
+            return samples, rss
+
+        samples, loaded_rss = asyncio.run(measure())
+        elapsed = time.perf_counter() - started
+        system_cpu = psutil.cpu_percent(interval=None)
+        server_after, harness_after = server_process.cpu_times(), harness_process.cpu_times()
+    finally:
+        server.stop()
+
+    reruns = [seconds for action, seconds, _ in samples if action != "initial_load"]
+    return {
+        "sessions": sessions,
+        "seconds": elapsed,
+        "reruns": len(reruns),
+        "reruns_per_second": len(reruns) / elapsed,
+        "errors": sum(1 for _, _, ok in samples if not ok),
+        "latency": _percentiles(reruns),
+        "actions": {
+            action: _percentiles([seconds for name, seconds, _ in samples if name == action])
+            for action in ACTIONS
+        },
+        "server_cpu_cores": (server_after.user + server_after.system - server_cpu.user - server_cpu.system) / elapsed,
+        "harness_cpu_cores": (harness_after.user + harness_after.system - harness_cpu.user - harness_cpu.system) / elapsed,
+        "system_cpu_percent": system_cpu,
+        "baseline_rss_mb": baseline_rss / 2 ** 20,
+        "loaded_rss_mb": loaded_rss / 2 ** 20,
+        "rss_per_session_mb": (loaded_rss - baseline_rss) / 2 ** 20 / sessions,
+    }
+
+
+# Most sessions whose p95 rerun latency met the SLO without errors
+def capacity(levels, slo_ms):
+    passing = [
+        level["sessions"] for level in levels
+        if not level["errors"] and level["latency"]["p95_ms"] is not None and level["latency"]["p95_ms"] <= slo_ms
+    ]
+    return max(passing) if passing else None
+
+
+def _environment():
+    import streamlit
+
+    return {
+        "cpus": os.cpu_count(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+    }
+
+
+def _format_ms(value):
+    return f"{value:8.0f}" if value is not None else f"{'-':>8}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit app")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="concurrent session counts to measure, one fresh server each")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load per session count")
+    parser.add_argument("--think-time", type=float, default=1.0,
+                        help="mean pause between a session's actions, in seconds (0 for back-to-back)")
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="p95 rerun latency target for the capacity estimate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the capacity curve as JSON")
+    args = parser.parse_args()
+
+    levels = []
+    print(f"{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} "
+          f"{'server cpu':>10} {'rss MB':>8} {'MB/session':>10}")
+    for sessions in args.sessions:
+        level = run_level(sessions, args.duration, args.think_time, args.seed)
+        levels.append(level)
+        latency = level["latency"]
+        print(f"{sessions:>8} {level['reruns_per_second']:>9.2f} {_format_ms(latency['p50_ms'])} "
+              f"{_format_ms(latency['p95_ms'])} {_format_ms(latency['p99_ms'])} {level['errors']:>7} "
+              f"{level['server_cpu_cores'] * 100:>9.0f}% {level['loaded_rss_mb']:>8.0f} "
+              f"{level['rss_per_session_mb']:>10.2f}", flush=True)
+
+    supported = capacity(levels, args.slo_ms)
+    if supported is None:
+        print(f"No session count met p95 <= {args.slo_ms:.0f} ms")
+    else:
+        print(f"Capacity: {supported} concurrent sessions at p95 <= {args.slo_ms:.0f} ms "
+              f"(think time {args.think_time:g}s, {os.cpu_count()} CPUs)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "environment": _environment(),
+                "think_time": args.think_time,
+                "slo_ms": args.slo_ms,
+                "capacity_sessions": supported,
+                "levels": levels,
+            }, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# Benchmark suite for the prediction hot path and full-page reruns, with
+# stored baselines and per-case regression thresholds.
+#
+#   python -m benchmarks.suite                              # run, compare with the baseline
+#   python -m benchmarks.suite --output bench_output.json   # also write results as JSON
+#   python -m benchmarks.suite --only score --only gauge    # cases whose name contains these
+#   python -m benchmarks.suite --update-baseline            # store this run as the baseline
+#
+# Every case reports the best of several timing runs over several rounds
+# (less sensitive to noise than the mean) in microseconds per call. A case regresses when it is slower
+# than its baseline by more than its tolerance; the command then exits with
+# status 1 so CI can fail the build. The baseline stores the median of the
+# rounds' bests over at least BASELINE_ROUNDS rounds, a typical best rather
+# than the luckiest one, so a single round on an unchanged tree stays inside
+# the tolerance. Baselines are machine-specific: refresh them with
+# --update-baseline when the reference machine changes.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.bench_encoder import SAMPLE_INPUT
+from benchmarks.bench_gauge import render
+from predictor import BASE_DIR
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+BASELINE_PATH = BASE_DIR / "benchmarks" / "baseline.json"
+APP_PATH = BASE_DIR / "app.py"
+REFERENCE_CSV = BASE_DIR / "synthetic_digital_mindset_data.csv"
+
+BATCH_ROWS = 10_000
+TEAM_ROWS = 50_000
+
+# Default allowed slowdown over the baseline; noisier cases override it
+DEFAULT_TOLERANCE = 0.5
+
+# Cases of a few microseconds up to ~100 us swing the most with CPU frequency
+# and neighbouring load, so they get a wider margin
+MICRO_TOLERANCE = 1.0
+
+# Each measurement keeps timing runs of `number` calls for at least this long.
+# On shared or virtualized machines slow phases can last a second or more, and
+# the best run over a window that long is far steadier than a fixed few runs.
+MIN_MEASURE_SECONDS = 1.0
+
+# Fewest rounds a baseline is recorded from
+BASELINE_ROUNDS = 5
+
+
+def _time_us(func, number, repeat=5, min_seconds=MIN_MEASURE_SECONDS):
+    timer = timeit.Timer(func)
+    best, runs, started = float("inf"), 0, time.perf_counter()
+    while runs < repeat or time.perf_counter() - started < min_seconds:
+        best = min(best, timer.timeit(number))
+        runs += 1
+    return best / number * 1e6
+
+
+def _random_columns(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "age": rng.integers(18, 81, rows),
+        "years_in_role": rng.integers(0, 51, rows),
+        "respondent_id": rng.integers(1, 12001, rows),
+        "growth_mindset_score": rng.integers(0, 101, rows),
+        "limiting_beliefs_score": rng.integers(0, 101, rows),
+        "training_hours_last_year": rng.integers(0, 501, rows),
+        "leadership_score": rng.integers(0, 101, rows),
+        "team_openness_score": rng.integers(0, 101, rows),
+        "recent_failed_initiatives": rng.integers(0, 21, rows),
+        "positive_feedback_percent": rng.integers(0, 101, rows),
+        "Day": rng.integers(1, 29, rows),
+        "Month": rng.integers(1, 13, rows),
+        "Year": rng.integers(2020, 2031, rows),
+        "Quarter": rng.integers(1, 5, rows),
+        "change_resistance_level": rng.choice(["Low", "Medium"], rows),
+        "retention_intent": rng.choice(["Very Unlikely", "Unlikely", "Likely", "Very Likely"], rows),
+        "Weekday": rng.choice(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"], rows),
+        "Season": rng.choice(["Winter", "Summer", "Monsoon"], rows),
+    }
+
+
+# Headless run of app.py: one full script run, then the predict button
+def _app_predict_run():
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    app.run()
+    started = time.perf_counter()
+    next(button for button in app.button if button.key == "predict_button").click().run()
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise RuntimeError(f"app.py raised during the benchmark: {app.exception}")
+    return elapsed
+
+
+# name -> (description, tolerance, measure), where measure() returns the best
+# time per call in microseconds
+def _cases():
+    from charts import build_gauge_chart, create_gauge_chart, frozen_gauge_chart
+    from predictor import load_model_and_features
+    from scoring import score_batch
+
+    model, selected_features = load_model_and_features()
+    from encoder import FeatureEncoder
+    encoder = FeatureEncoder(selected_features)
+    row = encoder.encode(SAMPLE_INPUT)
+    columns = _random_columns(BATCH_ROWS)
+    batch = encoder.encode_batch(columns)
+
+    def csv_load():
+        import pandas as pd
+        return _time_us(lambda: pd.read_csv(REFERENCE_CSV), number=1)
+
+    def parquet_load():
+        from dataset import load_reference_data
+        load_reference_data()  # build the cache outside the timing
+        return _time_us(load_reference_data, number=1)
+
+    # TEAM_ROWS rows of the reference dataset, repeated as needed
+    def roster_frame():
+        import pandas as pd
+
+        reference = pd.read_csv(REFERENCE_CSV)
+        return pd.concat([reference] * -(-TEAM_ROWS // len(reference)), ignore_index=True).head(TEAM_ROWS)
+
+    # Team tab work for a 50k-member roster: parse, validate, score, aggregate, chart
+    def team_summary():
+        import io
+
+        from charts import build_team_distribution_chart
+        from percentiles import load_population_index
+        from team import read_roster, score_roster, summarize_team
+        from validation import ValidationReport
+
+        roster_csv = roster_frame().to_csv(index=False).encode()
+        population = load_population_index()
+
+        def assess():
+            scores = score_roster(read_roster(io.BytesIO(roster_csv)), encoder, ValidationReport())
+            build_team_distribution_chart(summarize_team(scores, population))
+
+        return _time_us(assess, number=1)
+
+    # Schema and range checks on a 50k-row upload, one row in 100 invalid
+    def validate():
+        from validation import ValidationReport, validate_frame
+
+        raw = roster_frame()
+        raw.loc[::100, "age"] = 200
+        return _time_us(lambda: validate_frame(raw, ValidationReport()), number=5)
+
+    def app_predict_run():
+        _app_predict_run()  # warm the shared caches and background loaders
+        return min(_app_predict_run() for _ in range(5)) * 1e6
+
+    return {
+        "encode_single": ("FeatureEncoder.encode, one respondent", MICRO_TOLERANCE,
+                          lambda: _time_us(lambda: encoder.encode(SAMPLE_INPUT), number=2000)),
+        "encode_batch_10k": ("FeatureEncoder.encode_batch, 10k respondents", DEFAULT_TOLERANCE,
+                             lambda: _time_us(lambda: encoder.encode_batch(columns), number=5)),
+        "score_single": ("custom scorer, one row", MICRO_TOLERANCE,
+                         lambda: _time_us(lambda: score_batch(row, selected_features), number=2000)),
+        "score_batch_10k": ("custom scorer, 10k rows", DEFAULT_TOLERANCE,
+                            lambda: _time_us(lambda: score_batch(batch, selected_features), number=20)),
+        "model_predict_single": ("model.predict, one row", DEFAULT_TOLERANCE,
+                                 lambda: _time_us(lambda: model.predict(row), number=500)),
+        "model_predict_10k": ("model.predict, 10k rows", DEFAULT_TOLERANCE,
+                              lambda: _time_us(lambda: model.predict(batch), number=20)),
+        "gauge_build": ("build_gauge_chart from scratch", DEFAULT_TOLERANCE,
+                        lambda: _time_us(lambda: build_gauge_chart(72.5), number=50)),
+        "gauge_template_render": ("create_gauge_chart + Streamlit serialization", DEFAULT_TOLERANCE,
+                                  lambda: _time_us(lambda: render(create_gauge_chart(72.5)), number=50)),
+        "gauge_frozen_render": ("frozen sample gauge + Streamlit serialization", DEFAULT_TOLERANCE,
+                                lambda: _time_us(lambda: render(frozen_gauge_chart(65)), number=50)),
+        "csv_load": ("pd.read_csv of the reference dataset", 0.75, csv_load),
+        "parquet_cache_load": ("reference dataset from the Parquet cache", 0.75, parquet_load),
+        "team_summary_50k": ("team roster of 50k: read, score, aggregate, chart", 0.75, team_summary),
+        "validate_50k": ("validate_frame, 50k rows", 0.75, validate),
+        "app_predict_run": ("app.py headless run with the predict button clicked", 1.0, app_predict_run),
+    }
+
+
+def _environment():
+    import sklearn
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# Measure every case `rounds` times, interleaved, and keep each case's best,
+# so a burst of background load only costs a round rather than a case
+def run_suite(only=None, rounds=3):
+    cases = {
+        name: case for name, case in _cases().items()
+        if not only or any(pattern in name for pattern in only)
+    }
+    timings = {name: [] for name in cases}
+    for _ in range(rounds):
+        for name, (_, _, measure) in cases.items():
+            timings[name].append(measure())
+
+    results = {}
+    for name, (description, tolerance, _) in cases.items():
+        results[name] = {
+            "description": description,
+            "us_per_call": min(timings[name]),
+            "median_us_per_call": float(np.median(timings[name])),
+            "tolerance": tolerance,
+        }
+    return {"environment": _environment(), "results": results}
+
+
+# Per-case comparison with a baseline run: {name: (baseline_us, ratio, regressed)}
+def compare(run, baseline):
+    comparison = {}
+    for name, result in run["results"].items():
+        base = baseline["results"].get(name) if baseline else None
+        if base is None:
+            comparison[name] = (None, None, False)
+            continue
+        ratio = result["us_per_call"] / base["us_per_call"]
+        comparison[name] = (base["us_per_call"], ratio, ratio > 1 + result["tolerance"])
+    return comparison
+
+
+def _format_us(micros):
+    if micros >= 1e6:
+        return f"{micros / 1e6:9.2f} s "
+    if micros >= 1e3:
+        return f"{micros / 1e3:9.2f} ms"
+    return f"{micros:9.1f} us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prediction hot path and full-page reruns")
+    parser.add_argument("--output", help="write this run's results as JSON")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline results to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--only", action="append", help="run cases whose name contains this (repeatable)")
+    parser.add_argument("--rounds", type=int, default=3, help="measurements per case; the best is kept "
+                        f"(at least {BASELINE_ROUNDS} with --update-baseline)")
+    args = parser.parse_args()
+
+    rounds = max(args.rounds, BASELINE_ROUNDS) if args.update_baseline else args.rounds
+    run = run_suite(args.only, rounds)
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    comparison = compare(run, baseline)
+
+    regressions = []
+    for name, result in run["results"].items():
+        base_us, ratio, regressed = comparison[name]
+        result["baseline_us_per_call"] = base_us
+        result["ratio"] = ratio
+        result["regressed"] = regressed
+        verdict = "no baseline" if ratio is None else f"{ratio:5.2f}x baseline"
+        if regressed:
+            verdict += f"  REGRESSION (> {1 + result['tolerance']:.2f}x)"
+            regressions.append(name)
+        print(f"{name:<24} {_format_us(result['us_per_call'])}   {verdict}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+            f.write("\n")
+    if args.update_baseline:
+        merged = baseline if baseline and args.only else {"results": {}}
+        merged["environment"] = run["environment"]
+        merged["results"].update({
+            name: {
+                "description": result["description"],
+                "us_per_call": result["median_us_per_call"],
+                "tolerance": result["tolerance"],
+            }
+            for name, result in run["results"].items()
+        })
+        with open(args.baseline, "w") as f:
+            json.dump(merged, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+
+    if regressions and not args.update_baseline:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
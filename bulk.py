@@ -0,0 +1,55 @@
+from scoring import score_batch
+from validation import ValidationReport, validate_frame
+
+# Rows parsed and scored at a time; bounds peak memory regardless of file size
+CHUNK_SIZE = 50_000
+
+SCORE_COLUMN = "digital_mindset_score"
+MODEL_COLUMN = "model_prediction"
+
+
+# Append the custom score and the raw model output to a chunk of survey rows.
+# Rows failing validation (see validation.py) are left out and recorded in
+# `report`; `first_row` numbers the chunk's rows within its file.
+def score_frame(raw, model, encoder, report=None, first_row=1):
+    import pandas as pd
+
+    inputs, valid = validate_frame(raw, report if report is not None else ValidationReport(), first_row)
+    scored = raw[valid].copy() if not valid.all() else raw.copy()
+    if not len(scored):
+        return scored.assign(**{SCORE_COLUMN: pd.Series(dtype=float), MODEL_COLUMN: pd.Series(dtype=float)})
+    input_array = encoder.encode_batch(inputs)
+    scored[SCORE_COLUMN] = score_batch(input_array, encoder.selected_features).round(2)
+    scored[MODEL_COLUMN] = model.predict(input_array).round(2)
+    return scored
+
+
+# Stream a survey CSV through the scorer chunk by chunk, writing scored rows
+# to `destination` (a path or text file handle) as they are produced.
+# `progress_callback(fraction, rows_scored)` is called after every chunk, and
+# `chunk_callback(scored)` with every scored chunk. Rejected rows are counted
+# in `report`, a validation.ValidationReport, when one is given.
+def score_csv_in_chunks(source, destination, model, encoder,
+                        chunksize=CHUNK_SIZE, progress_callback=None, chunk_callback=None,
+                        report=None):
+    import pandas as pd
+
+    total_bytes = getattr(source, "size", None)
+    report = report if report is not None else ValidationReport()
+    rows_scored = 0
+
+    for chunk_number, chunk in enumerate(pd.read_csv(source, chunksize=chunksize)):
+        scored = score_frame(chunk, model, encoder, report, first_row=report.rows + 1)
+        scored.to_csv(destination, mode="w" if chunk_number == 0 else "a",
+                      header=chunk_number == 0, index=False)
+        rows_scored += len(scored)
+        if chunk_callback is not None:
+            chunk_callback(scored)
+
+        if progress_callback is not None:
+            fraction = None
+            if total_bytes and hasattr(source, "tell"):
+                fraction = min(source.tell() / total_bytes, 1.0)
+            progress_callback(fraction, rows_scored)
+
+    return rows_scored
@@ -0,0 +1,206 @@
+import functools
+
+from scoring import score_category
+from tracing import span
+
+CATEGORY_COLORS = {
+    "Developing": "#EF4444",  # Red
+    "Adopting": "#F59E0B",  # Yellow
+    "Transforming": "#10B981",  # Green
+}
+
+GAUGE_TITLE = (
+    "<span style='font-size:1.1em'>Digital Mindset Score</span><br>"
+    "<span style='font-size:0.7em;color:#94A3B8'>(out of 100)</span><br>"
+    "<span style='font-size:0.8em;color:{color}'>{category}</span>"
+)
+
+
+def _gauge_colors(value):
+    category = score_category(value)
+    return CATEGORY_COLORS[category], category
+
+
+# Build a complete gauge figure from scratch: steps, axis, threshold and theme
+def build_gauge_chart(value):
+    import plotly.graph_objects as go  # deferred until the first chart
+
+    color, category = _gauge_colors(value)
+
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': GAUGE_TITLE.format(color=color, category=category)},
+        delta = {'reference': 50},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': color},
+            'steps': [
+                {'range': [0, 40], 'color': "rgba(239, 68, 68, 0.2)"},
+                {'range': [40, 70], 'color': "rgba(245, 158, 11, 0.2)"},
+                {'range': [70, 100], 'color': "rgba(16, 185, 129, 0.2)"}
+            ],
+            'threshold': {
+                'line': {'color': "white", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={'color': "#E2E8F0", 'family': "Inter"},
+        height=350
+    )
+
+    return fig
+
+
+# Serialized gauge spec for one value, built once per process. Streamlit runs
+# every rerun on a fresh thread, so anything cached per thread would always
+# be cold.
+@functools.lru_cache(maxsize=8)
+def _gauge_spec(value):
+    return build_gauge_chart(value).to_dict()
+
+
+# A new Figure from a spec serialized from a validated figure. Validating it
+# again is what makes rebuilding the gauge slow, so it is skipped; the Figure
+# still deep-copies the spec, so no two figures share any part of it.
+def _figure_from_spec(spec):
+    import plotly.graph_objects as go
+
+    return go.Figure(spec, _validate=False)
+
+
+# Gauge for a live score: the cached spec with the value, bar color and
+# category title patched in
+def create_gauge_chart(value):
+    with span("gauge_build"):
+        spec = _gauge_spec(0)
+        color, category = _gauge_colors(value)
+        indicator = spec["data"][0]
+        gauge = indicator["gauge"]
+        indicator = dict(
+            indicator,
+            value=value,
+            gauge=dict(gauge, bar=dict(gauge["bar"], color=color)),
+            title=dict(indicator["title"], text=GAUGE_TITLE.format(color=color, category=category)),
+        )
+        return _figure_from_spec(dict(spec, data=[indicator]))
+
+
+# Gauge for a fixed value, such as the placeholder preview, from its cached spec
+def frozen_gauge_chart(value):
+    with span("gauge_build"):
+        return _figure_from_spec(_gauge_spec(value))
+
+
+# Score-vs-lever curves of a what-if sweep (see sensitivity.py), one line per
+# lever. Levers have different ranges, so the x axis is the position within
+# each lever's range and the hover shows the actual input value.
+def build_sensitivity_chart(sweep):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for curve in sweep["curves"].values():
+        values = curve["values"]
+        fig.add_trace(go.Scatter(
+            x=(values - values[0]) / (values[-1] - values[0]) * 100,
+            y=curve["scores"],
+            customdata=values,
+            mode="lines",
+            name=curve["label"],
+            hovertemplate="%{customdata} → %{y:.1f}<extra>" + curve["label"] + "</extra>"
+        ))
+    fig.add_hline(y=sweep["score"], line_dash="dot", line_color="#94A3B8")
+
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={'color': "#E2E8F0", 'family': "Inter"},
+        height=380,
+        margin={'l': 10, 'r': 10, 't': 10, 'b': 10},
+        xaxis={'title': "Position in input range (%)", 'gridcolor': "#334155"},
+        yaxis={'title': "Digital Mindset Score", 'gridcolor': "#334155"},
+        legend={'orientation': "h", 'y': -0.25}
+    )
+
+    return fig
+
+
+# A respondent's score over their stored assessments (see history.py), with
+# the category bands behind it
+def build_history_chart(history):
+    from datetime import datetime
+
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for low, high, color in ((0, 40, CATEGORY_COLORS["Developing"]),
+                             (40, 70, CATEGORY_COLORS["Adopting"]),
+                             (70, 100, CATEGORY_COLORS["Transforming"])):
+        fig.add_hrect(y0=low, y1=high, fillcolor=color, opacity=0.08, line_width=0)
+    fig.add_trace(go.Scatter(
+        x=[datetime.fromtimestamp(entry["assessed_at"]) for entry in history],
+        y=[entry["score"] for entry in history],
+        mode="lines+markers",
+        line={'color': "#6366F1", 'width': 3},
+        marker={'size': 8},
+        hovertemplate="%{x|%Y-%m-%d %H:%M} → %{y:.1f}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={'color': "#E2E8F0", 'family': "Inter"},
+        height=300,
+        margin={'l': 10, 'r': 10, 't': 10, 'b': 10},
+        xaxis={'gridcolor': "#334155"},
+        yaxis={'title': "Digital Mindset Score", 'range': [0, 100], 'gridcolor': "#334155"},
+        showlegend=False
+    )
+
+    return fig
+
+
+# Score distribution of a team next to the reference population, as the
+# share of people per score bin (see team.py), with the category bands behind
+def build_team_distribution_chart(summary):
+    import plotly.graph_objects as go
+
+    edges = summary["distribution"]["edges"]
+    centers = (edges[:-1] + edges[1:]) / 2
+    bin_labels = [f"{low:.0f}–{high:.0f}" for low, high in zip(edges[:-1], edges[1:])]
+    fig = go.Figure()
+    for low, high, color in ((0, 40, CATEGORY_COLORS["Developing"]),
+                             (40, 70, CATEGORY_COLORS["Adopting"]),
+                             (70, 100, CATEGORY_COLORS["Transforming"])):
+        fig.add_vrect(x0=low, x1=high, fillcolor=color, opacity=0.08, line_width=0)
+    for name, key, color in (("Team", "team", "#6366F1"), ("Reference population", "population", "#94A3B8")):
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=summary["distribution"][key],
+            width=(edges[1] - edges[0]) * 0.4,
+            name=name,
+            marker_color=color,
+            customdata=bin_labels,
+            hovertemplate="%{customdata}: %{y:.1f}%<extra>" + name + "</extra>"
+        ))
+
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font={'color': "#E2E8F0", 'family': "Inter"},
+        height=340,
+        barmode="group",
+        margin={'l': 10, 'r': 10, 't': 10, 'b': 10},
+        xaxis={'title': "Digital Mindset Score", 'range': [0, 100], 'gridcolor': "#334155"},
+        yaxis={'title': "Share of people (%)", 'gridcolor': "#334155"},
+        legend={'orientation': "h", 'y': -0.25}
+    )
+
+    return fig
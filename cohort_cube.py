@@ -0,0 +1,222 @@
+import itertools
+import threading
+
+import numpy as np
+
+# Dimensions the cube can be sliced by
+DIMENSIONS = ["country", "industry", "job_role", "company_size", "education_level"]
+
+# Measures summarized in every cell, with fixed histogram bin edges. Fixed
+# edges keep the histograms mergeable, which is what lets appended rows be
+# added to a cell without revisiting the rows already counted.
+MEASURES = {
+    "digital_mindset_score": np.linspace(0, 100, 51),
+    "growth_mindset_score": np.linspace(0, 100, 26),
+    "limiting_beliefs_score": np.linspace(0, 100, 26),
+    "leadership_score": np.linspace(0, 100, 26),
+    "team_openness_score": np.linspace(0, 100, 26),
+    "positive_feedback_percent": np.linspace(0, 100, 26),
+    "training_hours_last_year": np.concatenate([np.arange(0, 60, 2), [60, 80, 100, 150, 200, 300, 500]]),
+    "recent_failed_initiatives": np.arange(0, 21),
+    "age": np.arange(18, 82, 2),
+    "years_in_role": np.concatenate([np.arange(0, 21), [25, 30, 40, 50]]),
+}
+
+QUANTILES = [0.25, 0.5, 0.75]
+
+# Every combination of sliced / rolled-up dimensions (2^5 grouping sets)
+GROUPING_SETS = [
+    combo for r in range(len(DIMENSIONS) + 1)
+    for combo in itertools.combinations(range(len(DIMENSIONS)), r)
+]
+
+
+# Aggregate cube over every combination of DIMENSIONS. Each cell keeps the
+# row count, sums, sums of squares, min/max and a histogram per measure, so a
+# lookup is one dict access plus arithmetic on a single cell, and update()
+# folds in new rows without a rebuild.
+#
+# Cells are keyed by a tuple with one entry per dimension: a label, or None
+# for "all values".
+class CohortCube:
+    def __init__(self, capacity=1024):
+        self.measures = list(MEASURES)
+        self._edges = [MEASURES[name] for name in self.measures]
+        self._offsets = np.concatenate([[0], np.cumsum([len(e) - 1 for e in self._edges])])
+        self.cells = {}
+        self.rows = 0
+        self._labels = {dim: set() for dim in DIMENSIONS}
+        self._lock = threading.Lock()
+        # Held by refresh_cohort_cube from reading `source` to storing the new one
+        self._refresh_lock = threading.Lock()
+
+        n_measures, n_bins = len(self.measures), int(self._offsets[-1])
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._sum = np.zeros((capacity, n_measures))
+        self._sumsq = np.zeros((capacity, n_measures))
+        self._min = np.full((capacity, n_measures), np.inf)
+        self._max = np.full((capacity, n_measures), -np.inf)
+        self._hist = np.zeros((capacity, n_bins), dtype=np.uint32)
+
+    # Enlarge the cell arrays (by at least 25%) so `needed` cells fit
+    def _grow(self, needed):
+        capacity = len(self._count)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity + capacity // 4)
+        for name, fill in [("_count", 0), ("_sum", 0.0), ("_sumsq", 0.0),
+                           ("_min", np.inf), ("_max", -np.inf), ("_hist", 0)]:
+            old = getattr(self, name)
+            new = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    @classmethod
+    def from_frame(cls, frame):
+        cube = cls()
+        cube.update(frame)
+        return cube
+
+    # Fold new rows (a DataFrame with DIMENSIONS and MEASURES columns) into
+    # every cell they belong to
+    def update(self, frame):
+        if len(frame) == 0:
+            return
+        values = np.column_stack([frame[name].to_numpy(dtype=float) for name in self.measures])
+        bins = np.column_stack([
+            np.clip(np.searchsorted(edges, values[:, i], side="right") - 1, 0, len(edges) - 2)
+            + self._offsets[i]
+            for i, edges in enumerate(self._edges)
+        ])
+
+        # Factorize every dimension once; a row's cell in each grouping set is
+        # then determined by the codes of the dimensions that set keeps
+        labels, codes = [], []
+        for dim in DIMENSIONS:
+            dim_labels, dim_codes = np.unique(frame[dim].astype(str).to_numpy(), return_inverse=True)
+            labels.append(dim_labels)
+            codes.append(dim_codes.reshape(-1))
+        codes = np.column_stack(codes)
+
+        with self._lock:
+            for dim, dim_labels in zip(DIMENSIONS, labels):
+                self._labels[dim].update(str(label) for label in dim_labels)
+            for kept in GROUPING_SETS:
+                self._accumulate(kept, labels, codes, values, bins)
+
+            self.rows += len(frame)
+
+    # Add one grouping set's per-cell aggregates. Rows are grouped by a single
+    # mixed-radix code over the kept dimensions, and each aggregate is one
+    # bincount / reduceat pass instead of a per-row scatter.
+    def _accumulate(self, kept, labels, codes, values, bins):
+        radices = [len(labels[d]) for d in kept]
+        combined = np.zeros(len(values), dtype=np.int64)
+        for d, radix in zip(kept, radices):
+            combined = combined * radix + codes[:, d]
+        combos, row_combo = np.unique(combined, return_inverse=True)
+        row_combo = row_combo.reshape(-1)
+        n_combos, n_bins = len(combos), self._hist.shape[1]
+
+        combo_codes = np.unravel_index(combos, radices) if kept else ()
+        cell_ids = np.empty(n_combos, dtype=np.int64)
+        for j in range(n_combos):
+            key = [None] * len(DIMENSIONS)
+            for d, dim_codes in zip(kept, combo_codes):
+                key[d] = str(labels[d][dim_codes[j]])
+            key = tuple(key)
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = len(self.cells)
+                self.cells[key] = cell
+            cell_ids[j] = cell
+        self._grow(len(self.cells))
+
+        order = np.argsort(row_combo, kind="stable")
+        starts = np.searchsorted(row_combo[order], np.arange(n_combos))
+        sorted_values = values[order]
+
+        self._count[cell_ids] += np.bincount(row_combo, minlength=n_combos)
+        for i in range(values.shape[1]):
+            self._sum[cell_ids, i] += np.bincount(row_combo, weights=values[:, i], minlength=n_combos)
+            self._sumsq[cell_ids, i] += np.bincount(row_combo, weights=values[:, i] ** 2, minlength=n_combos)
+        self._min[cell_ids] = np.minimum(self._min[cell_ids], np.minimum.reduceat(sorted_values, starts, axis=0))
+        self._max[cell_ids] = np.maximum(self._max[cell_ids], np.maximum.reduceat(sorted_values, starts, axis=0))
+        flat_bins = (row_combo[:, None] * n_bins + bins).ravel()
+        self._hist[cell_ids] += np.bincount(flat_bins, minlength=n_combos * n_bins).reshape(n_combos, n_bins).astype(np.uint32)
+
+    @staticmethod
+    def key(**slices):
+        unknown = set(slices) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {', '.join(sorted(unknown))}")
+        return tuple(slices.get(dim) for dim in DIMENSIONS)
+
+    def _quantiles(self, cell, i):
+        edges = self._edges[i]
+        hist = self._hist[cell, self._offsets[i]:self._offsets[i + 1]].astype(float)
+        cumulative = np.cumsum(hist)
+        results = []
+        for q in QUANTILES:
+            target = q * cumulative[-1]
+            b = int(np.searchsorted(cumulative, target, side="left"))
+            below = cumulative[b - 1] if b > 0 else 0.0
+            fraction = (target - below) / hist[b] if hist[b] else 0.0
+            estimate = edges[b] + fraction * (edges[b + 1] - edges[b])
+            results.append(float(np.clip(estimate, self._min[cell, i], self._max[cell, i])))
+        return results
+
+    # Statistics for one cell, e.g. stats(country="India", job_role="Manager");
+    # dimensions left out are rolled up. Returns None for an empty cohort.
+    def stats(self, **slices):
+        with self._lock:
+            cell = self.cells.get(self.key(**slices))
+            if cell is None:
+                return None
+            count = int(self._count[cell])
+            mean = self._sum[cell] / count
+            variance = np.maximum(self._sumsq[cell] / count - mean ** 2, 0.0)
+            summary = {}
+            for i, name in enumerate(self.measures):
+                p25, p50, p75 = self._quantiles(cell, i)
+                summary[name] = {
+                    "mean": float(mean[i]),
+                    "std": float(np.sqrt(variance[i])),
+                    "min": float(self._min[cell, i]),
+                    "p25": p25,
+                    "median": p50,
+                    "p75": p75,
+                    "max": float(self._max[cell, i]),
+                }
+            return {"count": count, "measures": summary}
+
+    # Labels seen so far for one dimension, for building drilldown menus
+    def labels(self, dimension):
+        with self._lock:
+            return sorted(self._labels[dimension])
+
+
+def load_cohort_cube():
+    from dataset import REFERENCE_CSV, csv_state, load_scored_reference_data  # deferred: pulls in pandas
+
+    cube = CohortCube.from_frame(load_scored_reference_data())
+    cube.source = csv_state(REFERENCE_CSV)
+    return cube
+
+
+# Fold survey rows appended to the reference CSV since the cube was built into
+# the cube. Returns False when the file was rewritten rather than appended to,
+# in which case the caller should rebuild the cube.
+def refresh_cohort_cube(cube):
+    from dataset import REFERENCE_CSV, read_appended_rows, score_rows
+
+    # One session at a time, or two could fold in the same appended rows
+    with cube._refresh_lock:
+        appended = read_appended_rows(REFERENCE_CSV, cube.source)
+        if appended is None:
+            return False
+        rows, source = appended
+        if len(rows):
+            cube.update(score_rows(rows))
+        cube.source = source
+    return True
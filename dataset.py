@@ -0,0 +1,211 @@
+# Columnar cache of the reference survey data.
+#
+# The CSV is converted once into a Parquet file with categorical codes,
+# downcast numerics and a parsed survey_date. The SHA-256 of the source CSV is
+# stored in the Parquet metadata and the cache is rebuilt whenever it no
+# longer matches.
+#
+#   python dataset.py          # build the cache and compare it with the CSV
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from encoder import FeatureEncoder
+from features import build_feature_matrix
+from predictor import BASE_DIR, load_selected_features
+from scoring import score_batch
+
+REFERENCE_CSV = BASE_DIR / "synthetic_digital_mindset_data.csv"
+CACHE_DIR = BASE_DIR / ".cache"
+
+CHECKSUM_KEY = b"source_sha256"
+
+CATEGORICAL_COLUMNS = [
+    "gender",
+    "country",
+    "education_level",
+    "industry",
+    "job_role",
+    "company_size",
+    "ai_usage_frequency",
+    "change_resistance_level",
+    "retention_intent",
+]
+
+DATE_COLUMN = "survey_date"
+
+SCORE_COLUMN = "digital_mindset_score"
+
+# Held while the cache is checked and (re)built, so loaders started together
+# on a cold start build it once instead of racing each other
+_cache_lock = threading.Lock()
+
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path_for(csv_path):
+    return CACHE_DIR / f"{os.path.splitext(os.path.basename(csv_path))[0]}.parquet"
+
+
+# Shrink a raw survey frame: categories for text columns, the smallest
+# integer type that fits, float32 for the scores and a real datetime column
+def compact_frame(raw):
+    frame = raw.copy()
+    for col in CATEGORICAL_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].astype("category")
+    for col in frame.select_dtypes("integer").columns:
+        frame[col] = pd.to_numeric(frame[col], downcast="integer")
+    for col in frame.select_dtypes("float").columns:
+        frame[col] = frame[col].astype("float32")
+    if DATE_COLUMN in frame.columns:
+        frame[DATE_COLUMN] = pd.to_datetime(frame[DATE_COLUMN])
+    return frame
+
+
+def _cached_checksum(cache_path):
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except (OSError, ValueError):
+        return None
+    checksum = metadata.get(CHECKSUM_KEY)
+    return checksum.decode() if checksum else None
+
+
+def build_cache(csv_path=REFERENCE_CSV, cache_path=None, checksum=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cache_path = cache_path or cache_path_for(csv_path)
+    checksum = checksum or file_checksum(csv_path)
+    table = pa.Table.from_pandas(compact_frame(pd.read_csv(csv_path)), preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        CHECKSUM_KEY: checksum.encode(),
+    })
+
+    # Written under a unique name and renamed into place, so readers never see
+    # a partial file and concurrent builders (other processes) can't collide
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".parquet.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pq.write_table(table, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return cache_path
+
+
+# Load the reference dataset from its columnar cache, (re)building the cache
+# first if it is missing or the CSV has changed. Falls back to parsing the
+# CSV directly when pyarrow is not installed.
+def load_reference_data(csv_path=REFERENCE_CSV, columns=None):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        frame = compact_frame(pd.read_csv(csv_path))
+        return frame[columns] if columns is not None else frame
+
+    cache_path = cache_path_for(csv_path)
+    checksum = file_checksum(csv_path)
+    with _cache_lock:
+        if _cached_checksum(cache_path) != checksum:
+            build_cache(csv_path, cache_path, checksum)
+    return pd.read_parquet(cache_path, columns=columns)
+
+
+# Add the custom score of every row, computed in one batch pass
+def score_rows(frame):
+    encoder = FeatureEncoder(load_selected_features())
+    input_array = build_feature_matrix(frame, encoder)
+    frame[SCORE_COLUMN] = score_batch(input_array, encoder.selected_features)
+    return frame
+
+
+def load_scored_reference_data(csv_path=REFERENCE_CSV):
+    return score_rows(load_reference_data(csv_path))
+
+
+# Snapshot of a CSV used to detect appends: size, mtime and a digest of the
+# bytes seen so far
+def csv_state(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime, "checksum": file_checksum(csv_path)}
+
+
+def _prefix_checksum(path, length):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(1024 * 1024, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+# Rows appended to a CSV since `state` was taken, plus the new state. Returns
+# None when earlier bytes changed, i.e. the file was rewritten rather than
+# appended to.
+def read_appended_rows(csv_path, state):
+    stat = os.stat(csv_path)
+    if stat.st_size == state["size"] and stat.st_mtime == state["mtime"]:
+        return pd.DataFrame(), state
+    if stat.st_size < state["size"] or _prefix_checksum(csv_path, state["size"]) != state["checksum"]:
+        return None
+
+    with open(csv_path, "rb") as f:
+        header = f.readline()
+        f.seek(state["size"])
+        tail = f.read()
+    rows = compact_frame(pd.read_csv(io.BytesIO(header + tail)))
+    return rows, csv_state(csv_path)
+
+
+# Best of a few runs, so one-off import costs don't skew the comparison
+def _measure(label, load, runs=5):
+    seconds = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        frame = load()
+        seconds = min(seconds, time.perf_counter() - started)
+    megabytes = frame.memory_usage(deep=True).sum() / 1024 / 1024
+    print(f"{label:<22} {seconds * 1000:8.1f} ms {megabytes:8.2f} MB in memory")
+    return seconds, megabytes
+
+
+def main():
+    cache_path = build_cache()
+    print(f"Cache written to {cache_path} "
+          f"({os.path.getsize(cache_path) / 1024:.0f} KB, "
+          f"CSV {os.path.getsize(REFERENCE_CSV) / 1024:.0f} KB)")
+
+    csv_seconds, csv_mb = _measure(
+        "CSV (pd.read_csv)",
+        lambda: pd.read_csv(REFERENCE_CSV).assign(
+            survey_date=lambda df: pd.to_datetime(df[DATE_COLUMN])))
+    cache_seconds, cache_mb = _measure("Parquet cache", load_reference_data)
+    print(f"Load time {csv_seconds / cache_seconds:.1f}x faster, "
+          f"memory {csv_mb / cache_mb:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
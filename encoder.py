@@ -0,0 +1,107 @@
+import numpy as np
+
+# Raw inputs that map one-to-one onto a model feature
+NUMERIC_INPUTS = [
+    "respondent_id",
+    "age",
+    "years_in_role",
+    "growth_mindset_score",
+    "limiting_beliefs_score",
+    "training_hours_last_year",
+    "leadership_score",
+    "team_openness_score",
+    "recent_failed_initiatives",
+    "positive_feedback_percent",
+    "Day",
+    "Month",
+    "Year",
+    "Quarter",
+]
+
+# Raw categorical inputs; each category becomes the one-hot feature
+# "<input>_<category>" when that feature was selected for the model
+ONE_HOT_INPUTS = [
+    "change_resistance_level",
+    "retention_intent",
+    "Weekday",
+    "Season",
+]
+
+
+# Maps raw inputs straight to fixed column indices of the model's feature
+# vector. Built once from selected_features.json so that encoding a request
+# is a handful of array writes instead of dict -> DataFrame -> reindex.
+class FeatureEncoder:
+    def __init__(self, selected_features):
+        self.selected_features = list(selected_features)
+        self.n_features = len(self.selected_features)
+        position = {feature: i for i, feature in enumerate(self.selected_features)}
+
+        self.numeric_index = {
+            name: position[name] for name in NUMERIC_INPUTS if name in position
+        }
+        self.one_hot_index = {}
+        for name in ONE_HOT_INPUTS:
+            prefix = f"{name}_"
+            self.one_hot_index[name] = {
+                feature[len(prefix):]: i
+                for feature, i in position.items() if feature.startswith(prefix)
+            }
+
+        # Flat (input, category, column) triples for the batch path
+        self._one_hot_columns = [
+            (name, category, i)
+            for name, categories in self.one_hot_index.items()
+            for category, i in categories.items()
+        ]
+
+    def empty(self, n_rows=1):
+        return np.zeros((n_rows, self.n_features))
+
+    # Encode one respondent given as {input name: value} into a 1 x n_features
+    # array. Inputs the model does not use are ignored; unselected one-hot
+    # categories (e.g. change resistance "High") leave their group all zero.
+    def encode(self, inputs, out=None):
+        if out is None:
+            out = np.zeros((1, self.n_features))
+        else:
+            out.fill(0.0)
+        row = out[0]
+
+        for name, i in self.numeric_index.items():
+            value = inputs.get(name)
+            if value is not None:
+                row[i] = value
+
+        for name, categories in self.one_hot_index.items():
+            i = categories.get(inputs.get(name))
+            if i is not None:
+                row[i] = 1.0
+
+        return out
+
+    # Encode a batch given as a DataFrame or a mapping of input name to
+    # equal-length columns into an n_rows x n_features array
+    def encode_batch(self, columns, out=None):
+        if hasattr(columns, "columns"):
+            available = set(columns.columns)
+            n_rows = len(columns)
+        else:
+            available = set(columns)
+            n_rows = len(next(iter(columns.values())))
+
+        if out is None:
+            out = np.zeros((n_rows, self.n_features))
+        else:
+            out.fill(0.0)
+
+        for name, i in self.numeric_index.items():
+            if name in available:
+                out[:, i] = np.asarray(columns[name], dtype=float)
+
+        values = {name: np.asarray(columns[name]) for name in ONE_HOT_INPUTS if name in available}
+        for name, category, i in self._one_hot_columns:
+            if name in values:
+                out[:, i] = values[name] == category
+
+        return out
@@ -0,0 +1,62 @@
+# Raw survey columns that feed the model directly
+NUMERIC_COLUMNS = [
+    "respondent_id",
+    "age",
+    "years_in_role",
+    "growth_mindset_score",
+    "limiting_beliefs_score",
+    "training_hours_last_year",
+    "leadership_score",
+    "team_openness_score",
+    "recent_failed_initiatives",
+    "positive_feedback_percent",
+]
+
+# Raw categorical survey columns that are one-hot encoded
+CATEGORICAL_COLUMNS = [
+    "change_resistance_level",
+    "retention_intent",
+]
+
+DATE_COLUMN = "survey_date"
+
+REQUIRED_COLUMNS = NUMERIC_COLUMNS + CATEGORICAL_COLUMNS + [DATE_COLUMN]
+
+SEASON_BY_MONTH = {
+    12: "Winter", 1: "Winter", 2: "Winter",
+    3: "Summer", 4: "Summer", 5: "Summer",
+    6: "Monsoon", 7: "Monsoon", 8: "Monsoon", 9: "Monsoon",
+    10: "Autumn", 11: "Autumn",
+}
+
+
+def missing_columns(columns):
+    return [col for col in REQUIRED_COLUMNS if col not in columns]
+
+
+# Turn rows in the synthetic_digital_mindset_data.csv schema into the raw
+# encoder inputs, splitting survey_date into Day/Month/Year/Quarter/Weekday/Season
+def derive_inputs(raw):
+    import pandas as pd
+
+    missing = missing_columns(raw.columns)
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    inputs = {col: raw[col] for col in NUMERIC_COLUMNS + CATEGORICAL_COLUMNS}
+
+    dates = raw[DATE_COLUMN]
+    if not pd.api.types.is_datetime64_any_dtype(dates):  # already parsed by validation or the Parquet cache
+        dates = pd.to_datetime(dates)
+    inputs["Day"] = dates.dt.day
+    inputs["Month"] = dates.dt.month
+    inputs["Year"] = dates.dt.year
+    inputs["Quarter"] = dates.dt.quarter
+    inputs["Weekday"] = dates.dt.day_name()
+    inputs["Season"] = dates.dt.month.map(SEASON_BY_MONTH)
+    return inputs
+
+
+# Model feature matrix (columns in selected_features order) for raw survey rows
+def build_feature_matrix(raw, encoder):
+    return encoder.encode_batch(derive_inputs(raw))
@@ -0,0 +1,74 @@
+# Accepted values of the model inputs. The Predict tab builds its widgets
+# from these definitions, and uploaded or posted data is checked against the
+# same ones (validation.py for frames, input_problem() for single
+# respondents), so the form and the bulk paths can't drift apart.
+
+# Numeric inputs: (min, max), inclusive; None leaves that side open
+NUMERIC_RANGES = {
+    "respondent_id": (1, None),
+    "age": (18, 80),
+    "years_in_role": (0, 50),
+    "growth_mindset_score": (0, 100),
+    "limiting_beliefs_score": (0, 100),
+    "training_hours_last_year": (0, 500),
+    "leadership_score": (0, 100),
+    "team_openness_score": (0, 100),
+    "recent_failed_initiatives": (0, 20),
+    "positive_feedback_percent": (0, 100),
+    "Day": (1, 31),
+    "Month": (1, 12),
+    "Year": (2020, 2030),
+    "Quarter": (1, 4),
+}
+
+# Categorical inputs: the options the form offers, i.e. those the model has
+# a one-hot feature for
+OPTIONS = {
+    "change_resistance_level": ["Low", "Medium"],
+    "retention_intent": ["Very Unlikely", "Unlikely", "Likely", "Very Likely"],
+    "Weekday": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    "Season": ["Winter", "Summer", "Monsoon"],
+}
+
+# Genuine survey answers the model has no feature for. They are accepted and
+# scored with their one-hot group all zero, but reported.
+UNMODELED_OPTIONS = {
+    "change_resistance_level": ["High"],
+    "Season": ["Autumn"],
+}
+
+
+# min_value/max_value keyword arguments for a Streamlit widget
+def widget_range(name):
+    low, high = NUMERIC_RANGES[name]
+    return {"min_value": low, "max_value": high}
+
+
+# Options of a Streamlit selectbox: the categorical options, or every
+# integer in a numeric range
+def widget_options(name):
+    if name in OPTIONS:
+        return OPTIONS[name]
+    low, high = NUMERIC_RANGES[name]
+    return list(range(low, high + 1))
+
+
+def format_range(low, high):
+    if high is None:
+        return f"at least {low}"
+    if low is None:
+        return f"at most {high}"
+    return f"between {low} and {high}"
+
+
+# Why a single input value is not accepted, or None if it is
+def input_problem(name, value):
+    if name in NUMERIC_RANGES:
+        low, high = NUMERIC_RANGES[name]
+        if (low is not None and value < low) or (high is not None and value > high):
+            return f"'{name}' must be {format_range(low, high)}"
+    elif name in OPTIONS:
+        if value not in OPTIONS[name] and value not in UNMODELED_OPTIONS.get(name, ()):
+            accepted = OPTIONS[name] + UNMODELED_OPTIONS.get(name, [])
+            return f"'{name}' must be one of: {', '.join(accepted)}"
+    return None
@@ -0,0 +1,201 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from predictor import BASE_DIR
+
+logger = logging.getLogger("digital_mindset.history")
+
+# ASSESSMENT_HISTORY_PATH overrides the location
+HISTORY_PATH = BASE_DIR / "assessment_history.sqlite3"
+
+# Defaults: write after 256 queued assessments or 1 s, whichever comes first
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    respondent_id INTEGER NOT NULL,
+    assessed_at REAL NOT NULL,
+    score REAL NOT NULL,
+    model_prediction REAL NOT NULL,
+    category TEXT NOT NULL,
+    inputs TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assessments_by_respondent ON assessments (respondent_id, assessed_at);
+CREATE INDEX IF NOT EXISTS assessments_by_date ON assessments (assessed_at);
+"""
+
+COLUMNS = ("respondent_id", "assessed_at", "score", "model_prediction", "category", "inputs")
+
+
+def default_history_path():
+    return os.environ.get("ASSESSMENT_HISTORY_PATH", str(HISTORY_PATH))
+
+
+def _connect(path):
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+# Every completed assessment, in a local SQLite database in WAL mode, so
+# readers never block the writer. record() only queues the row; a single
+# writer thread inserts queued rows in one transaction per batch, off the
+# render path. Reads go through one connection per reading thread and are
+# served by the (respondent_id, assessed_at) index; rows still waiting to be
+# written are merged in, so a session sees its own assessment straight away.
+#
+# Timestamps are Unix seconds (UTC).
+class HistoryStore:
+    def __init__(self, path=None, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.path = str(path or default_history_path())
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.batches = 0
+        self.written = 0
+        self._pending = []  # queued rows, readable before they are written
+        self._pending_lock = threading.Lock()
+        self._local = threading.local()
+
+        connection = _connect(self.path)
+        connection.executescript(SCHEMA)
+        connection.close()
+
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)  # write what is still queued on shutdown
+
+    def record(self, respondent_id, inputs, score, model_prediction, category, assessed_at=None):
+        if self._stopped.is_set():
+            raise RuntimeError("HistoryStore has been closed")
+        row = (
+            int(respondent_id),
+            time.time() if assessed_at is None else float(assessed_at),
+            float(score),
+            float(model_prediction),
+            category,
+            json.dumps(inputs, sort_keys=True, default=float),
+        )
+        # Under one lock, so the queue and the pending list stay in the same order
+        with self._pending_lock:
+            self._pending.append(row)
+            self._queue.put(row)
+
+    # Block until everything recorded so far has been written
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._queue.put(None)
+        self._writer.join()
+
+    @property
+    def pending(self):
+        with self._pending_lock:
+            return len(self._pending)
+
+    def _reader(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = _connect(self.path)
+        return connection
+
+    # A respondent's assessments, oldest first; `limit` keeps the most recent
+    def history(self, respondent_id, limit=None):
+        respondent_id = int(respondent_id)
+        query = (
+            "SELECT respondent_id, assessed_at, score, model_prediction, category, inputs "
+            "FROM assessments WHERE respondent_id = ? ORDER BY assessed_at DESC"
+        )
+        params = [respondent_id]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        # Snapshot the queue before reading, so a row can't be missed while
+        # the writer moves it from one to the other
+        with self._pending_lock:
+            pending = [row for row in self._pending if row[0] == respondent_id]
+        rows = self._reader().execute(query, params).fetchall()
+
+        seen = set(rows)
+        rows.extend(row for row in pending if row not in seen)
+        rows.sort(key=lambda row: row[1])
+        if limit is not None:
+            rows = rows[-limit:]
+        return [dict(zip(COLUMNS, row), inputs=json.loads(row[5])) for row in rows]
+
+    # Assessments per day between two timestamps, from the date index
+    def daily_counts(self, since, until=None):
+        until = time.time() if until is None else until
+        return self._reader().execute(
+            "SELECT date(assessed_at, 'unixepoch') AS day, COUNT(*) FROM assessments "
+            "WHERE assessed_at >= ? AND assessed_at < ? GROUP BY day ORDER BY day",
+            (since, until),
+        ).fetchall()
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "pending": self.pending,
+            "written": self.written,
+            "batches": self.batches,
+        }
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            self._queue.task_done()
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.task_done()
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        connection = _connect(self.path)
+        try:
+            while True:
+                batch = self._collect()
+                if batch is None:
+                    break
+                try:
+                    with connection:
+                        connection.executemany(
+                            f"INSERT INTO assessments ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)", batch
+                        )
+                    self.batches += 1
+                    self.written += len(batch)
+                except sqlite3.Error:
+                    logger.exception("Dropped %d assessments that could not be written to %s", len(batch), self.path)
+                finally:
+                    with self._pending_lock:
+                        del self._pending[:len(batch)]
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            connection.close()
@@ -0,0 +1,248 @@
+# Cross-validated model selection over the candidate estimators.
+#
+#   python model_selection.py                 # all cores, reference dataset
+#   python model_selection.py --jobs 4 --folds 5
+#
+# Every (candidate, parameters, fold) fit runs as its own task on a joblib
+# process pool. The feature matrix is built once per data checksum and the
+# fitted preprocessing (StandardScaler) is memoized per fold with
+# joblib.Memory, so it isn't refit for every candidate. Results are stored in
+# model_selection.json keyed by the data checksum and the candidate's
+# parameters; a rerun on unchanged data only fits what is missing. The app's
+# sidebar reads its model stats from the same report.
+import argparse
+import json
+import os
+import time
+import warnings
+
+import numpy as np
+
+from predictor import ARTIFACT_PATH, BASE_DIR, MODEL_PATH
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+REPORT_PATH = BASE_DIR / "model_selection.json"
+CACHE_DIR = BASE_DIR / ".cache" / "model_selection"
+DATA_PATH = BASE_DIR / "synthetic_digital_mindset_data.csv"
+
+TARGET_COLUMN = "digital_adoption_score"
+
+# Candidate estimators: (display name, estimator class path, parameter grid)
+CANDIDATES = {
+    "lasso": ("Lasso", "sklearn.linear_model.Lasso", {
+        "alpha": [0.01, 0.1, 1.0],
+        "random_state": [42],
+    }),
+    "ridge": ("Ridge", "sklearn.linear_model.Ridge", {
+        "alpha": [1.0, 10.0, 100.0],
+    }),
+    "random_forest": ("Random Forest", "sklearn.ensemble.RandomForestRegressor", {
+        "n_estimators": [100],
+        "max_depth": [8, None],
+        "min_samples_leaf": [5],
+        "random_state": [42],
+        "n_jobs": [1],
+    }),
+}
+
+DEPLOYED = "deployed"
+
+
+def _estimator_class(path):
+    import importlib
+
+    module, name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def result_key(candidate, params):
+    return f"{candidate}:{json.dumps(params, sort_keys=True)}"
+
+
+# Feature matrix and target for a data file, memoized on its checksum
+def _load_training_data(data_path, checksum):
+    from dataset import load_reference_data
+    from encoder import FeatureEncoder
+    from features import build_feature_matrix
+    from predictor import load_selected_features
+
+    frame = load_reference_data(data_path)
+    encoder = FeatureEncoder(load_selected_features())
+    return build_feature_matrix(frame, encoder), frame[TARGET_COLUMN].to_numpy(dtype=float)
+
+
+def _pipeline(estimator, memory):
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    return Pipeline([("scale", StandardScaler()), ("model", estimator)], memory=memory)
+
+
+# Task body: fit one candidate on one fold and score it on the held-out part
+def _fit_fold(estimator, X, y, train_index, test_index, cache_dir):
+    import joblib
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+    pipeline = _pipeline(estimator, joblib.Memory(cache_dir, verbose=0))
+    started = time.perf_counter()
+    pipeline.fit(X[train_index], y[train_index])
+    fit_seconds = time.perf_counter() - started
+    predictions = pipeline.predict(X[test_index])
+    return {
+        "r2": float(r2_score(y[test_index], predictions)),
+        "mae": float(mean_absolute_error(y[test_index], predictions)),
+        "rmse": float(mean_squared_error(y[test_index], predictions) ** 0.5),
+        "fit_seconds": fit_seconds,
+    }
+
+
+def load_report(path=REPORT_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _save_report(report, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+# Candidate configurations to evaluate: {key: (candidate, display name, estimator, params)}
+def _configurations():
+    from sklearn.base import clone
+    from sklearn.model_selection import ParameterGrid
+
+    configurations = {}
+    for candidate, (name, class_path, grid) in CANDIDATES.items():
+        estimator_class = _estimator_class(class_path)
+        for params in ParameterGrid(grid):
+            configurations[result_key(candidate, params)] = (candidate, name, estimator_class(**params), params)
+
+    # The shipped model, so the sidebar can report how it compares. It is
+    # keyed on its class and the checksum of the file it was loaded from as
+    # well, so a retrained or replaced model is evaluated again.
+    model_path = ARTIFACT_PATH if os.path.exists(ARTIFACT_PATH) else MODEL_PATH
+    if os.path.exists(model_path):
+        from dataset import file_checksum
+        from predictor import load_model_and_features
+        deployed = clone(load_model_and_features()[0])
+        estimator_class = type(deployed)
+        params = {
+            name: value for name, value in deployed.get_params().items()
+            if isinstance(value, (bool, int, float, str, type(None)))
+        }
+        key = result_key(DEPLOYED, {
+            "class": f"{estimator_class.__module__}.{estimator_class.__qualname__}",
+            "file_sha256": file_checksum(model_path),
+            "params": params,
+        })
+        configurations[key] = (DEPLOYED, f"{estimator_class.__name__} ({model_path.name})", deployed, params)
+    return configurations
+
+
+def _summary_entry(entry):
+    return {field: entry[field] for field in ("name", "params", "r2", "mae", "rmse")}
+
+
+def run_search(data_path=DATA_PATH, folds=5, jobs=-1, report_path=REPORT_PATH, seed=0):
+    import joblib
+    from sklearn.model_selection import KFold
+
+    from dataset import file_checksum
+
+    started = time.perf_counter()
+    checksum = file_checksum(data_path)
+    memory = joblib.Memory(CACHE_DIR, verbose=0)
+    X, y = memory.cache(_load_training_data, ignore=["data_path"])(str(data_path), checksum)
+
+    report = load_report(report_path) or {"datasets": {}}
+    dataset = report["datasets"].setdefault(checksum, {
+        "data": os.path.basename(str(data_path)),
+        "rows": int(len(y)),
+        "folds": folds,
+        "results": {},
+    })
+    if dataset["folds"] != folds:
+        dataset.update(folds=folds, results={})
+    results = dataset["results"]
+
+    configurations = _configurations()
+    # Results for a previously deployed model no longer describe the shipped one
+    for key in [key for key, entry in results.items() if entry["candidate"] == DEPLOYED and key not in configurations]:
+        del results[key]
+    pending = {key: config for key, config in configurations.items() if key not in results}
+    splits = list(KFold(folds, shuffle=True, random_state=seed).split(X))
+
+    tasks = [(key, fold) for key in pending for fold in range(folds)]
+    fold_metrics = joblib.Parallel(n_jobs=jobs)(
+        joblib.delayed(_fit_fold)(pending[key][2], X, y, *splits[fold], str(CACHE_DIR))
+        for key, fold in tasks
+    )
+
+    per_config = {}
+    for (key, _), metrics in zip(tasks, fold_metrics):
+        per_config.setdefault(key, []).append(metrics)
+    for key, metrics in per_config.items():
+        candidate, name, _, params = pending[key]
+        results[key] = {
+            "candidate": candidate,
+            "name": name,
+            "params": params,
+            "r2": float(np.mean([m["r2"] for m in metrics])),
+            "r2_std": float(np.std([m["r2"] for m in metrics])),
+            "mae": float(np.mean([m["mae"] for m in metrics])),
+            "rmse": float(np.mean([m["rmse"] for m in metrics])),
+            "fit_seconds": float(np.sum([m["fit_seconds"] for m in metrics])),
+        }
+
+    current = [results[key] for key in configurations]
+    best = max((entry for entry in current if entry["candidate"] != DEPLOYED), key=lambda entry: entry["r2"])
+    deployed = next((entry for entry in current if entry["candidate"] == DEPLOYED), None)
+    report["latest"] = {
+        "checksum": checksum,
+        "data": dataset["data"],
+        "rows": dataset["rows"],
+        "folds": folds,
+        "metric": "r2",
+        "best": _summary_entry(best),
+        "deployed": _summary_entry(deployed) if deployed is not None else None,
+    }
+    _save_report(report, report_path)
+
+    return {
+        "report": report,
+        "evaluated": len(pending),
+        "skipped": len(configurations) - len(pending),
+        "fits": len(tasks),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-validated model selection over the candidate estimators")
+    parser.add_argument("data", nargs="?", default=str(DATA_PATH), help="survey CSV with a digital_adoption_score column")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=-1, help="parallel fits (default: all cores)")
+    parser.add_argument("--report", default=str(REPORT_PATH), help="metrics report to read and update")
+    args = parser.parse_args()
+
+    outcome = run_search(args.data, args.folds, args.jobs, args.report)
+    latest = outcome["report"]["latest"]
+    results = outcome["report"]["datasets"][latest["checksum"]]["results"]
+
+    print(f"{outcome['evaluated']} configurations evaluated ({outcome['fits']} fits), "
+          f"{outcome['skipped']} reused from the report, in {outcome['seconds']:.1f}s")
+    for entry in sorted(results.values(), key=lambda entry: entry["r2"], reverse=True):
+        print(f"  {entry['name']:<20} R^2 {entry['r2']:7.4f} ± {entry['r2_std']:.4f}  "
+              f"MAE {entry['mae']:6.3f}  {json.dumps(entry['params'], sort_keys=True)}")
+    print(f"Best: {latest['best']['name']} (R^2 {latest['best']['r2']:.4f}); report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import numpy as np
+
+# Cohorts a respondent is ranked within, besides the whole population
+GROUP_COLUMNS = ["country", "industry", "job_role", "company_size"]
+
+
+# Sorted reference scores, overall and per cohort, so that a percentile is
+# one binary search (np.searchsorted) instead of a scan of the population
+class PopulationIndex:
+    def __init__(self, scores, groups=None):
+        scores = np.asarray(scores, dtype=float)
+        self.scores = np.sort(scores)
+        self.groups = {}
+        for column, labels in (groups or {}).items():
+            labels = np.asarray(labels)
+            self.groups[column] = {
+                label: np.sort(scores[labels == label]) for label in np.unique(labels)
+            }
+
+    @classmethod
+    def from_scored_reference(cls, reference, score_column="digital_mindset_score"):
+        return cls(
+            reference[score_column].to_numpy(),
+            {column: reference[column].to_numpy() for column in GROUP_COLUMNS},
+        )
+
+    def __len__(self):
+        return len(self.scores)
+
+    # Percentage of the population scoring below `score`, counting ties as half
+    @staticmethod
+    def _rank(sorted_scores, score):
+        n = len(sorted_scores)
+        if n == 0:
+            return None
+        below = np.searchsorted(sorted_scores, score, side="left")
+        at_or_below = np.searchsorted(sorted_scores, score, side="right")
+        return float(100.0 * (below + at_or_below) / (2 * n))
+
+    def cohort_scores(self, column=None, label=None):
+        if column is None:
+            return self.scores
+        return self.groups.get(column, {}).get(label, self.scores[:0])
+
+    def percentile(self, score, column=None, label=None):
+        return self._rank(self.cohort_scores(column, label), score)
+
+    # percentile() of every score in an array, in one pair of searches
+    def percentile_ranks(self, scores, column=None, label=None):
+        sorted_scores = self.cohort_scores(column, label)
+        below = np.searchsorted(sorted_scores, scores, side="left")
+        at_or_below = np.searchsorted(sorted_scores, scores, side="right")
+        return 100.0 * (below + at_or_below) / (2 * max(len(sorted_scores), 1))
+
+    # Overall percentile plus one per cohort in `profile` ({column: label});
+    # values are None for cohorts with no reference respondents
+    def percentiles(self, score, profile):
+        ranks = {"population": (self.percentile(score), len(self.scores))}
+        for column in GROUP_COLUMNS:
+            label = profile.get(column)
+            cohort = self.cohort_scores(column, label)
+            ranks[column] = (self._rank(cohort, score), len(cohort))
+        return ranks
+
+
+def load_population_index():
+    from dataset import load_scored_reference_data  # deferred: pulls in pandas
+
+    return PopulationIndex.from_scored_reference(load_scored_reference_data())
@@ -0,0 +1,161 @@
+import json
+import os
+import time
+from pathlib import Path
+
+from encoder import FeatureEncoder, NUMERIC_INPUTS, ONE_HOT_INPUTS
+from fields import input_problem
+from score_cache import DEFAULT_MAXSIZE, ScoreCache
+from scoring import score_batch, score_category
+from tracing import span
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_PATH = BASE_DIR / "model.pkl"
+FEATURES_PATH = BASE_DIR / "selected_features.json"
+ARTIFACT_PATH = BASE_DIR / "model.joblib"
+
+# Widget defaults of the Predict tab, used for inputs a caller leaves out
+DEFAULT_INPUTS = {
+    "age": 30,
+    "years_in_role": 3,
+    "respondent_id": 1,
+    "growth_mindset_score": 50,
+    "limiting_beliefs_score": 30,
+    "training_hours_last_year": 40,
+    "leadership_score": 50,
+    "team_openness_score": 60,
+    "recent_failed_initiatives": 2,
+    "positive_feedback_percent": 70,
+    "Day": 15,
+    "Month": 6,
+    "Year": 2024,
+    "Quarter": 2,
+    "change_resistance_level": "Low",
+    "retention_intent": "Likely",
+    "Weekday": "Wednesday",
+    "Season": "Summer",
+}
+
+
+def load_selected_features():
+    with open(FEATURES_PATH, "r") as f:
+        return json.load(f)
+
+
+# Prefer the self-describing artifact (see artifact.py), whose schema is
+# checked against selected_features.json once here; fall back to the legacy
+# model.pkl when no artifact has been built
+def load_model_and_features():
+    if os.path.exists(ARTIFACT_PATH):
+        from artifact import ModelArtifact  # deferred: unpickling the model pulls in scikit-learn
+
+        artifact = ModelArtifact.load(ARTIFACT_PATH, expected_features=load_selected_features())
+        return artifact.estimator, artifact.features
+
+    import joblib
+
+    model = joblib.load(MODEL_PATH)
+    return model, load_selected_features()
+
+
+# Fill in defaults and reject anything the encoder would silently ignore
+def normalize_inputs(inputs):
+    if not isinstance(inputs, dict):
+        raise ValueError("Each respondent must be a JSON object")
+    unknown = sorted(set(inputs) - set(DEFAULT_INPUTS))
+    if unknown:
+        raise ValueError(f"Unknown inputs: {', '.join(unknown)}")
+
+    normalized = dict(DEFAULT_INPUTS)
+    normalized.update(inputs)
+    for name in NUMERIC_INPUTS:
+        value = normalized[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"'{name}' must be a number")
+    for name in ONE_HOT_INPUTS:
+        if not isinstance(normalized[name], str):
+            raise ValueError(f"'{name}' must be a string")
+    # The Predict tab's ranges and options (fields.py)
+    for name, value in normalized.items():
+        problem = input_problem(name, value)
+        if problem:
+            raise ValueError(problem)
+    return normalized
+
+
+# The logic behind the "Generate Digital Mindset Prediction" button, usable
+# without Streamlit: encode, run model.predict and the custom scorer. Results
+# are memoized per encoded row unless cache_size is 0.
+class Predictor:
+    def __init__(self, model, selected_features, cache_size=DEFAULT_MAXSIZE):
+        self.model = model
+        self.selected_features = list(selected_features)
+        self.encoder = FeatureEncoder(self.selected_features)
+        self.cache = ScoreCache(cache_size) if cache_size else None
+        self.timings = {}
+
+    @classmethod
+    def load(cls, cache_size=DEFAULT_MAXSIZE):
+        with span("model_load"):
+            return cls(*load_model_and_features(), cache_size=cache_size)
+
+    def _compute(self, input_array):
+        with span("score"):
+            scores = score_batch(input_array, self.selected_features)
+        with span("model_predict"):
+            model_predictions = self.model.predict(input_array)
+        return [
+            {
+                "score": float(score),
+                "category": score_category(score),
+                "model_prediction": float(model_prediction),
+            }
+            for score, model_prediction in zip(scores, model_predictions)
+        ]
+
+    # Cached result for one encoded row, or None
+    def lookup(self, input_row):
+        return self.cache.get(input_row) if self.cache is not None else None
+
+    # Score an already-encoded feature matrix; only rows missing from the cache
+    # are computed, in one batch. Pass check_cache=False for rows the caller
+    # has already looked up.
+    def predict_array(self, input_array, check_cache=True):
+        if self.cache is None:
+            return self._compute(input_array)
+
+        results = [self.cache.get(row) if check_cache else None for row in input_array]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            for i, result in zip(missing, self._compute(input_array[missing])):
+                self.cache.put(input_array[i], result)
+                results[i] = result
+        return results
+
+    def encode(self, inputs):
+        with span("encode"):
+            return self.encoder.encode(normalize_inputs(inputs))
+
+    def predict(self, inputs):
+        return self.predict_array(self.encode(inputs))[0]
+
+    def predict_batch(self, respondents):
+        if not respondents:
+            return []
+        rows = [normalize_inputs(inputs) for inputs in respondents]
+        columns = {name: [row[name] for row in rows] for name in DEFAULT_INPUTS}
+        with span("encode"):
+            input_array = self.encoder.encode_batch(columns)
+        return self.predict_array(input_array)
+
+
+# Load the model and score one default respondent so the first real request
+# doesn't pay for lazy imports and sklearn's first-call setup
+def load_warm_predictor(cache_size=DEFAULT_MAXSIZE):
+    started = time.perf_counter()
+    instance = Predictor.load(cache_size)
+    loaded = time.perf_counter()
+    instance.predict({})
+    instance.timings["load_seconds"] = loaded - started
+    instance.timings["warmup_seconds"] = time.perf_counter() - loaded
+    return instance
@@ -0,0 +1,29 @@
+import threading
+
+
+# Counts and timings of script runs, per scope. "full" is a rerun of the
+# whole script; every other scope is a fragment rerunning on its own.
+class RerunStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scopes = {}
+
+    def record(self, scope, seconds):
+        with self._lock:
+            entry = self._scopes.setdefault(scope, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+
+    # {scope: {"count", "seconds", "mean_seconds", "max_seconds"}}
+    def snapshot(self):
+        with self._lock:
+            return {
+                scope: {**entry, "mean_seconds": entry["seconds"] / entry["count"]}
+                for scope, entry in self._scopes.items()
+            }
+
+    @property
+    def total(self):
+        with self._lock:
+            return sum(entry["count"] for entry in self._scopes.values())
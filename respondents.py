@@ -0,0 +1,271 @@
+import threading
+
+import numpy as np
+
+ID_COLUMN = "respondent_id"
+
+# Survey columns kept per respondent: everything the assessment form can be
+# prefilled from, plus the recorded score and survey date
+RECORD_COLUMNS = [
+    "age",
+    "years_in_role",
+    "country",
+    "industry",
+    "job_role",
+    "company_size",
+    "growth_mindset_score",
+    "limiting_beliefs_score",
+    "training_hours_last_year",
+    "leadership_score",
+    "team_openness_score",
+    "recent_failed_initiatives",
+    "positive_feedback_percent",
+    "change_resistance_level",
+    "retention_intent",
+    "digital_adoption_score",
+    "survey_date",
+]
+
+# Also kept when present: the app's own score, on rows that came through
+# bulk scoring
+SCORED_COLUMN = "digital_mindset_score"
+INDEXED_COLUMNS = RECORD_COLUMNS + [SCORED_COLUMN]
+
+# IDs index into a direct-address table that starts at the lowest ID seen
+# and spans at most DENSE_FACTOR x rows IDs; IDs outside that window go into
+# a dict, so a stray huge (or tiny) ID can't blow up the table
+DENSE_FACTOR = 4
+
+CHUNK_SIZE = 100_000
+
+
+# respondent_id -> stored survey answers. IDs index straight into an array of
+# row positions (8 bytes per ID in the table's span), so a lookup is
+# constant-time however many respondents there are, and update() appends
+# rows without a rebuild. Numbers and dates are kept as numpy arrays, text
+# answers as category codes (4 bytes per row) plus one list of the distinct
+# values per column. When an ID appears more than once, its latest row wins.
+class RespondentIndex:
+    def __init__(self, source, capacity=1024):
+        self.source = source
+        self.rows = 0
+        self._base = 0  # ID of self._slots[0]
+        self._slots = np.full(0, -1, dtype=np.int64)
+        self._overflow = {}
+        self._columns = {}
+        # Per text column: its distinct values in code order, and value -> code
+        self._categories = {}
+        self._codes = {}
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        # Held by refresh_respondent_index from reading `csv_state` to storing the new one
+        self._refresh_lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, frame, source):
+        index = cls(source, capacity=max(len(frame), 1024))
+        index.update(frame)
+        return index
+
+    # Index a survey CSV (a path or file-like object) chunk by chunk, keeping
+    # only the columns needed for lookups
+    @classmethod
+    def from_csv(cls, csv, source, chunksize=CHUNK_SIZE):
+        import pandas as pd
+
+        index = cls(source)
+        wanted = set(INDEXED_COLUMNS) | {ID_COLUMN}
+        for chunk in pd.read_csv(csv, chunksize=chunksize, usecols=lambda column: column in wanted):
+            if ID_COLUMN not in chunk.columns:
+                raise ValueError(f"Missing required column: {ID_COLUMN}")
+            index.update(chunk)
+        return index
+
+    def __len__(self):
+        return int((self._slots >= 0).sum()) + len(self._overflow)
+
+    @staticmethod
+    def _storage_dtype(series):
+        import pandas as pd
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return "datetime64[ns]"
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return np.float64
+        return np.int32  # category codes
+
+    # Category codes of a text column's values (-1 where missing), adding
+    # values not seen before to the column's categories
+    def _encode(self, name, values):
+        import pandas as pd
+
+        values = pd.Categorical(values)
+        codes = self._codes.setdefault(name, {})
+        categories = self._categories.setdefault(name, [])
+        chunk_codes = [codes.setdefault(value, len(codes)) for value in values.categories]
+        categories.extend(list(codes)[len(categories):])
+        return np.array(chunk_codes + [-1], dtype=np.int32)[values.codes]
+
+    # Enlarge the column arrays (by at least 25%) so `needed` rows fit
+    def _grow(self, needed):
+        if needed <= self._capacity:
+            return
+        self._capacity = max(needed, self._capacity + self._capacity // 4)
+        for name, values in self._columns.items():
+            grown = np.empty(self._capacity, dtype=values.dtype)
+            grown[:self.rows] = values[:self.rows]
+            self._columns[name] = grown
+
+    # Place `ids` (at row `positions`) in the slot table where they fit its
+    # window of span_limit IDs; returns the mask of those placed
+    def _place_dense(self, ids, positions, span_limit):
+        if not len(self._slots):
+            # Start the window at the lowest ID of the span_limit-wide range holding the most IDs
+            ordered = np.sort(ids)
+            covered = np.searchsorted(ordered, ordered + span_limit) - np.arange(len(ordered))
+            self._base = int(ordered[covered.argmax()])
+        elif ids.min() < self._base:
+            # Move the window down as far as it can go while keeping the IDs already in it
+            fits = ids[ids >= self._base + len(self._slots) - span_limit]
+            if len(fits) and fits.min() < self._base:
+                lowest = int(fits.min())
+                shift = self._base - lowest
+                slots = np.full(len(self._slots) + shift, -1, dtype=np.int64)
+                slots[shift:] = self._slots
+                self._slots, self._base = slots, lowest
+
+        offsets = ids - self._base
+        dense = (offsets >= 0) & (offsets < span_limit)
+        if dense.any():
+            needed = int(offsets[dense].max()) + 1
+            if needed > len(self._slots):
+                size = min(max(needed, len(self._slots) + len(self._slots) // 4), span_limit)
+                slots = np.full(size, -1, dtype=np.int64)
+                slots[:len(self._slots)] = self._slots
+                self._slots = slots
+            self._slots[offsets[dense]] = positions[dense]
+            if self._overflow:  # IDs the window has grown to cover
+                for respondent_id in ids[dense].tolist():
+                    self._overflow.pop(respondent_id, None)
+        return dense
+
+    def update(self, frame):
+        import pandas as pd
+
+        if not len(frame):
+            return
+        frame = frame[[name for name in [ID_COLUMN] + INDEXED_COLUMNS if name in frame.columns]]
+        frame = frame.reset_index(drop=True)
+        if "survey_date" in frame.columns:
+            frame["survey_date"] = pd.to_datetime(frame["survey_date"], errors="coerce")
+        ids = pd.to_numeric(frame[ID_COLUMN], errors="coerce")
+        valid = ids.notna().to_numpy()
+        ids = ids.to_numpy()
+
+        with self._lock:
+            start = self.rows
+            self._grow(start + len(frame))
+            for name in INDEXED_COLUMNS:
+                if name not in frame.columns:
+                    continue
+                if name not in self._columns:
+                    self._columns[name] = np.empty(self._capacity, dtype=self._storage_dtype(frame[name]))
+                    self._columns[name][:start] = _missing(self._columns[name])
+                values = frame[name]
+                if self._columns[name].dtype == np.int32:
+                    values = self._encode(name, values)
+                else:
+                    values = values.to_numpy()
+                self._columns[name][start:start + len(frame)] = values
+            for name, values in self._columns.items():
+                if name not in frame.columns:
+                    values[start:start + len(frame)] = _missing(values)
+
+            ids = ids[valid].astype(np.int64)
+            positions = np.arange(start, start + len(frame))[valid]
+            latest = ~pd.Index(ids).duplicated(keep="last")
+            ids, positions = ids[latest], positions[latest]
+
+            if len(ids):
+                dense = self._place_dense(ids, positions, DENSE_FACTOR * (start + len(frame)))
+                self._overflow.update(zip(ids[~dense].tolist(), positions[~dense].tolist()))
+            self.rows = start + len(frame)
+
+    # The respondent's stored answers as plain Python values, or None
+    def lookup(self, respondent_id):
+        try:
+            respondent_id = int(respondent_id)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            offset = respondent_id - self._base
+            if 0 <= offset < len(self._slots) and self._slots[offset] >= 0:
+                position = int(self._slots[offset])
+            else:
+                position = self._overflow.get(respondent_id)
+                if position is None:
+                    return None
+            record = {ID_COLUMN: respondent_id, "source": self.source}
+            for name, values in self._columns.items():
+                if name in self._categories:
+                    code = values[position]
+                    record[name] = _python_value(self._categories[name][code]) if code >= 0 else None
+                else:
+                    record[name] = _python_value(values[position])
+        return record
+
+
+def _missing(values):
+    if values.dtype == np.int32:  # category codes
+        return -1
+    return np.datetime64("NaT") if values.dtype.kind == "M" else np.nan
+
+
+def _python_value(value):
+    import pandas as pd
+
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else pd.Timestamp(value).to_pydatetime()
+    if isinstance(value, np.floating):
+        if np.isnan(value):
+            return None
+        return int(value) if float(value).is_integer() else float(value)
+    return value
+
+
+# First index (in order) that knows the respondent: (record, index) or (None, None)
+def lookup_respondent(respondent_id, *indexes):
+    for index in indexes:
+        if index is None:
+            continue
+        record = index.lookup(respondent_id)
+        if record is not None:
+            return record, index
+    return None, None
+
+
+def load_respondent_index():
+    from dataset import REFERENCE_CSV, csv_state, load_reference_data  # deferred: pulls in pyarrow
+
+    frame = load_reference_data(columns=[ID_COLUMN] + RECORD_COLUMNS)
+    index = RespondentIndex.from_frame(frame, REFERENCE_CSV.name)
+    index.csv_state = csv_state(REFERENCE_CSV)
+    return index
+
+
+# Index survey rows appended to the reference CSV since the index was built.
+# Returns False when the file was rewritten rather than appended to, in which
+# case the caller should rebuild the index.
+def refresh_respondent_index(index):
+    from dataset import REFERENCE_CSV, read_appended_rows
+
+    # One session at a time, or two could index the same appended rows
+    with index._refresh_lock:
+        appended = read_appended_rows(REFERENCE_CSV, index.csv_state)
+        if appended is None:
+            return False
+        rows, csv_state = appended
+        if len(rows):
+            index.update(rows)
+        index.csv_state = csv_state
+    return True
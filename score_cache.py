@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Entries kept before the least recently used one is evicted
+DEFAULT_MAXSIZE = 4096
+
+
+# Process-wide LRU cache of prediction results, keyed on the encoded feature
+# vector. The inputs are small bounded integers and enums, so identical rows
+# are common across sessions and reruns; a hit returns the custom score, the
+# model prediction and the category without touching the model.
+class ScoreCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(input_row):
+        return np.ascontiguousarray(input_row, dtype=np.float64).tobytes()
+
+    # Cached result for one encoded row, or None; counts a hit or a miss
+    def get(self, input_row):
+        key = self.key(input_row)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dict(result)
+
+    def put(self, input_row, result):
+        key = self.key(input_row)
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Counters as a JSON-serializable dict
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,225 @@
+# Multi-core batch scoring for large respondent files.
+#
+#   python score_files.py score respondents.csv scored.csv --workers 8
+#   python score_files.py score respondents.parquet scored.parquet
+#   python score_files.py synthesize big.csv --copies 100
+#
+# CSV inputs are split into byte ranges aligned to line breaks, so every
+# worker parses its own shard (quoted fields must not contain newlines).
+# Parquet inputs are split by row group. Each worker process loads the model
+# once, scores its shards with the same code as the Bulk Assessment tab and
+# writes them to temporary files that are concatenated in input order.
+# Rows failing the input checks (validation.py) are left out and reported.
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from bulk import score_frame
+from encoder import FeatureEncoder
+from predictor import BASE_DIR, load_model_and_features
+from validation import ValidationReport
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+REFERENCE_DATA_PATH = BASE_DIR / "synthetic_digital_mindset_data.csv"
+
+# Target shard size for CSV inputs
+SHARD_BYTES = 32 * 1024 * 1024
+
+# Per-process state, set once by _init_worker
+_model = None
+_encoder = None
+
+
+def _init_worker():
+    global _model, _encoder
+    warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+    _model, selected_features = load_model_and_features()
+    _encoder = FeatureEncoder(selected_features)
+
+
+def is_parquet(path):
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+# Split a CSV into (start, end) byte ranges that begin and end on line
+# boundaries; the header line is excluded from every range. A header-only
+# file gets one empty range, so its output still has the scored header.
+def csv_shards(path, shard_bytes=SHARD_BYTES, min_shards=1):
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        shard_bytes = max(1, min(shard_bytes, (size - data_start) // max(min_shards, 1)))
+
+        boundaries = [data_start]
+        while boundaries[-1] < size:
+            f.seek(boundaries[-1] + shard_bytes)
+            f.readline()  # finish the row the seek landed in
+            boundaries.append(min(f.tell(), size))
+    return header, list(zip(boundaries[:-1], boundaries[1:])) or [(data_start, data_start)]
+
+
+def _read_shard(path, shard):
+    if is_parquet(path):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        if shard is None:  # no row groups: an empty frame with the file's columns
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+        return parquet_file.read_row_group(shard).to_pandas()
+
+    header, (start, end) = shard
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return pd.read_csv(io.BytesIO(header + data))
+
+
+def _write_shard(frame, destination, output_parquet):
+    if output_parquet:
+        frame.to_parquet(destination, index=False)
+    else:
+        frame.to_csv(destination, index=False)
+
+
+# Worker entry point: score one shard into its own temporary file. Row
+# numbers in the returned report count from the start of the shard.
+def _score_shard(path, shard, destination, output_parquet):
+    started = time.perf_counter()
+    report = ValidationReport()
+    scored = score_frame(_read_shard(path, shard), _model, _encoder, report)
+    _write_shard(scored, destination, output_parquet)
+    return len(scored), time.perf_counter() - started, report
+
+
+def _merge_csv(parts, output_path):
+    with open(output_path, "wb") as out:
+        for i, part in enumerate(parts):
+            with open(part, "rb") as f:
+                if i > 0:
+                    f.readline()  # drop repeated header
+                shutil.copyfileobj(f, out)
+
+
+def _merge_parquet(parts, output_path):
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for part in parts:
+            table = pq.read_table(part)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def score_file(input_path, output_path, workers=None, shard_bytes=SHARD_BYTES):
+    workers = workers or os.cpu_count() or 1
+    output_parquet = is_parquet(output_path)
+
+    if is_parquet(input_path):
+        import pyarrow.parquet as pq
+        shards = list(range(pq.ParquetFile(input_path).num_row_groups)) or [None]
+    else:
+        header, ranges = csv_shards(input_path, shard_bytes, min_shards=workers)
+        shards = [(header, byte_range) for byte_range in ranges]
+
+    suffix = ".parquet" if output_parquet else ".csv"
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="score_shards_") as tmp_dir:
+        parts = [os.path.join(tmp_dir, f"shard_{i:05d}{suffix}") for i in range(len(shards))]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [
+                pool.submit(_score_shard, input_path, shard, part, output_parquet)
+                for shard, part in zip(shards, parts)
+            ]
+            shard_stats = [future.result() for future in futures]
+
+        if output_parquet:
+            _merge_parquet(parts, output_path)
+        else:
+            _merge_csv(parts, output_path)
+    elapsed = time.perf_counter() - started
+
+    rows = sum(n for n, _, _ in shard_stats)
+    busy = sum(seconds for _, seconds, _ in shard_stats)
+    report = ValidationReport()
+    for _, _, shard_report in shard_stats:
+        report.merge(shard_report, row_offset=report.rows)
+    return {
+        "rows": rows,
+        "report": report,
+        "shards": len(shards),
+        "workers": workers,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "rows_per_second_per_core": rows / elapsed / workers if elapsed else 0.0,
+        "rows_per_busy_second": rows / busy if busy else 0.0,
+    }
+
+
+# Write `copies` back-to-back copies of the reference dataset with fresh
+# respondent ids, for scaling tests
+def synthesize(output_path, copies, source=REFERENCE_DATA_PATH):
+    reference = pd.read_csv(source)
+    id_offset = int(reference["respondent_id"].max())
+    for copy in range(copies):
+        chunk = reference.assign(respondent_id=reference["respondent_id"] + copy * id_offset)
+        chunk.to_csv(output_path, mode="w" if copy == 0 else "a", header=copy == 0, index=False)
+    return len(reference) * copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score large respondent files on all cores")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score_parser = commands.add_parser("score", help="score a CSV or Parquet file")
+    score_parser.add_argument("input", help="respondent file (.csv or .parquet)")
+    score_parser.add_argument("output", help="scored output (.csv or .parquet)")
+    score_parser.add_argument("--workers", type=int, default=None,
+                              help="worker processes (default: all cores)")
+    score_parser.add_argument("--shard-mb", type=float, default=SHARD_BYTES / 1024 / 1024,
+                              help="target CSV shard size in MB")
+
+    synth_parser = commands.add_parser("synthesize", help="write an enlarged copy of the reference data")
+    synth_parser.add_argument("output")
+    synth_parser.add_argument("--copies", type=int, default=100)
+
+    args = parser.parse_args()
+
+    if args.command == "synthesize":
+        rows = synthesize(args.output, args.copies)
+        print(f"Wrote {rows:,} rows to {args.output}")
+        return
+
+    try:
+        stats = score_file(args.input, args.output, args.workers, int(args.shard_mb * 1024 * 1024))
+    except ValueError as exc:
+        sys.exit(f"Could not score {args.input}: {exc}")
+    print(f"Scored {stats['rows']:,} rows in {stats['shards']} shards on "
+          f"{stats['workers']} workers in {stats['seconds']:.2f}s")
+    report = stats["report"]
+    if report:
+        print(f"Validation: {report.summary()}")
+        for line in report.error_lines():
+            print(f"  error   {line}")
+        for line in report.warning_lines():
+            print(f"  warning {line}")
+    print(f"Throughput: {stats['rows_per_second']:,.0f} rows/s "
+          f"({stats['rows_per_second_per_core']:,.0f} rows/s per core, "
+          f"{stats['rows_per_busy_second']:,.0f} rows/s per busy worker)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import functools
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Weights of the custom score, kept next to selected_features.json so they can
+# be tuned without code changes
+SCORING_SPEC_PATH = Path(__file__).resolve().parent / "scoring_spec.json"
+
+# Spec format versions this module knows how to compile
+SUPPORTED_SPEC_VERSIONS = {1}
+
+
+# Since the current model has over-regularization (all coefficients = 0), the
+# app scores respondents with a simple weighted algorithm instead. The spec
+# lists weighted groups of terms; each term maps its feature linearly from
+# range[0] -> 0 points to range[1] -> 100 points, optionally clamped to
+# min/max points, and falls back to `default` when the feature isn't in the
+# model's feature set.
+@functools.lru_cache(maxsize=None)
+def load_scoring_spec(path=SCORING_SPEC_PATH):
+    with open(path, "r") as f:
+        spec = json.load(f)
+    if spec.get("version") not in SUPPORTED_SPEC_VERSIONS:
+        raise ValueError(f"Unsupported scoring spec version: {spec.get('version')!r}")
+    return spec
+
+
+def scored_features(spec=None):
+    spec = spec or load_scoring_spec()
+    return [term["feature"] for group in spec["groups"] for term in group["terms"]]
+
+
+# The spec compiled against one feature order: a coefficient vector, per
+# feature clip bounds and an intercept, so that scoring a batch is
+#   clip(clip(X, lower, upper) @ coefficients + intercept, *score_range)
+class CompiledScoringSpec:
+    def __init__(self, spec, selected_features):
+        index = {name: i for i, name in enumerate(selected_features)}
+        n_features = len(selected_features)
+        self.name = spec["name"]
+        self.version = spec["version"]
+        self.coefficients = np.zeros(n_features)
+        self.lower = np.full(n_features, -np.inf)
+        self.upper = np.full(n_features, np.inf)
+        self.intercept = float(spec["base_score"])
+        self.score_range = tuple(spec.get("score_range", (-np.inf, np.inf)))
+
+        seen = set()
+        for group in spec["groups"]:
+            for term in group["terms"]:
+                feature = term["feature"]
+                if feature in seen:
+                    raise ValueError(f"'{feature}' appears in more than one scoring term")
+                seen.add(feature)
+
+                start, end = term.get("range", (0, 100))
+                if start == end:
+                    raise ValueError(f"Empty range for '{feature}'")
+                slope = 100 / (end - start)
+                weight = group["weight"] * term["weight"]
+
+                # Point limits become limits on the raw feature value
+                lower = start + term["min"] / slope if "min" in term else None
+                upper = start + term["max"] / slope if "max" in term else None
+                if slope < 0:
+                    lower, upper = upper, lower
+                lower = -np.inf if lower is None else lower
+                upper = np.inf if upper is None else upper
+
+                if feature in index:
+                    i = index[feature]
+                    self.coefficients[i] = weight * slope
+                    self.lower[i], self.upper[i] = lower, upper
+                    self.intercept -= weight * slope * start
+                else:
+                    default = min(max(term.get("default", 0), lower), upper)
+                    self.intercept += weight * slope * (default - start)
+
+        # Only these columns contribute to the score
+        self.columns = np.flatnonzero(self.coefficients)
+        self._coefficients = self.coefficients[self.columns]
+        self._lower = self.lower[self.columns]
+        self._upper = self.upper[self.columns]
+
+    def score(self, input_array):
+        values = np.asarray(input_array, dtype=float)[:, self.columns]
+        np.clip(values, self._lower, self._upper, out=values)
+        return np.clip(values @ self._coefficients + self.intercept, *self.score_range)
+
+
+@functools.lru_cache(maxsize=32)
+def compile_scoring_spec(selected_features, path=SCORING_SPEC_PATH):
+    return CompiledScoringSpec(load_scoring_spec(path), selected_features)
+
+
+# Score every row of a 2-D array whose columns follow selected_features, or
+# of a DataFrame with the scored features as columns, in one pass
+def score_batch(data, selected_features):
+    if hasattr(data, "columns"):
+        selected_features = [name for name in scored_features() if name in data.columns]
+        data = data[selected_features].to_numpy(dtype=float)
+    else:
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+    return compile_scoring_spec(tuple(selected_features)).score(data)
+
+
+# Score a single respondent given as {feature: value}
+def calculate_digital_mindset_score(user_data):
+    features = [name for name in scored_features() if name in user_data]
+    row = np.array([[user_data[name] for name in features]], dtype=float)
+    return float(score_batch(row, features)[0])
+
+
+# Interpretation buckets shown in the results panel (upper bounds inclusive)
+SCORE_CATEGORIES = [
+    (40, "Developing"),
+    (70, "Adopting"),
+    (100, "Transforming"),
+]
+
+
+def score_category(score):
+    for upper_bound, category in SCORE_CATEGORIES:
+        if score <= upper_bound:
+            return category
+    return SCORE_CATEGORIES[-1][1]
@@ -0,0 +1,80 @@
+import time
+
+import numpy as np
+
+from fields import NUMERIC_RANGES
+from predictor import normalize_inputs
+from scoring import score_batch
+
+
+def _sweep(name, step=1):
+    low, high = NUMERIC_RANGES[name]
+    return np.arange(low, high + 1, step)
+
+
+# Inputs swept by the what-if panel, over the Predict tab's widget ranges
+LEVERS = {
+    "growth_mindset_score": ("Growth Mindset Score", _sweep("growth_mindset_score")),
+    "limiting_beliefs_score": ("Limiting Beliefs Score", _sweep("limiting_beliefs_score")),
+    "leadership_score": ("Leadership Score", _sweep("leadership_score")),
+    "team_openness_score": ("Team Openness Score", _sweep("team_openness_score")),
+    "positive_feedback_percent": ("Positive Feedback %", _sweep("positive_feedback_percent")),
+    "training_hours_last_year": ("Training Hours (Last Year)", _sweep("training_hours_last_year", 5)),
+    "recent_failed_initiatives": ("Recent Failed Initiatives", _sweep("recent_failed_initiatives")),
+}
+
+
+# Score one respondent with each lever swept across its range while every
+# other input stays fixed. All sweep points (plus the respondent as given in
+# row 0) go through the scorer and model.predict as a single matrix.
+#
+# Returns {"score", "rows", "seconds", "curves": {lever: {...}}}, where each
+# curve has the swept values, their scores and model predictions, the
+# respondent's current value and the value giving the largest gain.
+def sweep_levers(predictor, inputs, levers=LEVERS):
+    started = time.perf_counter()
+    inputs = normalize_inputs(inputs)
+    encoder = predictor.encoder
+    active = [
+        (name, label, values) for name, (label, values) in levers.items()
+        if name in encoder.numeric_index
+    ]
+
+    n_rows = 1 + sum(len(values) for _, _, values in active)
+    matrix = np.repeat(encoder.encode(inputs), n_rows, axis=0)
+    row_slices = {}
+    start = 1
+    for name, _, values in active:
+        row_slices[name] = slice(start, start + len(values))
+        matrix[row_slices[name], encoder.numeric_index[name]] = values
+        start += len(values)
+
+    scores = score_batch(matrix, predictor.selected_features)
+    model_predictions = predictor.model.predict(matrix)
+
+    current_score = float(scores[0])
+    curves = {}
+    for name, label, values in active:
+        lever_scores = scores[row_slices[name]]
+        best = int(np.argmax(lever_scores))  # lowest value reaching the maximum
+        curves[name] = {
+            "label": label,
+            "values": values,
+            "scores": lever_scores,
+            "model_predictions": model_predictions[row_slices[name]],
+            "current_value": inputs[name],
+            "best_value": values[best].item(),
+            "max_gain": float(lever_scores[best]) - current_score,
+        }
+
+    return {
+        "score": current_score,
+        "rows": n_rows,
+        "seconds": time.perf_counter() - started,
+        "curves": curves,
+    }
+
+
+# Levers ordered by how much they could raise the score
+def ranked_levers(sweep):
+    return sorted(sweep["curves"].items(), key=lambda item: item[1]["max_gain"], reverse=True)
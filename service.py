@@ -0,0 +1,220 @@
+# Headless JSON scoring service exposing the logic behind the Streamlit
+# "Generate Digital Mindset Prediction" button. Standard library only.
+#
+#   python service.py --port 8000
+#
+#   GET  /health           -> {"status": "ok", "features": 30}
+#   GET  /stats            -> score cache, micro-batching and span timings (JSON)
+#   GET  /metrics          -> span timing histograms in Prometheus text format
+#   POST /predict          body: {"age": 35, "growth_mindset_score": 80, ...}
+#   POST /predict/batch    body: {"respondents": [{...}, {...}]}
+#
+# Inputs use the names in predictor.DEFAULT_INPUTS; omitted inputs take the
+# Predict tab's widget defaults. Concurrent /predict calls are coalesced by a
+# MicroBatcher (see batching.py); tune it with --max-batch-size/--max-wait-ms.
+# Results are memoized per encoded input row; size the cache with --cache-size.
+import argparse
+import asyncio
+import json
+import logging
+import warnings
+
+from batching import MAX_BATCH_SIZE, MAX_WAIT_MS, MicroBatcher
+from predictor import Predictor
+from score_cache import DEFAULT_MAXSIZE
+from tracing import span, tracer
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+logger = logging.getLogger("digital_mindset.service")
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ScoringService:
+    def __init__(self, predictor, batcher=None):
+        self.predictor = predictor
+        self.batcher = batcher
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/stats"): self.stats,
+            ("GET", "/metrics"): self.metrics,
+            ("POST", "/predict"): self.predict,
+            ("POST", "/predict/batch"): self.predict_batch,
+        }
+
+    async def health(self, payload):
+        return {"status": "ok", "features": len(self.predictor.selected_features)}
+
+    async def stats(self, payload):
+        stats = {"score_cache": self.predictor.cache.stats() if self.predictor.cache is not None else None}
+        if self.batcher is not None:
+            stats["micro_batching"] = {
+                "batches": self.batcher.batches,
+                "rows": self.batcher.rows,
+                "mean_batch_size": self.batcher.mean_batch_size,
+            }
+        stats["spans"] = tracer.snapshot()
+        return stats
+
+    # Plain text rather than JSON; see respond()
+    async def metrics(self, payload):
+        return tracer.to_prometheus()
+
+    # Validation, encoding and scoring are CPU-bound, so they run on the
+    # default executor, as the micro-batcher runs its batches on its own
+    # thread; the event loop keeps serving other connections meanwhile
+    async def predict(self, payload):
+        loop = asyncio.get_running_loop()
+        with span("request"):
+            if self.batcher is None:
+                return await loop.run_in_executor(None, self.predictor.predict, payload)
+            input_row = await loop.run_in_executor(None, self.predictor.encode, payload)
+            return await asyncio.wrap_future(self.batcher.submit(input_row))
+
+    async def predict_batch(self, payload):
+        respondents = payload.get("respondents") if isinstance(payload, dict) else None
+        if not isinstance(respondents, list):
+            raise HTTPError(400, "Body must be an object with a 'respondents' list")
+        loop = asyncio.get_running_loop()
+        with span("request_batch"):
+            predictions = await loop.run_in_executor(None, self.predictor.predict_batch, respondents)
+        return {"predictions": predictions}
+
+    async def dispatch(self, method, path, body):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                raise HTTPError(405, f"{method} not allowed on {path}")
+            raise HTTPError(404, f"No route for {path}")
+
+        payload = None
+        if method == "POST":
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError:
+                raise HTTPError(400, "Body is not valid JSON")
+        try:
+            return await handler(payload)
+        except ValueError as exc:
+            raise HTTPError(400, str(exc))
+
+    # One keep-alive HTTP/1.1 connection
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {"error": "Request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                path = target.split("?", 1)[0]
+                try:
+                    status, result = 200, await self.dispatch(method, path, body)
+                except HTTPError as exc:
+                    status, result = exc.status, {"error": exc.message}
+                except Exception:
+                    logger.exception("Unhandled error for %s %s", method, path)
+                    status, result = 500, {"error": "Internal server error"}
+
+                await self.respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    # Handlers return JSON-serializable results, or a str sent as plain text
+    async def respond(self, writer, status, result, keep_alive):
+        if isinstance(result, str):
+            body, content_type = result.encode(), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body, content_type = json.dumps(result).encode(), "application/json"
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(host, port, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS, batching=True,
+                cache_size=DEFAULT_MAXSIZE):
+    predictor = Predictor.load(cache_size)
+    batcher = MicroBatcher(predictor, max_batch_size, max_wait_ms) if batching else None
+    service = ScoringService(predictor, batcher)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    logger.info("Scoring service listening on http://%s:%d (micro-batching %s)",
+                host, port, "on" if batching else "off")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if batcher is not None:
+            batcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Digital Mindset JSON scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE,
+                        help="most /predict requests coalesced into one model call")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS,
+                        help="longest a request waits for others to join its batch")
+    parser.add_argument("--no-batching", action="store_true",
+                        help="score every /predict request on its own")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAXSIZE,
+                        help="score results memoized per input row (0 disables the cache)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch_size, args.max_wait_ms,
+                          batching=not args.no_batching, cache_size=args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import numpy as np
+
+from features import REQUIRED_COLUMNS
+from scoring import SCORE_CATEGORIES, score_batch
+from validation import validate_frame
+
+# Score distribution bins, in points, shared by the team and the population
+BIN_EDGES = np.arange(0, 105, 5)
+
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+# A roster CSV (path or file-like object), keeping only the columns scoring needs
+def read_roster(source):
+    import pandas as pd
+
+    return pd.read_csv(source, usecols=lambda column: column in REQUIRED_COLUMNS)
+
+
+# Custom score of every roster member (rows in the reference dataset
+# schema), in one batch. Members failing validation are left out and
+# recorded in `report`, a validation.ValidationReport.
+def score_roster(raw, encoder, report):
+    inputs, valid = validate_frame(raw, report)
+    if not valid.any():
+        raise ValueError("The roster has no valid members" if len(raw) else "The roster has no members")
+    return score_batch(encoder.encode_batch(inputs), encoder.selected_features)
+
+
+def score_stats(scores):
+    p25, median, p75 = np.quantile(scores, QUANTILES)
+    return {
+        "count": len(scores),
+        "mean": float(scores.mean()),
+        "std": float(scores.std()),
+        "min": float(scores.min()),
+        "p25": float(p25),
+        "median": float(median),
+        "p75": float(p75),
+        "max": float(scores.max()),
+    }
+
+
+# {category: share of scores in it}, with the same inclusive upper bounds
+# as scoring.score_category
+def category_shares(scores):
+    bounds = [upper_bound for upper_bound, _ in SCORE_CATEGORIES[:-1]]
+    counts = np.bincount(np.searchsorted(bounds, scores, side="left"), minlength=len(SCORE_CATEGORIES))
+    return {category: float(count / len(scores)) for (_, category), count in zip(SCORE_CATEGORIES, counts)}
+
+
+# Percentage of scores in each BIN_EDGES bin
+def score_distribution(scores):
+    counts, _ = np.histogram(np.clip(scores, BIN_EDGES[0], BIN_EDGES[-1]), bins=BIN_EDGES)
+    return counts / len(scores) * 100
+
+
+# Team statistics next to the same statistics for the reference population
+# (a percentiles.PopulationIndex). Every figure is a whole-array numpy
+# operation, so the cost grows with team size only through a few sorts.
+def summarize_team(scores, population):
+    scores = np.asarray(scores, dtype=float)
+    ranks = population.percentile_ranks(scores)
+    return {
+        "team": score_stats(scores),
+        "population": score_stats(population.scores),
+        "categories": {
+            "team": category_shares(scores),
+            "population": category_shares(population.scores),
+        },
+        "distribution": {
+            "edges": BIN_EDGES,
+            "team": score_distribution(scores),
+            "population": score_distribution(population.scores),
+        },
+        "median_percentile": float(np.median(ranks)),
+        "above_population_median": float((ranks > 50).mean()),
+    }
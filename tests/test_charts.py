@@ -0,0 +1,49 @@
+import copy
+import pickle
+import unittest
+
+import plotly.graph_objects as go
+
+from charts import build_gauge_chart, create_gauge_chart, frozen_gauge_chart
+
+
+# The cached gauges must behave like the figures they replace: real Plotly
+# figures that match a rebuild and share no state with each other
+class GaugeChartTest(unittest.TestCase):
+    def gauges(self):
+        return [(create_gauge_chart(score), score) for score in (12.5, 55.4, 94.0)] + [
+            (frozen_gauge_chart(65), 65)
+        ]
+
+    def test_matches_rebuilt_figure(self):
+        for fig, score in self.gauges():
+            self.assertEqual(fig.to_dict(), build_gauge_chart(score).to_dict())
+
+    def test_is_a_figure(self):
+        for fig, score in self.gauges():
+            self.assertIsInstance(fig, go.Figure)
+            self.assertEqual(fig.layout.height, 350)
+            self.assertEqual(fig.data[0].value, score)
+
+            fig.update_layout(height=200)
+            self.assertEqual(fig.to_dict()["layout"]["height"], 200)
+
+            self.assertEqual(copy.deepcopy(fig).to_dict(), fig.to_dict())
+            self.assertEqual(pickle.loads(pickle.dumps(fig)).to_dict(), fig.to_dict())
+
+    def test_figures_share_no_state(self):
+        first, second = create_gauge_chart(40.0), create_gauge_chart(40.0)
+        self.assertIsNot(first.to_dict()["layout"], second.to_dict()["layout"])
+
+        first.update_layout(height=100, title="changed")
+        first.data[0].gauge.bar.color = "black"
+        for fig in (second, create_gauge_chart(40.0)):
+            self.assertEqual(fig.to_dict(), build_gauge_chart(40.0).to_dict())
+
+        frozen = frozen_gauge_chart(65)
+        frozen.update_layout(height=100)
+        self.assertEqual(frozen_gauge_chart(65).layout.height, 350)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from respondents import DENSE_FACTOR, RespondentIndex
+
+
+def survey_chunk(ids, rng):
+    rows = len(ids)
+    age = rng.integers(20, 61, rows).astype(float)
+    age[rng.random(rows) < 0.2] = np.nan
+    return pd.DataFrame({
+        "respondent_id": ids,
+        "age": age,
+        "country": rng.choice(np.array(["India", "UK", "USA", None], dtype=object), rows),
+        "gender": rng.choice(["Female", "Male"], rows),
+    })
+
+
+class RespondentIndexTest(unittest.TestCase):
+    # Chunks with repeated, negative, far-apart and stray huge IDs: every
+    # lookup returns the ID's latest row, and the slot table never spans
+    # more than DENSE_FACTOR x rows IDs
+    def test_lookups_match_latest_rows(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            index = RespondentIndex("test", capacity=8)
+            expected = {}
+            for _ in range(rng.integers(1, 6)):
+                ids = rng.choice([
+                    rng.integers(0, 200, 40),
+                    rng.integers(10 ** 6, 10 ** 6 + 300, 40),
+                    np.append(rng.integers(-5, 50, 39), 10 ** 12),
+                ])
+                chunk = survey_chunk(ids, rng)
+                index.update(chunk)
+                for row in chunk.itertuples():
+                    expected[row.respondent_id] = (
+                        None if np.isnan(row.age) else int(row.age),
+                        None if pd.isna(row.country) else row.country,
+                    )
+
+            self.assertEqual(len(index), len(expected))
+            self.assertLessEqual(len(index._slots), DENSE_FACTOR * index.rows)
+            for respondent_id, (age, country) in expected.items():
+                record = index.lookup(respondent_id)
+                self.assertEqual((record["age"], record["country"]), (age, country))
+            self.assertIsNone(index.lookup(10 ** 6 - 1))
+
+    # Only the indexed columns are kept, text answers as category codes, and
+    # a block of high IDs gets a table the size of its span
+    def test_compact_storage(self):
+        rng = np.random.default_rng(1)
+        index = RespondentIndex.from_frame(survey_chunk(np.arange(10 ** 6, 10 ** 6 + 5000), rng), "test")
+        self.assertEqual(len(index._slots), 5000)
+        self.assertNotIn("gender", index._columns)
+        self.assertEqual(index._columns["country"].dtype, np.int32)
+        self.assertEqual(index.lookup(10 ** 6)["respondent_id"], 10 ** 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
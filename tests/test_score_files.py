@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from bulk import MODEL_COLUMN, SCORE_COLUMN
+from score_files import REFERENCE_DATA_PATH, score_file
+
+
+# Inputs without any survey rows still produce a scored file with the full
+# header or schema, and inputs missing required columns fail with a ValueError
+class ScoreFileEdgeCasesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.reference = pd.read_csv(REFERENCE_DATA_PATH, nrows=20)
+
+    def path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def test_header_only_input(self):
+        self.reference.iloc[:0].to_csv(self.path("header.csv"), index=False)
+        expected = list(self.reference.columns) + [SCORE_COLUMN, MODEL_COLUMN]
+        for output in ("scored.csv", "scored.parquet"):
+            stats = score_file(self.path("header.csv"), self.path(output), workers=1)
+            self.assertEqual(stats["rows"], 0)
+            scored = (pd.read_parquet if output.endswith(".parquet") else pd.read_csv)(self.path(output))
+            self.assertEqual(list(scored.columns), expected)
+            self.assertEqual(len(scored), 0)
+
+    def test_missing_columns(self):
+        self.reference[["respondent_id", "age"]].to_csv(self.path("partial.csv"), index=False)
+        with self.assertRaisesRegex(ValueError, "Missing required columns"):
+            score_file(self.path("partial.csv"), self.path("scored.csv"), workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from encoder import FeatureEncoder
+from features import derive_inputs
+from predictor import BASE_DIR, load_selected_features
+from scoring import calculate_digital_mindset_score, scored_features, score_batch
+
+REFERENCE_CSV = BASE_DIR / "synthetic_digital_mindset_data.csv"
+
+# Rows run through the slow per-row DataFrame path
+SAMPLE_EVERY = 10
+
+# The app's original scoring path, copied from the baseline app.py: inputs
+# into a dict pre-filled with 0 for every selected feature, one-hot keys set
+# to 1, then dict -> DataFrame -> reindex for the model, and the score
+# computed from the dict with a default for every feature the model lacks
+BASELINE_NUMERIC_INPUTS = [
+    "age", "years_in_role", "respondent_id", "growth_mindset_score", "limiting_beliefs_score",
+    "training_hours_last_year", "leadership_score", "team_openness_score",
+    "recent_failed_initiatives", "positive_feedback_percent", "Day", "Month", "Year", "Quarter",
+]
+BASELINE_ONE_HOT_INPUTS = ["change_resistance_level", "retention_intent", "Weekday", "Season"]
+
+
+def baseline_user_input(inputs, selected_features):
+    user_input = {feature: 0 for feature in selected_features}
+    for name in BASELINE_NUMERIC_INPUTS:
+        if name in selected_features:
+            user_input[name] = inputs[name]
+    for name in BASELINE_ONE_HOT_INPUTS:
+        key = f"{name}_{inputs[name]}"
+        if key in selected_features:
+            user_input[key] = 1
+    return user_input
+
+
+def baseline_input_array(user_input, selected_features):
+    input_df = pd.DataFrame([user_input])
+    input_df = input_df.reindex(columns=selected_features, fill_value=0)
+    return input_df.values
+
+
+def baseline_score(user_data):
+    score = 40
+
+    behavioral_score = (
+        user_data.get('growth_mindset_score', 50) * 0.3 +
+        (100 - user_data.get('limiting_beliefs_score', 50)) * 0.2 +
+        user_data.get('leadership_score', 50) * 0.25 +
+        user_data.get('positive_feedback_percent', 70) * 0.25
+    ) * 0.4
+
+    org_score = (
+        min(user_data.get('training_hours_last_year', 40) / 100 * 100, 100) * 0.4 +
+        user_data.get('team_openness_score', 60) * 0.4 +
+        max(0, 100 - user_data.get('recent_failed_initiatives', 2) * 10) * 0.2
+    ) * 0.3
+
+    demo_score = (
+        min(user_data.get('years_in_role', 3) / 10 * 100, 100) * 0.6 +
+        min(user_data.get('age', 30) / 60 * 100, 100) * 0.4
+    ) * 0.2
+
+    categorical_bonus = 0
+    if user_data.get('change_resistance_level_Low', 0) == 1:
+        categorical_bonus += 15
+    elif user_data.get('change_resistance_level_Medium', 0) == 1:
+        categorical_bonus += 5
+
+    if user_data.get('retention_intent_Very Likely', 0) == 1:
+        categorical_bonus += 10
+    elif user_data.get('retention_intent_Likely', 0) == 1:
+        categorical_bonus += 5
+
+    categorical_score = categorical_bonus * 0.1
+
+    total_score = score + behavioral_score + org_score + demo_score + categorical_score
+    return max(0, min(100, total_score))
+
+
+# The vectorized encoder and scorer must reproduce the baseline exactly on the
+# reference dataset, including the defaults used for features the model lacks
+class BaselineParityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.selected_features = load_selected_features()
+        cls.inputs = derive_inputs(pd.read_csv(REFERENCE_CSV))
+        cls.rows = pd.DataFrame(cls.inputs).to_dict("records")
+
+    def assert_scores_match(self, selected_features):
+        encoder = FeatureEncoder(selected_features)
+        user_inputs = [baseline_user_input(row, selected_features) for row in self.rows]
+        expected = np.array([baseline_score(user_input) for user_input in user_inputs])
+
+        batch = score_batch(encoder.encode_batch(self.inputs), selected_features)
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-9)
+
+        for user_input, score in zip(user_inputs[::SAMPLE_EVERY], expected[::SAMPLE_EVERY]):
+            self.assertAlmostEqual(calculate_digital_mindset_score(user_input), score, places=9)
+
+    def test_encoder_matches_baseline_frame(self):
+        encoder = FeatureEncoder(self.selected_features)
+        batch = encoder.encode_batch(self.inputs)
+        for i, row in enumerate(self.rows[::SAMPLE_EVERY]):
+            expected = baseline_input_array(baseline_user_input(row, self.selected_features), self.selected_features)
+            np.testing.assert_array_equal(encoder.encode(row), expected)
+            np.testing.assert_array_equal(batch[i * SAMPLE_EVERY], expected[0])
+
+    def test_scores_match_baseline(self):
+        self.assert_scores_match(self.selected_features)
+
+    def test_missing_feature_defaults(self):
+        for feature in scored_features():
+            with self.subTest(missing=feature):
+                self.assert_scores_match([name for name in self.selected_features if name != feature])
+        unscored = [name for name in self.selected_features if name not in scored_features()]
+        self.assert_scores_match(unscored)
+        self.assertAlmostEqual(calculate_digital_mindset_score({}), baseline_score({}), places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import random
+import threading
+import unittest
+import warnings
+from unittest import mock
+
+from batching import MicroBatcher
+from benchmarks.loadgen import random_respondent
+from predictor import Predictor
+from service import ScoringService
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+# Large enough that scoring it takes a few hundred milliseconds, small
+# enough to stay under service.MAX_BODY_BYTES
+BATCH_SIZE = 20_000
+
+
+async def post(port, path, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+# A big /predict/batch must not hold up other connections: a single
+# /predict sent while the batch is being scored has to finish first
+class ConcurrentRequestsTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.predictor = Predictor.load(cache_size=0)
+        rng = random.Random(0)
+        cls.respondents = [random_respondent(rng) for _ in range(BATCH_SIZE)]
+
+    async def check_single_request_during_batch(self, batcher):
+        started, finished = threading.Event(), threading.Event()
+        predict_batch = self.predictor.predict_batch
+
+        def tracked_predict_batch(respondents):
+            started.set()
+            try:
+                return predict_batch(respondents)
+            finally:
+                finished.set()
+
+        service = ScoringService(self.predictor, batcher)
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        batch = None
+        try:
+            with mock.patch.object(self.predictor, "predict_batch", tracked_predict_batch):
+                batch = asyncio.create_task(post(port, "/predict/batch", {"respondents": self.respondents}))
+                while not started.is_set():
+                    await asyncio.sleep(0.005)
+
+                status, result = await asyncio.wait_for(post(port, "/predict", self.respondents[0]), 5)
+                self.assertEqual(status, 200)
+                self.assertIn("score", result)
+                self.assertFalse(finished.is_set(), "the single request waited for the whole batch")
+
+                status, result = await batch
+            self.assertEqual(status, 200)
+            self.assertEqual(len(result["predictions"]), BATCH_SIZE)
+        finally:
+            if batch is not None and not batch.done():
+                batch.cancel()
+            server.close()
+            await server.wait_closed()
+
+    async def test_unbatched_predict_during_large_batch(self):
+        await self.check_single_request_during_batch(None)
+
+    async def test_micro_batched_predict_during_large_batch(self):
+        batcher = MicroBatcher(self.predictor)
+        try:
+            await self.check_single_request_during_batch(batcher)
+        finally:
+            batcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Histogram bucket upper bounds in seconds, the `le` labels of the
+# Prometheus export
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Recent samples kept per span for the rolling quantiles
+WINDOW = 1024
+
+METRIC_NAME = "digital_mindset_span_seconds"
+
+
+# Durations of one span: cumulative bucket counts for Prometheus, plus the
+# last `window` samples for rolling quantiles and a rolling histogram
+class SpanHistogram:
+    def __init__(self, window=WINDOW):
+        self.count = 0
+        self.sum = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.recent.append(seconds)
+
+    def snapshot(self):
+        recent = sorted(self.recent)
+        window_buckets = [0] * (len(BUCKETS) + 1)
+        for seconds in recent:
+            window_buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+        def quantile(q):
+            return recent[min(len(recent) - 1, int(q * len(recent)))] if recent else None
+
+        return {
+            "count": self.count,
+            "sum_seconds": self.sum,
+            "window": len(recent),
+            "p50_seconds": quantile(0.5),
+            "p95_seconds": quantile(0.95),
+            "p99_seconds": quantile(0.99),
+            "max_seconds": recent[-1] if recent else None,
+            "window_buckets": dict(zip([*map(str, BUCKETS), "+Inf"], window_buckets)),
+        }
+
+
+# Spans recorded on one thread between start_trace() and end_trace(): a
+# Streamlit rerun, a fragment run or one micro-batch
+class Trace:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = []
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    # {name: (calls, seconds)} in first-seen order
+    def summary(self):
+        summary = {}
+        for name, seconds in self.spans:
+            calls, total = summary.get(name, (0, 0.0))
+            summary[name] = (calls + 1, total + seconds)
+        return summary
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "started")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# Process-wide span timings. `with tracer.span("encode"):` times a block into
+# that span's histogram and, when the current thread has a trace open, into
+# the trace as well. A span costs two perf_counter calls and one short lock.
+class Tracer:
+    def __init__(self, window=WINDOW, enabled=True):
+        self.window = window
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._local = threading.local()
+
+    def span(self, name):
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def record(self, name, seconds, trace=True):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = SpanHistogram(self.window)
+            histogram.observe(seconds)
+        current = getattr(self._local, "trace", None)
+        if trace and current is not None:
+            current.spans.append((name, seconds))
+
+    def start_trace(self):
+        self._local.trace = Trace()
+        return self._local.trace
+
+    def current_trace(self):
+        return getattr(self._local, "trace", None)
+
+    def end_trace(self):
+        trace = self.current_trace()
+        self._local.trace = None
+        return trace
+
+    # Add spans timed on another thread (a micro-batch) to this thread's
+    # trace; their histograms were updated when they were recorded
+    def adopt(self, spans):
+        current = self.current_trace()
+        if current is not None:
+            current.spans.extend(spans)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    # {span: SpanHistogram.snapshot()}
+    def snapshot(self):
+        with self._lock:
+            histograms = {
+                name: (histogram.count, histogram.sum, list(histogram.buckets), list(histogram.recent))
+                for name, histogram in self._histograms.items()
+            }
+        snapshot = {}
+        for name, (count, total, buckets, recent) in sorted(histograms.items()):
+            copy = SpanHistogram(self.window)
+            copy.count, copy.sum, copy.buckets = count, total, buckets
+            copy.recent.extend(recent)
+            snapshot[name] = copy.snapshot()
+        return snapshot
+
+    def to_json(self):
+        return json.dumps({"buckets": list(BUCKETS), "spans": self.snapshot()}, indent=2)
+
+    # Prometheus text exposition format (version 0.0.4): one histogram with a
+    # `span` label, plus the rolling-window quantiles as a gauge
+    def to_prometheus(self):
+        with self._lock:
+            histograms = {
+                name: (histogram.count, histogram.sum, list(histogram.buckets))
+                for name, histogram in self._histograms.items()
+            }
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in traced spans.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for name, (count, total, buckets) in sorted(histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip([*map(repr, BUCKETS), "+Inf"], buckets):
+                cumulative += bucket_count
+                lines.append(f'{METRIC_NAME}_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_sum{{span="{name}"}} {total!r}')
+            lines.append(f'{METRIC_NAME}_count{{span="{name}"}} {count}')
+
+        lines += [
+            f"# HELP {METRIC_NAME}_window Span time quantiles over the last {self.window} samples.",
+            f"# TYPE {METRIC_NAME}_window gauge",
+        ]
+        for name, entry in self.snapshot().items():
+            for quantile, label in (("p50", "0.5"), ("p95", "0.95"), ("p99", "0.99")):
+                value = entry[f"{quantile}_seconds"]
+                if value is not None:
+                    lines.append(f'{METRIC_NAME}_window{{span="{name}",quantile="{label}"}} {value!r}')
+        return "\n".join(lines) + "\n"
+
+    # Write <prefix>.prom and <prefix>.json into directory, atomically
+    def write_files(self, directory, prefix="digital_mindset"):
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for extension, text in (("prom", self.to_prometheus()), ("json", self.to_json())):
+            path = os.path.join(directory, f"{prefix}.{extension}")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            paths.append(path)
+        return paths
+
+
+# Background thread rewriting the metrics files every `interval` seconds, for
+# a Prometheus textfile collector or anything else that reads them
+class MetricsFileExporter:
+    def __init__(self, tracer, directory, interval=15.0):
+        self.tracer = tracer
+        self.directory = directory
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.tracer.write_files(self.directory)
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join()
+        self.tracer.write_files(self.directory)
+
+
+# Shared by the app, the scoring service and the predictor; TRACING=0 turns
+# every span into a no-op
+tracer = Tracer(enabled=os.environ.get("TRACING", "1") != "0")
+
+
+def span(name):
+    return tracer.span(name)
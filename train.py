@@ -0,0 +1,214 @@
+# Reproducible, out-of-core retraining of the model from survey data.
+#
+#   python train.py                                   # reference CSV -> model.joblib
+#   python train.py big.csv --output model.joblib --epochs 5
+#   python train.py respondents.parquet --chunksize 100000
+#
+# The input is read in chunks (CSV via pandas, Parquet by record batch) and
+# each chunk is turned into the selected_features matrix with the same
+# encoder the app uses. Rows are split into training and holdout sets by a
+# hash of respondent_id, so the split doesn't depend on file order or chunk
+# size. One pass fits a StandardScaler with partial_fit, then `epochs` passes
+# fit an SGDRegressor with partial_fit, and a final pass scores the holdout.
+# Only one chunk is in memory at a time. The result is written as a model
+# artifact (see artifact.py) with the training ranges and holdout metrics.
+import argparse
+import os
+import resource
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from encoder import FeatureEncoder
+from features import build_feature_matrix, missing_columns
+from artifact import ModelArtifact
+from predictor import ARTIFACT_PATH, BASE_DIR, MODEL_PATH, load_selected_features
+
+warnings.filterwarnings("ignore", category=UserWarning, module="sklearn")
+
+DEFAULT_DATA_PATH = BASE_DIR / "synthetic_digital_mindset_data.csv"
+
+TARGET_COLUMN = "digital_adoption_score"
+
+CHUNK_SIZE = 50_000
+
+
+def iter_chunks(path, chunksize=CHUNK_SIZE):
+    if str(path).lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+# True for rows in the holdout set: a multiplicative hash of respondent_id
+# mapped onto [0, 1), compared with the holdout fraction
+def holdout_mask(respondent_ids, holdout, seed=0):
+    ids = np.asarray(respondent_ids, dtype=np.uint64)
+    hashed = (ids + np.uint64(seed)) * np.uint64(0x9E3779B97F4A7C15)
+    return (hashed >> np.uint64(40)).astype(np.float64) / 2 ** 24 < holdout
+
+
+# Feature matrix, target and holdout mask for one chunk of survey rows
+def prepare_chunk(chunk, encoder, holdout, seed):
+    missing = missing_columns(chunk.columns)
+    if TARGET_COLUMN not in chunk.columns:
+        missing.append(TARGET_COLUMN)
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    chunk = chunk.dropna(subset=[TARGET_COLUMN])
+    return (
+        build_feature_matrix(chunk, encoder),
+        chunk[TARGET_COLUMN].to_numpy(dtype=float),
+        holdout_mask(chunk["respondent_id"], holdout, seed),
+    )
+
+
+# Streaming regression metrics: sums are enough for MSE, MAE and R^2
+class RunningMetrics:
+    def __init__(self):
+        self.n = 0
+        self.sum_y = 0.0
+        self.sum_y2 = 0.0
+        self.sum_abs_error = 0.0
+        self.sum_squared_error = 0.0
+
+    def update(self, y_true, y_pred):
+        error = y_true - y_pred
+        self.n += len(y_true)
+        self.sum_y += y_true.sum()
+        self.sum_y2 += (y_true ** 2).sum()
+        self.sum_abs_error += np.abs(error).sum()
+        self.sum_squared_error += (error ** 2).sum()
+
+    def report(self):
+        if not self.n:
+            return {"rows": 0, "mae": None, "rmse": None, "r2": None}
+        total_variance = self.sum_y2 - self.sum_y ** 2 / self.n
+        return {
+            "rows": self.n,
+            "mae": self.sum_abs_error / self.n,
+            "rmse": (self.sum_squared_error / self.n) ** 0.5,
+            "r2": 1 - self.sum_squared_error / total_variance if total_variance else None,
+        }
+
+
+def train(data_path=DEFAULT_DATA_PATH, chunksize=CHUNK_SIZE, epochs=5, holdout=0.2,
+          alpha=1e-4, seed=0, baseline_model=None):
+    from sklearn.linear_model import SGDRegressor
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    encoder = FeatureEncoder(load_selected_features())
+    scaler = StandardScaler()
+    regressor = SGDRegressor(alpha=alpha, learning_rate="invscaling", eta0=0.01, random_state=seed)
+    rng = np.random.default_rng(seed)
+    rows_read = 0
+
+    # One pass over the file, yielding (X, y, is_holdout) per chunk
+    def read_pass():
+        nonlocal rows_read
+        for chunk in iter_chunks(data_path, chunksize):
+            rows_read += len(chunk)
+            yield prepare_chunk(chunk, encoder, holdout, seed)
+
+    started = time.perf_counter()
+    training_rows = 0
+    low = np.full(encoder.n_features, np.inf)
+    high = np.full(encoder.n_features, -np.inf)
+    for X, _, is_holdout in read_pass():
+        if (~is_holdout).any():
+            scaler.partial_fit(X[~is_holdout])
+            training_rows += int((~is_holdout).sum())
+            low = np.minimum(low, X[~is_holdout].min(axis=0))
+            high = np.maximum(high, X[~is_holdout].max(axis=0))
+    if not training_rows:
+        raise ValueError(f"No training rows in {data_path}")
+
+    for _ in range(epochs):
+        for X, y, is_holdout in read_pass():
+            X, y = X[~is_holdout], y[~is_holdout]
+            if len(X):
+                order = rng.permutation(len(X))  # shuffle within the chunk
+                regressor.partial_fit(scaler.transform(X[order]), y[order])
+    training_seconds = time.perf_counter() - started
+
+    model = make_pipeline(scaler, regressor)
+    value_ranges = ModelArtifact.ranges_from_matrix(np.vstack([low, high]), encoder.selected_features)
+    metrics, baseline_metrics = RunningMetrics(), RunningMetrics()
+    for X, y, is_holdout in read_pass():
+        if is_holdout.any():
+            metrics.update(y[is_holdout], model.predict(X[is_holdout]))
+            if baseline_model is not None:
+                baseline_metrics.update(y[is_holdout], baseline_model.predict(X[is_holdout]))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "data": str(data_path),
+        "training_rows": training_rows,
+        "holdout_rows": metrics.n,
+        "epochs": epochs,
+        "holdout": metrics.report(),
+        "baseline_holdout": baseline_metrics.report() if baseline_model is not None else None,
+        "rows_read": rows_read,
+        "seconds": elapsed,
+        "rows_per_second": rows_read / elapsed if elapsed else 0.0,
+        "training_rows_per_second": training_rows * epochs / training_seconds if training_seconds else 0.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    artifact = ModelArtifact(model, encoder.selected_features, value_ranges, {
+        "training_data": os.path.basename(str(data_path)),
+        "training_rows": training_rows,
+        "epochs": epochs,
+        "alpha": alpha,
+        "seed": seed,
+        "holdout": report["holdout"],
+    })
+    return artifact, report
+
+
+def _format_metrics(metrics):
+    if not metrics["rows"]:
+        return "no rows"
+    r2 = f"{metrics['r2']:.4f}" if metrics["r2"] is not None else "n/a"
+    return f"MAE {metrics['mae']:.3f}  RMSE {metrics['rmse']:.3f}  R^2 {r2}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retrain the model out of core from survey data")
+    parser.add_argument("data", nargs="?", default=str(DEFAULT_DATA_PATH),
+                        help="survey file (.csv or .parquet) with a digital_adoption_score column")
+    parser.add_argument("--output", default=str(ARTIFACT_PATH), help="where to write the model artifact")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE, help="rows read at a time")
+    parser.add_argument("--epochs", type=int, default=5, help="passes of partial_fit over the training rows")
+    parser.add_argument("--holdout", type=float, default=0.2, help="fraction of respondents held out")
+    parser.add_argument("--alpha", type=float, default=1e-4, help="L2 regularization strength")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from predictor import load_model_and_features
+    baseline_model = None
+    if os.path.exists(ARTIFACT_PATH) or os.path.exists(MODEL_PATH):
+        baseline_model = load_model_and_features()[0]
+
+    artifact, report = train(args.data, args.chunksize, args.epochs, args.holdout,
+                             args.alpha, args.seed, baseline_model)
+    artifact.save(args.output)
+
+    print(f"Trained on {report['training_rows']:,} rows ({report['epochs']} epochs), "
+          f"evaluated on {report['holdout_rows']:,} holdout rows")
+    print(f"Holdout:             {_format_metrics(report['holdout'])}")
+    if report["baseline_holdout"] is not None:
+        print(f"Current model:       {_format_metrics(report['baseline_holdout'])}")
+    print(f"Read {report['rows_read']:,} rows in {report['seconds']:.2f}s "
+          f"({report['rows_per_second']:,.0f} rows/s; "
+          f"{report['training_rows_per_second']:,.0f} training rows/s), "
+          f"peak RSS {report['peak_rss_mb']:.0f} MB")
+    print(f"Model written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import numpy as np
+
+from features import DATE_COLUMN, derive_inputs, missing_columns
+from fields import NUMERIC_RANGES, OPTIONS, UNMODELED_OPTIONS, format_range
+
+# Inputs derived from survey_date; rows with an unreadable date are reported
+# once, against survey_date, rather than again for every part
+DATE_PARTS = ["Day", "Month", "Year", "Quarter", "Weekday", "Season"]
+
+# Row numbers and values kept as examples per problem
+SAMPLES = 5
+
+
+# Problems found in survey rows, per (column, problem): how many rows have
+# it, and the first few row numbers (1-based, counting data rows in file
+# order) and offending values. Errors reject a row; warnings only flag
+# answers the model has no feature for. Reports on consecutive chunks of a
+# file are built up in place, or combined with merge().
+class ValidationReport:
+    def __init__(self):
+        self.rows = 0
+        self.rejected = 0
+        self.errors = {}
+        self.warnings = {}
+
+    def __bool__(self):
+        return bool(self.errors or self.warnings)
+
+    # Count the rows in `mask` against (column, problem), keeping the first
+    # few row numbers and values (a Series aligned with the mask) as examples
+    def flag(self, issues, column, problem, mask, values, row_numbers):
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return
+        entry = issues.setdefault((column, problem), [0, [], []])
+        entry[0] += count
+        wanted = SAMPLES - len(entry[1])
+        if wanted > 0:
+            hits = np.flatnonzero(mask)[:wanted]
+            entry[1].extend(row_numbers[hits].tolist())
+            entry[2].extend(values.iloc[hits].tolist())
+
+    # Fold in the report on a later part of the same file, which starts
+    # `row_offset` rows in
+    def merge(self, other, row_offset=0):
+        self.rows += other.rows
+        self.rejected += other.rejected
+        for mine, theirs in ((self.errors, other.errors), (self.warnings, other.warnings)):
+            for key, (count, rows, values) in theirs.items():
+                entry = mine.setdefault(key, [0, [], []])
+                entry[0] += count
+                wanted = SAMPLES - len(entry[1])
+                entry[1].extend(row + row_offset for row in rows[:wanted])
+                entry[2].extend(values[:wanted])
+
+    @staticmethod
+    def _lines(issues):
+        lines = []
+        for (column, problem), (count, rows, values) in issues.items():
+            more = ", …" if count > len(rows) else ""
+            examples = ", ".join(dict.fromkeys(str(value) for value in values))
+            lines.append(
+                f"{column}: {problem} in {count:,} row{'s' if count != 1 else ''} "
+                f"({', '.join(map(str, rows))}{more}; e.g. {examples})"
+            )
+        return lines
+
+    def error_lines(self):
+        return self._lines(self.errors)
+
+    def warning_lines(self):
+        return self._lines(self.warnings)
+
+    def summary(self):
+        return f"{self.rejected:,} of {self.rows:,} rows rejected"
+
+
+def _check_numeric(report, name, series, row_numbers, skip):
+    import pandas as pd
+
+    values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+    missing = series.isna().to_numpy() & ~skip
+    unreadable = np.isnan(values) & ~missing & ~skip
+    low, high = NUMERIC_RANGES[name]
+    out_of_range = np.zeros(len(values), dtype=bool)
+    if low is not None:
+        out_of_range |= values < low
+    if high is not None:
+        out_of_range |= values > high
+
+    report.flag(report.errors, name, "missing", missing, series, row_numbers)
+    report.flag(report.errors, name, "not a number", unreadable, series, row_numbers)
+    report.flag(report.errors, name, f"not {format_range(low, high)}", out_of_range, series, row_numbers)
+    return values, missing | unreadable | out_of_range
+
+
+def _check_option(report, name, series, row_numbers, skip):
+    missing = series.isna().to_numpy() & ~skip
+    modeled = series.isin(OPTIONS[name]).to_numpy()
+    unmodeled = series.isin(UNMODELED_OPTIONS.get(name, [])).to_numpy()
+    unknown = ~(modeled | unmodeled | missing | skip)
+
+    report.flag(report.errors, name, "missing", missing, series, row_numbers)
+    report.flag(report.errors, name, f"not one of {', '.join(OPTIONS[name])}", unknown, series, row_numbers)
+    report.flag(report.warnings, name, "answer the model has no feature for", unmodeled, series, row_numbers)
+    return missing | unknown
+
+
+# Check survey rows (reference dataset schema) against fields.py with one
+# array operation per column and rule. Returns the encoder inputs of the rows
+# that pass (features.derive_inputs, numerics as float arrays) and the
+# boolean mask of those rows; problems are added to `report`. `first_row` is
+# the number of the frame's first row within its file.
+def validate_frame(raw, report, first_row=1):
+    import pandas as pd
+
+    missing = missing_columns(raw.columns)
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    row_numbers = np.arange(first_row, first_row + len(raw))
+    dates = pd.to_datetime(raw[DATE_COLUMN], errors="coerce")
+    bad_dates = dates.isna().to_numpy()
+    report.flag(report.errors, DATE_COLUMN, "not a date", bad_dates, raw[DATE_COLUMN], row_numbers)
+
+    inputs = derive_inputs(raw.assign(**{DATE_COLUMN: dates}))
+    rejected = bad_dates.copy()
+    no_skip = np.zeros(len(raw), dtype=bool)
+    for name, series in inputs.items():
+        skip = bad_dates if name in DATE_PARTS else no_skip
+        if name in NUMERIC_RANGES:
+            inputs[name], invalid = _check_numeric(report, name, series, row_numbers, skip)
+        elif name in OPTIONS:
+            invalid = _check_option(report, name, series, row_numbers, skip)
+        else:
+            continue
+        rejected |= invalid
+
+    valid = ~rejected
+    report.rows += len(raw)
+    report.rejected += int(np.count_nonzero(rejected))
+    if not valid.all():
+        inputs = {name: np.asarray(values)[valid] for name, values in inputs.items()}
+    return inputs, valid